@@ -34,25 +34,29 @@ class AutomationTrace(ActionTrace):
         """Container for automation trace."""
         super().__init__(item_id, config, blueprint_inputs, context)
         self._trigger_description: str | None = None
-        _LOGGER.info(f"CustomLog || Automation || AutomationTrace class || __init__ method") 
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Automation || AutomationTrace class || __init__ method") 
 
 
     def set_trigger_description(self, trigger: str) -> None:
         """Set trigger description."""
         self._trigger_description = trigger
 
-        _LOGGER.info(f"CustomLog || Automation || AutomationTrace class || set_trigger_description method || trigger description: {self._trigger_description}")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Automation || AutomationTrace class || set_trigger_description method || trigger description: {self._trigger_description}")        
 
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this AutomationTrace."""
         if self._short_dict:
-            _LOGGER.info(f"CustomLog || Automation || AutomationTrace class || as_short_dict method || {self._short_dict}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || Automation || AutomationTrace class || as_short_dict method || {self._short_dict}")
             return self._short_dict
 
         result = super().as_short_dict()
         result["trigger"] = self._trigger_description
 
-        _LOGGER.info(f"CustomLog || Automation || AutomationTrace class || as_short_dict method || trigger description: {result['trigger']}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Automation || AutomationTrace class || as_short_dict method || trigger description: {result['trigger']}")
 
         return result
 
@@ -66,7 +70,8 @@ def trace_automation(
     async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
 
     #write to homeassistant's logfile
-    _LOGGER.info(f"CustomLog || Automation || AutomationTrace class || trace_automation method || trace info - automation_id: {automation_id} ; config: {config} ; blueprint_inputs: {blueprint_inputs} ; context: {context}") 
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(f"CustomLog || Automation || AutomationTrace class || trace_automation method || trace info - automation_id: {automation_id} ; config: {config} ; blueprint_inputs: {blueprint_inputs} ; context: {context}") 
 
     try:
         yield trace
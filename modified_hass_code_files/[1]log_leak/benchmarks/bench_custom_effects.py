@@ -0,0 +1,58 @@
+"""Benchmark parsing the custom effects at startup.
+
+async_setup_entry parses the custom effects once per config entry. This
+times 150 entries sharing 40 custom effects, with the parsed effects
+cached by content hash and with the cache cleared before every entry.
+
+Run with Home Assistant and the modified yeelight component importable, e.g.:
+    python benchmarks/bench_custom_effects.py
+"""
+import logging
+import timeit
+
+from homeassistant.components.yeelight import light
+
+ENTRIES = 150
+EFFECTS = 40
+
+
+def _effects_config():
+    return [
+        {
+            "name": f"effect {index}",
+            "flow_params": {
+                "count": 0,
+                "action": "recover",
+                "transitions": [
+                    {"RGBTransition": [255, index, 0, 500, 80]},
+                    {"SleepTransition": [300]},
+                    {"HSVTransition": [index * 9, 100, 500, 60]},
+                    {"TemperatureTransition": [2700 + index * 50, 1000, 40]},
+                ],
+            },
+        }
+        for index in range(EFFECTS)
+    ]
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    config = _effects_config()
+
+    def uncached():
+        for _ in range(ENTRIES):
+            light._CUSTOM_EFFECTS_CACHE.clear()
+            light._parse_custom_effects(config)
+
+    def cached():
+        light._CUSTOM_EFFECTS_CACHE.clear()
+        for _ in range(ENTRIES):
+            light._parse_custom_effects(config)
+
+    for name, func in (("uncached", uncached), ("cached", cached)):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:9} {best * 1e3:7.2f} ms for {ENTRIES} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark bulk conversion of emeter daily statistics.
+
+Compares the per-row EmeterStatus conversion previously used by
+SmartDevice._emeter_convert_emeter_data with convert_emeter_stats.
+
+Run with the modified kasa package importable, e.g.:
+    python benchmarks/bench_emeter_convert.py
+"""
+import logging
+import random
+import timeit
+
+from kasa.emeterstatus import EmeterStatus, convert_emeter_stats
+
+ROWS = 10_000
+REPEAT = 20
+
+
+def _per_row(data, kwh=True):
+    response = [EmeterStatus(**x) for x in data]
+    energy_key = "energy" if kwh else "energy_wh"
+    entry_key = "day" if "day" in response[0] else "month"
+    return {entry[entry_key]: entry[energy_key] for entry in response}
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    data = [
+        {
+            "year": 2016 + i // 365,
+            "month": 1 + (i // 31) % 12,
+            "day": 1 + i % 31,
+            "energy_wh": random.randint(0, 5000),
+        }
+        for i in range(ROWS)
+    ]
+    assert _per_row(data) == convert_emeter_stats(data).as_dict()
+
+    for name, func in (
+        ("per-row EmeterStatus", lambda: _per_row(data)),
+        ("convert_emeter_stats", lambda: convert_emeter_stats(data)),
+        ("convert_emeter_stats + dict", lambda: convert_emeter_stats(data).as_dict()),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print(f"{name:30} {best * 1000:8.2f} ms / {ROWS} rows")
+
+
+if __name__ == "__main__":
+    main()
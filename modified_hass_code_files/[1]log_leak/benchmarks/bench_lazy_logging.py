@@ -0,0 +1,62 @@
+"""Benchmark property reads with the CustomLog logging disabled.
+
+Compares the EmeterStatus properties, whose log calls are gated by
+`isEnabledFor(logging.INFO)`, with the same properties logging
+unconditionally. `isEnabledFor` answers from the per-logger level cache of
+the logging module, which `setLevel` and `logging.disable` clear.
+
+Run with the modified kasa package importable, e.g.:
+    python benchmarks/bench_lazy_logging.py
+"""
+import logging
+import timeit
+
+from kasa import emeterstatus
+from kasa.emeterstatus import EmeterStatus
+
+SAMPLES = 100_000
+
+_LOGGER = logging.getLogger(emeterstatus.__name__)
+
+
+class UngatedEmeterStatus(EmeterStatus):
+    """EmeterStatus with the log calls as they were before gating."""
+
+    @property
+    def voltage(self):
+        _LOGGER.info("CustomLog || voltage method || Voltage: %sV", self["voltage"])
+        return self["voltage"]
+
+    @property
+    def power(self):
+        emeterPower = round(self["power"], 2)
+        _LOGGER.info(f"CustomLog || power method || Power: {emeterPower}W")
+        return self["power"]
+
+
+def main():
+    _LOGGER.setLevel(logging.WARNING)
+
+    data = {"power": 50.123, "voltage": 230.1, "current": 0.23, "total": 12.0}
+    gated = EmeterStatus(data)
+    ungated = UngatedEmeterStatus(data)
+
+    def read(status):
+        def func():
+            status.voltage, status.power
+
+        return func
+
+    for name, status in (("ungated", ungated), ("gated", gated)):
+        best = min(timeit.repeat(read(status), number=SAMPLES, repeat=5))
+        print(f"{name:8} {best / SAMPLES * 1e9:8.1f} ns / 2 property reads")
+
+    # the cached level checks follow level changes
+    _LOGGER.setLevel(logging.INFO)
+    assert _LOGGER.isEnabledFor(logging.INFO)
+    _LOGGER.setLevel(logging.WARNING)
+    assert not _LOGGER.isEnabledFor(logging.INFO)
+
+
+if __name__ == "__main__":
+    main()
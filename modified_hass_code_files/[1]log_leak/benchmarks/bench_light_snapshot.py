@@ -0,0 +1,82 @@
+"""Benchmark state writes of Yeelight lights receiving push updates.
+
+Every update runs async_state_changed on 200 color bulbs, with the state
+write replaced by reading what Entity.async_write_ha_state reads (state,
+state_attributes and extra_state_attributes), once with the per-update
+snapshot and once with the getters computing from the bulb properties.
+
+Run with Home Assistant and the modified yeelight component importable, e.g.:
+    python benchmarks/bench_light_snapshot.py
+"""
+import logging
+import timeit
+from types import SimpleNamespace
+
+from homeassistant.components.yeelight.light import (
+    YeelightColorLightWithoutNightlightSwitch,
+)
+
+BULBS = 200
+UPDATES = 50
+
+
+class UnsnapshottedLight(YeelightColorLightWithoutNightlightSwitch):
+    """Light computing every getter from the bulb properties."""
+
+    def _async_update_snapshot(self):
+        self._snapshot = None
+
+
+def _make_light(cls, index):
+    bulb = SimpleNamespace(
+        last_properties={
+            "power": "on",
+            "bright": "80",
+            "ct": "4000",
+            "rgb": str(index * 1000),
+            "hue": "120",
+            "sat": "50",
+            "color_mode": "1",
+        },
+        music_mode=False,
+        model="color",
+        get_model_specs=lambda: {"color_temp": {"min": 1700, "max": 6500}},
+    )
+    device = SimpleNamespace(
+        bulb=bulb,
+        available=True,
+        name=f"bulb {index}",
+        host=f"192.168.1.{index}",
+        config={},
+        is_color_flow_enabled=False,
+        is_nightlight_supported=False,
+        is_nightlight_enabled=False,
+    )
+    entry = SimpleNamespace(unique_id=f"bulb{index}", entry_id=f"bulb{index}")
+    light = cls(device, entry)
+
+    def write():
+        light.state, light.state_attributes, light.extra_state_attributes
+
+    light.async_write_ha_state = write
+    return light
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    for cls in (UnsnapshottedLight, YeelightColorLightWithoutNightlightSwitch):
+        lights = [_make_light(cls, index) for index in range(BULBS)]
+
+        def update():
+            for light in lights:
+                light.async_state_changed()
+
+        best = min(timeit.repeat(update, number=UPDATES, repeat=5))
+        print(
+            f"{cls.__name__:42} {best / UPDATES * 1e3:6.2f} ms / update of "
+            f"{BULBS} bulbs"
+        )
+
+
+if __name__ == "__main__":
+    main()
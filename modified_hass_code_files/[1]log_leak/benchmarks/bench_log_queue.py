@@ -0,0 +1,52 @@
+"""Benchmark the cost of a log call on the emitting thread.
+
+Compares a plain logging.FileHandler with BatchingFileHandler and reports
+the creation to disk latency of the batched records.
+
+Run with Home Assistant and the modified helpers importable, e.g.:
+    python benchmarks/bench_log_queue.py
+"""
+import logging
+import os
+import tempfile
+import time
+
+from homeassistant.helpers.log_queue import BatchingFileHandler
+
+RECORDS = 50_000
+FORMAT = "%(asctime)s %(levelname)s (%(threadName)s) [%(name)s] %(message)s"
+
+
+def run(logger, handler):
+    handler.setFormatter(logging.Formatter(FORMAT))
+    logger.handlers = [handler]
+    start = time.perf_counter()
+    for i in range(RECORDS):
+        logger.info("CustomLog || bench || record %s", i)
+    elapsed = time.perf_counter() - start
+    handler.close()
+    return elapsed
+
+
+def main():
+    logger = logging.getLogger("bench_log_queue")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "home-assistant.log")
+        elapsed = run(logger, logging.FileHandler(path))
+        print(f"FileHandler          {elapsed / RECORDS * 1e6:6.2f} us / call")
+
+        batching = BatchingFileHandler(path)
+        elapsed = run(logger, batching)
+        print(f"BatchingFileHandler  {elapsed / RECORDS * 1e6:6.2f} us / call")
+        print(
+            f"latency mean {batching.mean_latency * 1e3:.1f} ms, "
+            f"max {batching.max_latency * 1e3:.1f} ms, "
+            f"written {batching.written}, dropped {batching.dropped}"
+        )
+
+
+if __name__ == "__main__":
+    main()
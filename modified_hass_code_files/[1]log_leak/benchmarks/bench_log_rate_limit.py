@@ -0,0 +1,51 @@
+"""Benchmark the per-record decision of the log rate limiter.
+
+Run with Home Assistant and the modified helpers importable, e.g.:
+    python benchmarks/bench_log_rate_limit.py
+"""
+import logging
+import timeit
+
+from homeassistant.helpers.log_rate_limit import RateLimit, RateLimitFilter
+
+RECORDS = 200_000
+
+
+def main():
+    logger = logging.getLogger("bench_log_rate_limit")
+    logger.propagate = False
+    logger.addHandler(logging.NullHandler())
+    rate_filter = RateLimitFilter(
+        logger,
+        RateLimit(5, 1.0),
+        templates={"CustomLog || unlimited": None},
+    )
+    records = [
+        logger.makeRecord(
+            logger.name, logging.INFO, __file__, lineno, "CustomLog || site", (), None
+        )
+        for lineno in range(100)
+    ]
+    unlimited = logger.makeRecord(
+        logger.name, logging.INFO, __file__, 1000, "CustomLog || unlimited", (), None
+    )
+
+    def limited():
+        for i in range(RECORDS):
+            record = records[i % 100]
+            # 10 records per site and second, half of them get suppressed
+            record.created = i / 1000
+            rate_filter.filter(record)
+
+    def passthrough():
+        for _ in range(RECORDS):
+            rate_filter.filter(unlimited)
+
+    for name, func in (("limited site", limited), ("unlimited site", passthrough)):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:15} {best / RECORDS * 1e9:6.1f} ns / decision")
+    print(f"suppressed {rate_filter.suppressed} records")
+
+
+if __name__ == "__main__":
+    main()
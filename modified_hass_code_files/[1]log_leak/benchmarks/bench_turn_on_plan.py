@@ -0,0 +1,124 @@
+"""Benchmark the latency of turning on a Yeelight with color and brightness.
+
+A local emulator answers the Yeelight JSON protocol after a simulated
+processing delay. The command sequence used before (set_power, set_rgb,
+set_bright) is compared with the single set_scene "cf" command built from
+the flow that YeelightGenericLight._plan_turn_on_flow returns for the same
+request.
+
+Run with Home Assistant and the modified yeelight component importable, e.g.:
+    python benchmarks/bench_turn_on_plan.py
+"""
+import asyncio
+import json
+import logging
+import statistics
+import time
+from types import SimpleNamespace
+
+from homeassistant.components.yeelight.const import CONF_MODE_MUSIC, CONF_TRANSITION
+from homeassistant.components.yeelight.light import (
+    YeelightColorLightWithoutNightlightSwitch,
+)
+
+# time the emulated bulb takes to process a command
+PROCESSING_DELAY = 0.005
+RUNS = 50
+
+BRIGHTNESS = 204
+RGB = (255, 128, 0)
+DURATION = 350
+
+SEQUENCE = [
+    ("set_power", ["on", "smooth", DURATION, 0]),
+    ("set_rgb", [0xFF8000, "smooth", DURATION]),
+    ("set_bright", [80, "smooth", DURATION]),
+]
+
+
+def _make_light(music_mode=False):
+    """Return a color light of a bulb that is off."""
+    bulb = SimpleNamespace(
+        last_properties={"power": "off", "bright": "10", "rgb": "255"},
+        music_mode=music_mode,
+        model="color",
+        get_model_specs=lambda: {"color_temp": {"min": 1700, "max": 6500}},
+    )
+    device = SimpleNamespace(
+        bulb=bulb,
+        available=True,
+        name="bulb",
+        host="127.0.0.1",
+        config={CONF_MODE_MUSIC: False, CONF_TRANSITION: DURATION},
+        is_color_flow_enabled=False,
+        is_nightlight_supported=False,
+        is_nightlight_enabled=False,
+    )
+    entry = SimpleNamespace(unique_id="bulb", entry_id="bulb")
+    return YeelightColorLightWithoutNightlightSwitch(device, entry)
+
+
+def _plan_single():
+    """Return the set_scene command the planner folds the request into."""
+    flow = _make_light()._plan_turn_on_flow(BRIGHTNESS, None, None, RGB, DURATION)
+    assert flow is not None
+    # music mode keeps the single commands
+    assert (
+        _make_light(music_mode=True)._plan_turn_on_flow(
+            BRIGHTNESS, None, None, RGB, DURATION
+        )
+        is None
+    )
+    return [("set_scene", ["cf", *flow.as_start_flow_params])]
+
+
+async def _handle(reader, writer):
+    while line := await reader.readline():
+        request = json.loads(line)
+        await asyncio.sleep(PROCESSING_DELAY)
+        writer.write(
+            json.dumps({"id": request["id"], "result": ["ok"]}).encode() + b"\r\n"
+        )
+        await writer.drain()
+    writer.close()
+
+
+async def _send(reader, writer, commands):
+    for request_id, (method, params) in enumerate(commands):
+        request = {"id": request_id, "method": method, "params": params}
+        writer.write(json.dumps(request).encode() + b"\r\n")
+        await writer.drain()
+        await reader.readline()
+
+
+async def main():
+    logging.disable(logging.CRITICAL)
+    single = _plan_single()
+    print(f"planned: {single}")
+
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    for name, commands in (("sequence", SEQUENCE), ("single scene", single)):
+        latencies = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            await _send(reader, writer, commands)
+            latencies.append(time.perf_counter() - start)
+        print(
+            f"{name:13} {len(commands)} command(s): "
+            f"median {statistics.median(latencies) * 1e3:5.1f} ms, "
+            f"max {max(latencies) * 1e3:5.1f} ms"
+        )
+
+    writer.close()
+    await writer.wait_closed()
+    # let the handler see the end of the stream
+    await asyncio.sleep(0.01)
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
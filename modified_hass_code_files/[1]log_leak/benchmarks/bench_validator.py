@@ -0,0 +1,59 @@
+"""Benchmark the per-sample overhead of the plausibility validators.
+
+Run with the modified kasa package and Home Assistant importable, e.g.:
+    python benchmarks/bench_validator.py
+"""
+import logging
+import timeit
+
+from kasa.emeterstatus import NormalizedEmeterStatus
+from kasa.emetervalidator import EmeterValidator
+
+from homeassistant.components.yeelight.validator import LightValidator
+
+SAMPLES = 100_000
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    statuses = [
+        NormalizedEmeterStatus(
+            power_mw=50_000 + i % 1000,
+            voltage_mv=230_000,
+            current_ma=230,
+            total_wh=i,
+        )
+        for i in range(1000)
+    ]
+    emeter = EmeterValidator()
+    light = LightValidator()
+
+    def read_only():
+        for status in statuses:
+            status.power, status.voltage, status.current, status.total
+
+    def validate():
+        # totals restart with every pass over the samples
+        emeter.reset("plug1")
+        for status in statuses:
+            emeter.check("plug1", status)
+
+    def validate_rgb():
+        for raw in range(1000):
+            light.check_rgb(raw, (0, (raw >> 8) & 0xFF, raw & 0xFF))
+
+    number = SAMPLES // len(statuses)
+    for name, func in (
+        ("reading the fields only", read_only),
+        ("EmeterValidator.check", validate),
+        ("LightValidator.check_rgb", validate_rgb),
+    ):
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name:26} {best / SAMPLES * 1e9:8.1f} ns / sample")
+
+    print(f"emeter violations: {emeter.violations}")
+    print(f"light violations: {light.violations}")
+
+
+if __name__ == "__main__":
+    main()
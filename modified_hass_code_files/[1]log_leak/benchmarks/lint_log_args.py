@@ -0,0 +1,215 @@
+"""Find expressions with side effects inside logging arguments.
+
+Every call found in the arguments of a logging call (including the
+expressions of f-strings) is reported with an estimated cost class:
+
+* network: query of a device or SSDP search,
+* coroutine: awaits, or calls of a coroutine function (creating a stray
+  coroutine object when not awaited),
+* allocation: constructors, container builders and functions constructing
+  objects,
+* call: any other call.
+
+The script exits with 1 when any of the classes given with --fail-on
+(default: network, coroutine, allocation) is found, so it can gate the
+benchmarks. Run it from this folder, e.g.:
+    python benchmarks/lint_log_args.py kasa yeelightComponent tplink automation
+"""
+import argparse
+import ast
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Set
+
+DEFAULT_PATHS = ("kasa", "yeelightComponent", "tplink", "automation", "helpers")
+
+LOG_METHODS = {"debug", "info", "warning", "error", "exception", "critical", "log"}
+LOGGER_NAME = re.compile(r"^_?(log|logger)$", re.IGNORECASE)
+
+# methods talking to the devices or the network
+NETWORK_CALLS = {
+    "_query_helper",
+    "_query",
+    "query",
+    "_execute_query",
+    "update",
+    "async_update",
+    "async_search",
+    "async_get_properties",
+    "async_get_capabilities",
+    "async_listen",
+    "async_send_command",
+    "send_command",
+    "discover",
+    "discover_single",
+}
+# coroutine functions of python-kasa modules outside of this folder
+EXTERNAL_COROUTINES = {"get_realtime", "get_daystat", "get_monthstat"}
+ALLOCATING_CALLS = {
+    "dict",
+    "list",
+    "set",
+    "tuple",
+    "frozenset",
+    "sorted",
+    "pf",
+    "pformat",
+    "dumps",
+    "deepcopy",
+    "copy",
+}
+COST_CLASSES = ("network", "coroutine", "allocation", "call")
+
+
+class Finding(NamedTuple):
+    """A call inside the arguments of a logging call."""
+
+    path: str
+    line: int
+    col: int
+    cost: str
+    source: str
+
+
+def _call_name(node: ast.Call) -> str:
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    if isinstance(func, ast.Name):
+        return func.id
+    return ""
+
+
+def _is_log_call(node: ast.AST) -> bool:
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+        return False
+    func = node.func
+    return (
+        func.attr in LOG_METHODS
+        and isinstance(func.value, ast.Name)
+        and LOGGER_NAME.match(func.value.id) is not None
+    )
+
+
+class Index:
+    """Names of the coroutine and allocating functions of the scanned modules."""
+
+    def __init__(self, trees: Dict[str, ast.Module]) -> None:
+        self.coroutines: Set[str] = set(EXTERNAL_COROUTINES)
+        self.allocating: Set[str] = set()
+        for tree in trees.values():
+            for node in ast.walk(tree):
+                if isinstance(node, ast.AsyncFunctionDef):
+                    self.coroutines.add(node.name)
+                elif isinstance(node, ast.FunctionDef) and self._constructs(node):
+                    self.allocating.add(node.name)
+
+    @staticmethod
+    def _constructs(func: ast.FunctionDef) -> bool:
+        """Return True if the function calls a class, or a class passed in."""
+        params = {arg.arg for arg in func.args.args}
+        for node in ast.walk(func):
+            if not isinstance(node, ast.Call) or _is_log_call(node):
+                continue
+            name = _call_name(node)
+            if name[:1].isupper() or (
+                isinstance(node.func, ast.Name) and name in params
+            ):
+                return True
+        return False
+
+    def cost(self, node: ast.AST) -> str:
+        """Return the most expensive cost class within an expression."""
+        costs = set()
+        for child in ast.walk(node):
+            if isinstance(child, ast.Await):
+                costs.add("coroutine")
+            elif isinstance(child, ast.Call):
+                name = _call_name(child)
+                if name in NETWORK_CALLS:
+                    costs.add("network")
+                elif name in self.coroutines or name.startswith("async_"):
+                    costs.add("coroutine")
+                elif (
+                    name[:1].isupper()
+                    or name in ALLOCATING_CALLS
+                    or name in self.allocating
+                ):
+                    costs.add("allocation")
+                else:
+                    costs.add("call")
+        for cost in COST_CLASSES:
+            if cost in costs:
+                return cost
+        return ""
+
+
+def _outermost_calls(node: ast.AST) -> Iterator[ast.AST]:
+    """Yield the outermost calls and awaits of an expression."""
+    if isinstance(node, (ast.Call, ast.Await)):
+        yield node
+        return
+    for child in ast.iter_child_nodes(node):
+        yield from _outermost_calls(child)
+
+
+def lint(paths: List[Path]) -> List[Finding]:
+    """Return the findings for all python files below the paths."""
+    files = [
+        file
+        for path in paths
+        for file in (sorted(path.rglob("*.py")) if path.is_dir() else [path])
+    ]
+    trees = {str(file): ast.parse(file.read_text(), str(file)) for file in files}
+    index = Index(trees)
+
+    findings = []
+    for path, tree in trees.items():
+        for node in ast.walk(tree):
+            if not _is_log_call(node):
+                continue
+            for arg in [*node.args, *(keyword.value for keyword in node.keywords)]:
+                for call in _outermost_calls(arg):
+                    findings.append(
+                        Finding(
+                            path,
+                            call.lineno,
+                            call.col_offset,
+                            index.cost(call),
+                            ast.unparse(call),
+                        )
+                    )
+    return sorted(findings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=DEFAULT_PATHS)
+    parser.add_argument(
+        "--fail-on",
+        default="network,coroutine,allocation",
+        help="comma separated cost classes failing the check",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="only print the summary"
+    )
+    args = parser.parse_args()
+    fail_on = set(args.fail_on.split(",")) - {""}
+
+    findings = lint([Path(path) for path in args.paths if Path(path).exists()])
+    if not args.quiet:
+        for finding in findings:
+            print(
+                f"{finding.path}:{finding.line}:{finding.col}: "
+                f"{finding.cost}: {finding.source}"
+            )
+
+    counts = Counter(finding.cost for finding in findings)
+    print(", ".join(f"{cost}: {counts[cost]}" for cost in COST_CLASSES))
+    return 1 if any(counts[cost] for cost in fail_on) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""Non-blocking, batching file handler for home-assistant.log.
+
+Placed in homeassistant/helpers. Log calls only
+append the record to a bounded queue, a writer thread formats the queued
+records and writes them to the file in large buffered batches.
+"""
+from __future__ import annotations
+
+from collections import deque
+import gc
+import logging
+import logging.handlers
+import os
+import threading
+import time
+from typing import TextIO
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+
+DEFAULT_MAXSIZE = 10000
+DEFAULT_BATCH_SIZE = 512
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+
+class BatchingFileHandler(logging.Handler):
+    """Write log records to a file from a dedicated thread.
+
+    When the queue is full the oldest record is dropped and counted in
+    `dropped`, so the emitting thread never blocks on disk I/O. The latency
+    from record creation to the write reaching the file is tracked in
+    `last_latency`, `max_latency` and `mean_latency` (seconds).
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        maxsize: int = DEFAULT_MAXSIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Initialize the handler and start the writer thread."""
+        super().__init__()
+        self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._stream: TextIO = open(  # pylint: disable=consider-using-with
+            filename, "a", encoding=encoding, buffering=1 << 16
+        )
+        self._queue: deque[logging.LogRecord] = deque()
+        self._maxsize = maxsize
+        self._cond = threading.Condition(threading.Lock())
+        self._closing = False
+        self._idle = threading.Event()
+        self._idle.set()
+        self.dropped = 0
+        self.written = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._latency_total = 0.0
+        self._thread = threading.Thread(
+            target=self._run, name="BatchingFileHandler", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def mean_latency(self) -> float:
+        """Return the mean creation to disk latency in seconds."""
+        return self._latency_total / self.written if self.written else 0.0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of queued records."""
+        return len(self._queue)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue a record, dropping the oldest one when full."""
+        if record.args:
+            # the arguments may change before the writer thread formats them
+            record.msg = record.getMessage()
+            record.args = None
+        with self._cond:
+            if self._closing:
+                return
+            if len(self._queue) >= self._maxsize:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(record)
+            self._idle.clear()
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify()
+
+    def _take_batch(self) -> list[logging.LogRecord] | None:
+        """Wait for records and remove up to batch_size of them from the queue."""
+        with self._cond:
+            if not self._queue and not self._closing:
+                self._cond.wait(self.flush_interval)
+            if not self._queue:
+                if self._closing:
+                    return None
+                self._idle.set()
+                return []
+            count = min(len(self._queue), self.batch_size)
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _run(self) -> None:
+        while (batch := self._take_batch()) is not None:
+            if not batch:
+                continue
+            lines = []
+            for record in batch:
+                try:
+                    lines.append(self.format(record))
+                except Exception:  # pylint: disable=broad-except
+                    self.handleError(record)
+            try:
+                self._stream.write("\n".join(lines) + "\n")
+                self._stream.flush()
+            except Exception:  # pylint: disable=broad-except
+                self.handleError(batch[0])
+                continue
+
+            written = time.time()
+            for record in batch:
+                latency = written - record.created
+                self._latency_total += latency
+                if latency > self.max_latency:
+                    self.max_latency = latency
+            self.last_latency = latency
+            self.written += len(batch)
+            with self._cond:
+                if not self._queue:
+                    self._idle.set()
+
+    def flush(self) -> None:
+        """Wait until all queued records are written."""
+        with self._cond:
+            if self._closing or not self._thread.is_alive():
+                return
+            self._cond.notify()
+        self._idle.wait()
+
+    def close(self) -> None:
+        """Write the queued records, stop the writer thread and close the file."""
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify()
+        self._thread.join()
+        self._stream.close()
+        super().close()
+
+    def stats(self) -> dict[str, float]:
+        """Return the queue and latency counters."""
+        return {
+            "pending": self.pending,
+            "written": self.written,
+            "dropped": self.dropped,
+            "last_latency": self.last_latency,
+            "mean_latency": self.mean_latency,
+            "max_latency": self.max_latency,
+        }
+
+
+def _find_queue_listener() -> logging.handlers.QueueListener | None:
+    """Return the listener behind the queue handler of the root logger.
+
+    Once logging is set up, Home Assistant moves the root handlers behind a
+    HomeAssistantQueueHandler and writes the records from a QueueListener
+    thread (`async_activate_log_queue_handler`).
+    """
+    for handler in logging.root.handlers:
+        if not isinstance(handler, logging.handlers.QueueHandler):
+            continue
+        if (listener := getattr(handler, "listener", None)) is not None:
+            return listener
+        # older releases keep the listener only in a closure, look it up once
+        for obj in gc.get_objects():
+            if (
+                isinstance(obj, logging.handlers.QueueListener)
+                and obj.queue is handler.queue
+            ):
+                return obj
+    return None
+
+
+def _is_log_file(handler: logging.Handler, filename: str) -> bool:
+    return (
+        isinstance(handler, logging.FileHandler) and handler.baseFilename == filename
+    )
+
+
+@callback
+def async_setup_batched_log_file(
+    hass: HomeAssistant,
+    filename: str,
+    fmt: logging.Formatter | None = None,
+    **kwargs: float,
+) -> BatchingFileHandler:
+    """Replace the handlers writing to filename with a batching handler.
+
+    Call it from `bootstrap.async_enable_logging` once the log file handler
+    was added, before or after `async_activate_log_queue_handler`. When the
+    queue handler is active, the file handlers are swapped inside its
+    listener, otherwise on the root logger (and the queue handler migrates
+    the batching handler later). The handler is closed when Home Assistant
+    shuts down, after the listener wrote out its queue.
+    """
+    filename = os.path.abspath(filename)
+    root = logging.getLogger()
+    listener = _find_queue_listener()
+    handlers = listener.handlers if listener is not None else tuple(root.handlers)
+    replaced = [handler for handler in handlers if _is_log_file(handler, filename)]
+    for handler in replaced:
+        fmt = fmt or handler.formatter
+
+    batching = BatchingFileHandler(filename, **kwargs)  # type: ignore[arg-type]
+    batching.setFormatter(fmt)
+    if listener is not None:
+        # the listener thread reads the tuple for every record
+        listener.handlers = tuple(
+            handler for handler in handlers if handler not in replaced
+        ) + (batching,)
+    else:
+        for handler in replaced:
+            root.removeHandler(handler)
+        root.addHandler(batching)
+    for handler in replaced:
+        handler.close()
+
+    @callback
+    def _async_close(event: Event) -> None:
+        root.removeHandler(batching)
+        batching.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return batching
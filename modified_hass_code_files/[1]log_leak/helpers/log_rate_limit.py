@@ -0,0 +1,196 @@
+"""Per call site rate limiting of log records.
+
+Placed in homeassistant/helpers. A
+:class:`RateLimitFilter` lets at most `limit` records per `interval` seconds
+through for every logging call site of a logger and replaces the rest with
+a single summary line when the window ends.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+import logging
+import threading
+import time
+from typing import NamedTuple
+
+
+class RateLimit(NamedTuple):
+    """Maximum number of records per interval (seconds)."""
+
+    limit: int
+    interval: float
+
+
+DEFAULT_RATE_LIMIT = RateLimit(10, 60.0)
+
+
+class _Site:
+    """Window state of a single call site."""
+
+    __slots__ = ("limit", "interval", "window_end", "count", "suppressed", "last")
+
+    def __init__(self, rate_limit: RateLimit | None) -> None:
+        self.limit = None if rate_limit is None else rate_limit.limit
+        self.interval = 0.0 if rate_limit is None else rate_limit.interval
+        self.window_end = 0.0
+        self.count = 0
+        self.suppressed = 0
+        self.last: logging.LogRecord | None = None
+
+
+class RateLimitFilter(logging.Filter):
+    """Rate limit the records of a logger per call site.
+
+    Call sites are keyed by line number, as every logger of the modified
+    integrations belongs to a single module. The limit of a site is resolved
+    once, on its first record: the first template (message prefix) matching
+    the unformatted message wins, then the logger limit applies. A template
+    mapped to None is never limited.
+
+    The summary of a window is logged by a timer thread when the window ends,
+    or by the next record of the site if that comes first. `close` logs the
+    pending summaries.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        rate_limit: RateLimit | None = DEFAULT_RATE_LIMIT,
+        templates: Mapping[str, RateLimit | None] | None = None,
+    ) -> None:
+        """Initialize the filter."""
+        super().__init__()
+        self.logger = logger
+        self.rate_limit = rate_limit
+        self.templates = dict(templates or {})
+        self.suppressed = 0
+        self._sites: dict[int, _Site] = {}
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def _add_site(self, record: logging.LogRecord) -> _Site:
+        rate_limit = self.rate_limit
+        msg = str(record.msg)
+        for template, template_limit in self.templates.items():
+            if msg.startswith(template):
+                rate_limit = template_limit
+                break
+        self._sites[record.lineno] = site = _Site(rate_limit)
+        return site
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if the record should be logged."""
+        site = self._sites.get(record.lineno) or self._add_site(record)
+        if site.limit is None:
+            return True
+
+        now = record.created
+        if now >= site.window_end:
+            if site.suppressed:
+                # the timer may be taking the same summary
+                with self._lock:
+                    summary = self._take_summary(site)
+                if summary is not None:
+                    self._summarize(*summary)
+            site.window_end = now + site.interval
+            site.count = 1
+            return True
+
+        if site.count < site.limit:
+            site.count += 1
+            return True
+
+        site.suppressed += 1
+        site.last = record
+        self.suppressed += 1
+        if self._timer is None:
+            with self._lock:
+                if self._timer is None:
+                    self._arm(site.window_end - now)
+        return False
+
+    @staticmethod
+    def _take_summary(site: _Site) -> tuple[logging.LogRecord, int] | None:
+        """Return the last suppressed record and count of a site, and reset them."""
+        if not site.suppressed or site.last is None:
+            return None
+        summary = (site.last, site.suppressed)
+        site.suppressed = 0
+        site.last = None
+        return summary
+
+    def _arm(self, delay: float) -> None:
+        self._timer = threading.Timer(max(delay, 0.0), self._expire)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _expire(self) -> None:
+        """Log the summaries of the ended windows and wait for the next end."""
+        now = time.time()
+        with self._lock:
+            self._timer = None
+            due = []
+            next_end = None
+            for site in self._sites.values():
+                if not site.suppressed:
+                    continue
+                if site.window_end <= now:
+                    due.append(self._take_summary(site))
+                elif next_end is None or site.window_end < next_end:
+                    next_end = site.window_end
+            if next_end is not None:
+                self._arm(next_end - now)
+        for summary in due:
+            if summary is not None:
+                self._summarize(*summary)
+
+    def _summarize(self, record: logging.LogRecord, suppressed: int) -> None:
+        """Log how many records of the call site were suppressed."""
+        summary = self.logger.makeRecord(
+            record.name,
+            record.levelno,
+            record.pathname,
+            record.lineno,
+            "Suppressed %s similar messages from %s:%s",
+            (suppressed, record.module, record.lineno),
+            None,
+            record.funcName,
+        )
+        # bypass the filters, the summary is not rate limited itself
+        self.logger.callHandlers(summary)
+
+    def flush(self) -> None:
+        """Log the summaries of all call sites with suppressed records."""
+        with self._lock:
+            summaries = [self._take_summary(site) for site in self._sites.values()]
+        for summary in summaries:
+            if summary is not None:
+                self._summarize(*summary)
+
+    def close(self) -> None:
+        """Stop the timer and log the pending summaries."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self.flush()
+
+
+def install_rate_limits(
+    loggers: Mapping[str, RateLimit | None],
+    templates: Mapping[str, RateLimit | None] | None = None,
+) -> dict[str, RateLimitFilter]:
+    """Add a rate limit filter to each of the named loggers.
+
+    For instance, `{"kasa.emeterstatus": RateLimit(1, 60)}` lets one record
+    per minute through for each call site of the emeter status, and the
+    template `"CustomLog || Kasa || SmartDevice class || update"` mapped to
+    None keeps the update records unlimited. Close the returned filters on
+    shutdown to log the pending summaries.
+    """
+    filters = {}
+    for name, rate_limit in loggers.items():
+        logger = logging.getLogger(name)
+        filters[name] = RateLimitFilter(logger, rate_limit, templates)
+        logger.addFilter(filters[name])
+    return filters
@@ -0,0 +1,201 @@
+"""Module for controlling many devices at once."""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .exceptions import SmartDeviceException
+from .protocol import TPLinkSmartHomeProtocol
+from .smartdevice import DeviceType, SmartDevice
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Device types whose turn_on/turn_off is a plain, context-less set_relay_state
+_RELAY_DEVICE_TYPES = {DeviceType.Plug, DeviceType.Strip, DeviceType.Dimmer}
+
+# child alias -> (parent, child)
+_PlugIndex = Dict[str, Tuple[SmartDevice, SmartDevice]]
+
+
+@dataclass
+class GroupResult:
+    """Result of a group command for a single device."""
+
+    device: SmartDevice
+    skipped: bool = False
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def success(self) -> bool:
+        """Return True if the command succeeded or was not needed."""
+        return self.error is None
+
+
+class SmartDeviceGroup:
+    """Issue the same command to many devices concurrently.
+
+    Commands are sent in parallel, but never to more than `max_concurrency`
+    devices at the same time. Relay commands are encoded only once and the
+    same frame is sent to every plug, strip and dimmer in the group.
+
+    Examples (need reachable devices):
+        >>> import asyncio
+        >>> from kasa import SmartPlug
+        >>> plugs = [SmartPlug("192.168.0.10"), SmartPlug("192.168.0.11")]
+        >>> group = SmartDeviceGroup(plugs)
+        >>> results = asyncio.run(group.turn_off())  # doctest: +SKIP
+        >>> [r.success for r in results]  # doctest: +SKIP
+        [True, True]
+
+        Devices already in the requested state (based on the last update)
+        can be left alone:
+
+        >>> results = asyncio.run(group.turn_off(skip_unchanged=True))  # doctest: +SKIP
+        >>> [r.skipped for r in results]  # doctest: +SKIP
+        [True, True]
+    """
+
+    DEFAULT_CONCURRENCY = 16
+
+    _RELAY_REQUESTS: Dict[int, Dict] = {
+        state: {"system": {"set_relay_state": {"state": state}}} for state in (0, 1)
+    }
+    _RELAY_FRAMES: Dict[int, bytes] = {
+        state: TPLinkSmartHomeProtocol.encode_request(request)
+        for state, request in _RELAY_REQUESTS.items()
+    }
+
+    def __init__(
+        self,
+        devices: Iterable[SmartDevice] = (),
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        """Create a new group.
+
+        :param devices: devices belonging to the group
+        :param max_concurrency: maximum number of devices to talk to at once
+        """
+        if max_concurrency < 1:
+            raise SmartDeviceException("max_concurrency needs to be at least 1")
+
+        self.devices: List[SmartDevice] = list(devices)
+        self.max_concurrency = max_concurrency
+        self._plugs_by_alias: Optional[_PlugIndex] = None
+        self._plugs_key: Tuple[int, Tuple[int, ...]] = (-1, ())
+
+    def add_device(self, device: SmartDevice) -> None:
+        """Add a device to the group."""
+        if device not in self.devices:
+            self.devices.append(device)
+            self._plugs_by_alias = None
+
+    def remove_device(self, device: SmartDevice) -> None:
+        """Remove a device from the group."""
+        self.devices.remove(device)
+        self._plugs_by_alias = None
+
+    def get_plug_by_name(self, name: str) -> Tuple[SmartDevice, SmartDevice]:
+        """Return (parent, child) for the child with the given alias.
+
+        All devices of the group are searched; the index is only rebuilt when
+        a device in the fleet reports changed children or aliases, or when the
+        number of children of a device changed (strips append their children
+        in-place on their first update).
+        """
+        key = self._plug_index_key()
+        if self._plugs_by_alias is None or self._plugs_key != key:
+            self._build_plug_index(key)
+        assert self._plugs_by_alias is not None
+
+        try:
+            return self._plugs_by_alias[name]
+        except KeyError:
+            raise SmartDeviceException(f"No device in group has child {name}")
+
+    def _plug_index_key(self) -> Tuple[int, Tuple[int, ...]]:
+        return (
+            SmartDevice._child_index_generation,
+            tuple(len(dev.children) for dev in self.devices),
+        )
+
+    def _build_plug_index(self, key: Tuple[int, Tuple[int, ...]]) -> None:
+        plugs: _PlugIndex = {}
+        for dev in self.devices:
+            if not dev.children:
+                continue
+            for alias, child in dev._child_index()[0].items():
+                plugs.setdefault(alias, (dev, child))
+
+        self._plugs_by_alias = plugs
+        self._plugs_key = key
+
+    async def turn_on(self, skip_unchanged: bool = False) -> List[GroupResult]:
+        """Turn all devices on.
+
+        :param skip_unchanged: do not send anything to devices already on
+        :return: per-device results in the order of :attr:`devices`
+        """
+        return await self._set_state(True, skip_unchanged)
+
+    async def turn_off(self, skip_unchanged: bool = False) -> List[GroupResult]:
+        """Turn all devices off.
+
+        :param skip_unchanged: do not send anything to devices already off
+        :return: per-device results in the order of :attr:`devices`
+        """
+        return await self._set_state(False, skip_unchanged)
+
+    async def update(self) -> List[GroupResult]:
+        """Update all devices.
+
+        :return: per-device results in the order of :attr:`devices`
+        """
+        return await self._run(lambda dev: dev.update())
+
+    async def _set_state(self, on: bool, skip_unchanged: bool) -> List[GroupResult]:
+        frame = self._RELAY_FRAMES[int(on)]
+        request = self._RELAY_REQUESTS[int(on)]
+
+        def _command(dev: SmartDevice):
+            if skip_unchanged and dev._last_update is not None and dev.is_on == on:
+                return None
+            if dev.device_type in _RELAY_DEVICE_TYPES:
+                return dev._query_encoded(
+                    frame, request, "system", "set_relay_state"
+                )
+            return dev.turn_on() if on else dev.turn_off()
+
+        return await self._run(_command)
+
+    async def _run(self, command) -> List[GroupResult]:
+        """Run command for every device, limited by max_concurrency.
+
+        `command` returns the awaitable to run for a device,
+        or None when the device should be skipped.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _run_one(dev: SmartDevice) -> GroupResult:
+            try:
+                awaitable = command(dev)
+            except SmartDeviceException as ex:
+                return GroupResult(dev, error=ex)
+            if awaitable is None:
+                return GroupResult(dev, skipped=True)
+
+            async with semaphore:
+                try:
+                    return GroupResult(dev, result=await awaitable)
+                except SmartDeviceException as ex:
+                    _LOGGER.debug("Group command failed for %s: %s", dev.host, ex)
+                    return GroupResult(dev, error=ex)
+
+        return list(await asyncio.gather(*(_run_one(dev) for dev in self.devices)))
+
+    def __len__(self) -> int:
+        return len(self.devices)
+
+    def __repr__(self):
+        return f"<SmartDeviceGroup of {len(self.devices)} devices>"
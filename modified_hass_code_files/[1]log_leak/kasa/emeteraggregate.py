@@ -0,0 +1,199 @@
+"""Module for aggregating emeter readings of many devices into groups."""
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from .emeterstatus import EmeterStatus
+from .exceptions import SmartDeviceException
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class GroupStats:
+    """Aggregated emeter statistics of a group."""
+
+    devices: int
+    # sum of the latest power reading of every device, in W
+    power: float
+    # energy used since the group was created, in Wh
+    energy: float
+    # energy used within the sliding window, in Wh
+    window_energy: float
+    # mean and variance of the group power, one value per received sample
+    mean: float
+    variance: float
+    samples: int
+
+
+class _GroupState:
+    __slots__ = (
+        "devices",
+        "power",
+        "energy",
+        "window",
+        "window_energy",
+        "count",
+        "mean",
+        "m2",
+    )
+
+    def __init__(self) -> None:
+        self.devices: Set[str] = set()
+        self.power = 0.0
+        self.energy = 0.0
+        self.window: Deque[Tuple[float, float]] = deque()
+        self.window_energy = 0.0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add_sample(self, delta_power: float, energy: float, timestamp: float) -> None:
+        self.power += delta_power
+        self.energy += energy
+        if energy:
+            self.window.append((timestamp, energy))
+            self.window_energy += energy
+
+        # Welford's online algorithm
+        self.count += 1
+        delta = self.power - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (self.power - self.mean)
+
+    def expire(self, cutoff: float) -> None:
+        window = self.window
+        while window and window[0][0] < cutoff:
+            self.window_energy -= window.popleft()[1]
+        if not window:
+            # avoid accumulating floating point error
+            self.window_energy = 0.0
+
+
+class _DeviceState:
+    __slots__ = ("groups", "power", "timestamp")
+
+    def __init__(self) -> None:
+        self.groups: List[_GroupState] = []
+        self.power: Optional[float] = None
+        self.timestamp: Optional[float] = None
+
+
+class EmeterAggregator:
+    """Incrementally aggregate emeter readings per group of devices.
+
+    Devices are assigned to any number of groups (e.g. rooms and circuits).
+    Every reading updates the totals of the groups of its device in O(1),
+    so querying a group does not depend on the number of devices or the
+    length of their history.
+
+    Examples:
+        >>> agg = EmeterAggregator(window=3600)
+        >>> agg.assign("plug1", ["kitchen", "circuit 1"])
+        >>> agg.assign("plug2", ["kitchen"])
+        >>> agg.add("plug1", EmeterStatus(power=100), timestamp=0)
+        >>> agg.add("plug2", EmeterStatus(power=50), timestamp=0)
+        >>> agg.add("plug1", EmeterStatus(power=100), timestamp=36)
+        >>> agg.stats("kitchen").power
+        150.0
+        >>> agg.stats("kitchen").energy
+        1.0
+    """
+
+    def __init__(self, window: float = 3600) -> None:
+        """Create a new aggregator.
+
+        :param window: length of the sliding energy window in seconds
+        """
+        self.window = window
+        self._groups: Dict[str, _GroupState] = {}
+        self._devices: Dict[str, _DeviceState] = {}
+
+    def assign(self, device_id: str, groups: Iterable[str]) -> None:
+        """Assign a device to groups, replacing its previous assignment.
+
+        The device's latest power reading moves with it, accumulated energy
+        stays with the groups it was used in.
+        """
+        device = self._devices.setdefault(device_id, _DeviceState())
+        power = device.power or 0.0
+        for group in device.groups:
+            group.devices.discard(device_id)
+            group.power -= power
+
+        device.groups = []
+        for name in dict.fromkeys(groups):
+            group = self._groups.setdefault(name, _GroupState())
+            group.devices.add(device_id)
+            group.power += power
+            device.groups.append(group)
+
+    def remove(self, device_id: str) -> None:
+        """Remove a device from all of its groups."""
+        self.assign(device_id, [])
+        del self._devices[device_id]
+
+    def add(
+        self, device_id: str, status: EmeterStatus, timestamp: Optional[float] = None
+    ) -> None:
+        """Add a reading of a device to the totals of its groups."""
+        device = self._devices.get(device_id)
+        if device is None:
+            raise SmartDeviceException(f"Device {device_id} is not in any group")
+
+        power = status.power
+        if power is None or math.isnan(power):
+            return
+        power = float(power)
+        if timestamp is None:
+            timestamp = time.time()
+
+        energy = 0.0
+        previous = device.power
+        if previous is not None and device.timestamp is not None:
+            elapsed = timestamp - device.timestamp
+            if elapsed > 0:
+                # trapezoidal integration, in Wh
+                energy = (previous + power) / 2 * elapsed / 3600
+
+        delta_power = power - (previous or 0.0)
+        device.power = power
+        device.timestamp = timestamp
+
+        cutoff = timestamp - self.window
+        for group in device.groups:
+            group.add_sample(delta_power, energy, timestamp)
+            group.expire(cutoff)
+
+    def stats(self, group: str, now: Optional[float] = None) -> GroupStats:
+        """Return the aggregated statistics of a group.
+
+        :param group: name of the group
+        :param now: time used to expire the sliding window (default: no expiry)
+        """
+        try:
+            state = self._groups[group]
+        except KeyError:
+            raise SmartDeviceException(f"Unknown group {group}")
+
+        if now is not None:
+            state.expire(now - self.window)
+
+        return GroupStats(
+            devices=len(state.devices),
+            power=state.power,
+            energy=state.energy,
+            window_energy=state.window_energy,
+            mean=state.mean,
+            variance=state.m2 / (state.count - 1) if state.count > 1 else 0.0,
+            samples=state.count,
+        )
+
+    @property
+    def groups(self) -> List[str]:
+        """Return the names of all groups."""
+        return list(self._groups)
@@ -0,0 +1,388 @@
+"""Module for archiving emeter readings on disk.
+
+Every device gets its own append-only file made of a 64 byte header followed
+by fixed width little-endian records, sorted by timestamp::
+
+    header:  magic "KEMA", version, kind, record size, device id
+    raw:     uint32 timestamp, float32 power, voltage, current, total
+    rollup:  uint32 timestamp, float32 power min, max, mean,
+             voltage mean, current mean, last total
+
+As the records have a fixed width, time ranges are located with a binary
+search on the memory-mapped file, and can be returned as NumPy arrays
+viewing the file contents directly.
+"""
+import logging
+import math
+import mmap
+import os
+import struct
+import time
+from array import array
+from typing import IO, Dict, List, Optional, Tuple
+
+from .emeterstatus import EmeterStatus
+from .exceptions import SmartDeviceException
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAGIC = b"KEMA"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHH6x48s")
+_TIMESTAMP = struct.Struct("<I")
+
+KIND_RAW = 0
+KIND_ROLLUP = 1
+
+RAW_FIELDS = ("timestamp", "power", "voltage", "current", "total")
+ROLLUP_FIELDS = (
+    "timestamp",
+    "power_min",
+    "power_max",
+    "power_mean",
+    "voltage",
+    "current",
+    "total",
+)
+
+_RECORDS = {
+    KIND_RAW: (struct.Struct("<Iffff"), RAW_FIELDS, ".emeter"),
+    KIND_ROLLUP: (struct.Struct("<Iffffff"), ROLLUP_FIELDS, ".rollup"),
+}
+
+ROLLUP_INTERVAL = 60
+
+
+def _dtype(kind: int):
+    fields = _RECORDS[kind][1]
+    return np.dtype([(fields[0], "<u4")] + [(field, "<f4") for field in fields[1:]])
+
+
+def _present(values: array) -> List[float]:
+    """Return the values of the readings that were not missing (NaN)."""
+    return [value for value in values if not math.isnan(value)] or [math.nan]
+
+
+def _mean(values: array) -> float:
+    """Return the mean of the values present, NaN if all are missing."""
+    present = _present(values)
+    return sum(present) / len(present)
+
+
+class EmeterArchive:
+    """Append-only on-disk archive of emeter readings, one file per device.
+
+    Examples:
+        >>> import tempfile
+        >>> archive = EmeterArchive(tempfile.mkdtemp())
+        >>> archive.append("plug1", EmeterStatus(power=10, total=1), timestamp=60)
+        >>> archive.append("plug1", EmeterStatus(power=30, total=2), timestamp=90)
+        >>> archive.append("plug1", EmeterStatus(power=20, total=3), timestamp=120)
+        >>> archive.flush()
+        >>> list(archive.read_columns("plug1", start=90)["power"])
+        [30.0, 20.0]
+        >>> archive.compact("plug1", keep_raw=0)
+        1
+        >>> list(archive.read_columns("plug1", rollup=True)["power_mean"])
+        [20.0]
+        >>> list(archive.read_columns("plug1")["timestamp"])
+        [120]
+    """
+
+    def __init__(self, path: str) -> None:
+        """Create an archive stored in the given directory."""
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._files: Dict[str, IO[bytes]] = {}
+        self._last_timestamps: Dict[str, int] = {}
+
+    def _filename(self, device_id: str, kind: int) -> str:
+        return os.path.join(self.path, device_id.replace(":", "") + _RECORDS[kind][2])
+
+    @staticmethod
+    def _write_header(file: IO[bytes], device_id: str, kind: int) -> None:
+        record = _RECORDS[kind][0]
+        file.write(
+            _HEADER.pack(_MAGIC, _VERSION, kind, record.size, device_id.encode()[:48])
+        )
+
+    @staticmethod
+    def _check_header(buffer, filename: str, kind: int) -> None:
+        magic, version, file_kind, size, _ = _HEADER.unpack_from(buffer)
+        if (magic, version, file_kind, size) != (
+            _MAGIC,
+            _VERSION,
+            kind,
+            _RECORDS[kind][0].size,
+        ):
+            raise SmartDeviceException(f"{filename} is not a valid emeter archive")
+
+    def _open_for_append(self, device_id: str, kind: int) -> IO[bytes]:
+        filename = self._filename(device_id, kind)
+        file = open(filename, "ab")
+        if file.tell() == 0:
+            self._write_header(file, device_id, kind)
+        return file
+
+    def devices(self) -> List[str]:
+        """Return the device ids in the archive (as used for the filenames)."""
+        suffix = _RECORDS[KIND_RAW][2]
+        return sorted(
+            name[: -len(suffix)]
+            for name in os.listdir(self.path)
+            if name.endswith(suffix)
+        )
+
+    def append(
+        self, device_id: str, status: EmeterStatus, timestamp: Optional[float] = None
+    ) -> None:
+        """Append a reading of a device, timestamps need to be increasing."""
+        if timestamp is None:
+            timestamp = time.time()
+        timestamp = int(timestamp)
+
+        file = self._files.get(device_id)
+        if file is None:
+            last = self._last_timestamp(device_id, KIND_RAW)
+            if last is not None:
+                self._last_timestamps[device_id] = last
+            file = self._files[device_id] = self._open_for_append(device_id, KIND_RAW)
+
+        last = self._last_timestamps.get(device_id)
+        if last is not None and timestamp < last:
+            raise SmartDeviceException(
+                f"Reading for {device_id} at {timestamp} is older than {last}"
+            )
+
+        values = [getattr(status, field) for field in RAW_FIELDS[1:]]
+        file.write(
+            _RECORDS[KIND_RAW][0].pack(
+                timestamp, *(math.nan if v is None else v for v in values)
+            )
+        )
+        self._last_timestamps[device_id] = timestamp
+
+    def flush(self) -> None:
+        """Flush buffered readings to disk."""
+        for file in self._files.values():
+            file.flush()
+
+    def close(self) -> None:
+        """Close all open files."""
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+
+    def _close_device(self, device_id: str) -> None:
+        file = self._files.pop(device_id, None)
+        if file is not None:
+            file.close()
+
+    def _map(self, device_id: str, kind: int) -> Optional[mmap.mmap]:
+        filename = self._filename(device_id, kind)
+        if device_id in self._files:
+            self._files[device_id].flush()
+        try:
+            with open(filename, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                if size == 0:
+                    # created, but the header was not flushed yet
+                    return None
+                if size < _HEADER.size:
+                    raise SmartDeviceException(
+                        f"{filename} is not a valid emeter archive"
+                    )
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+        self._check_header(buffer, filename, kind)
+        return buffer
+
+    def _last_timestamp(self, device_id: str, kind: int) -> Optional[int]:
+        buffer = self._map(device_id, kind)
+        if buffer is None:
+            return None
+        with buffer:
+            size = _RECORDS[kind][0].size
+            count = (len(buffer) - _HEADER.size) // size
+            if not count:
+                return None
+            return _TIMESTAMP.unpack_from(buffer, _HEADER.size + (count - 1) * size)[0]
+
+    @staticmethod
+    def _bisect(buffer, size: int, count: int, timestamp: float) -> int:
+        """Return the index of the first record at or after timestamp."""
+        low, high = 0, count
+        while low < high:
+            mid = (low + high) // 2
+            if _TIMESTAMP.unpack_from(buffer, _HEADER.size + mid * size)[0] < timestamp:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _locate(
+        self, buffer, kind: int, start: Optional[float], end: Optional[float]
+    ) -> Tuple[int, int]:
+        size = _RECORDS[kind][0].size
+        count = (len(buffer) - _HEADER.size) // size
+        first = 0 if start is None else self._bisect(buffer, size, count, start)
+        last = count if end is None else self._bisect(buffer, size, count, end)
+        return first, max(first, last)
+
+    def read(
+        self,
+        device_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        rollup: bool = False,
+    ):
+        """Return the records of a time range as a NumPy structured array.
+
+        The array is a read-only view of the memory-mapped file, fields are
+        named as in RAW_FIELDS (or ROLLUP_FIELDS).
+
+        :param device_id: device to read
+        :param start: first timestamp to include (default: oldest record)
+        :param end: timestamp to stop before (default: include newest record)
+        :param rollup: read the per-minute rollups instead of raw readings
+        """
+        if np is None:
+            raise SmartDeviceException("numpy is required, use read_columns instead")
+
+        kind = KIND_ROLLUP if rollup else KIND_RAW
+        dtype = _dtype(kind)
+        buffer = self._map(device_id, kind)
+        if buffer is None:
+            return np.empty(0, dtype=dtype)
+
+        first, last = self._locate(buffer, kind, start, end)
+        return np.frombuffer(
+            buffer,
+            dtype=dtype,
+            count=last - first,
+            offset=_HEADER.size + first * dtype.itemsize,
+        )
+
+    def read_columns(
+        self,
+        device_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        rollup: bool = False,
+    ) -> Dict[str, array]:
+        """Return the records of a time range as `array.array` columns.
+
+        This is the fallback for environments without NumPy,
+        the arguments are the same as for :func:`read`.
+        """
+        kind = KIND_ROLLUP if rollup else KIND_RAW
+        record, fields, _ = _RECORDS[kind]
+        columns = {field: array("f") for field in fields[1:]}
+        columns["timestamp"] = array("I")
+
+        buffer = self._map(device_id, kind)
+        if buffer is None:
+            return columns
+
+        with buffer:
+            first, last = self._locate(buffer, kind, start, end)
+            view = memoryview(buffer)[
+                _HEADER.size + first * record.size : _HEADER.size + last * record.size
+            ]
+            try:
+                appenders = [columns[field].append for field in fields]
+                for values in record.iter_unpack(view):
+                    for append, value in zip(appenders, values):
+                        append(value)
+            finally:
+                view.release()
+
+        return columns
+
+    def compact(self, device_id: str, keep_raw: Optional[float] = None) -> int:
+        """Roll up completed minutes of raw readings, optionally dropping old ones.
+
+        :param device_id: device to compact
+        :param keep_raw: seconds of raw readings to keep, counted back from the
+                         newest reading (default: keep everything)
+        :return: number of rollup records written
+        """
+        columns = self.read_columns(device_id)
+        timestamps = columns["timestamp"]
+        if not timestamps:
+            return 0
+
+        last_rollup = self._last_timestamp(device_id, KIND_ROLLUP)
+        first_minute = 0 if last_rollup is None else last_rollup + ROLLUP_INTERVAL
+        # the current minute may still receive readings
+        end_minute = timestamps[-1] // ROLLUP_INTERVAL * ROLLUP_INTERVAL
+
+        rollups = self._rollup(columns, first_minute, end_minute)
+        if rollups:
+            record = _RECORDS[KIND_ROLLUP][0]
+            with self._open_for_append(device_id, KIND_ROLLUP) as file:
+                file.write(b"".join(record.pack(*values) for values in rollups))
+
+        if keep_raw is not None:
+            self._truncate(device_id, timestamps[-1] - keep_raw)
+
+        _LOGGER.debug("Compacted %s into %s rollups", device_id, len(rollups))
+        return len(rollups)
+
+    @staticmethod
+    def _rollup(columns: Dict[str, array], first: int, end: int) -> List[Tuple]:
+        rollups = []
+        timestamps = columns["timestamp"]
+        power, voltage, current, total = (columns[field] for field in RAW_FIELDS[1:])
+        index, count = 0, len(timestamps)
+        while index < count and timestamps[index] < first:
+            index += 1
+
+        while index < count and timestamps[index] < end:
+            minute = timestamps[index] // ROLLUP_INTERVAL * ROLLUP_INTERVAL
+            stop = index
+            while stop < count and timestamps[stop] < minute + ROLLUP_INTERVAL:
+                stop += 1
+
+            watts = _present(power[index:stop])
+            rollups.append(
+                (
+                    minute,
+                    min(watts),
+                    max(watts),
+                    sum(watts) / len(watts),
+                    _mean(voltage[index:stop]),
+                    _mean(current[index:stop]),
+                    total[stop - 1],
+                )
+            )
+            index = stop
+
+        return rollups
+
+    def _truncate(self, device_id: str, cutoff: float) -> None:
+        """Rewrite the raw file without the readings older than cutoff."""
+        self._close_device(device_id)
+        buffer = self._map(device_id, KIND_RAW)
+        if buffer is None:
+            return
+
+        filename = self._filename(device_id, KIND_RAW)
+        with buffer:
+            first, _ = self._locate(buffer, KIND_RAW, cutoff, None)
+            if not first:
+                return
+            offset = _HEADER.size + first * _RECORDS[KIND_RAW][0].size
+            with open(filename + ".tmp", "wb") as file:
+                file.write(buffer[: _HEADER.size])
+                file.write(buffer[offset:])
+
+        os.replace(filename + ".tmp", filename)
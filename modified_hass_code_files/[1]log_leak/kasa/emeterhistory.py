@@ -0,0 +1,246 @@
+"""Module for keeping recent emeter readings in memory."""
+import logging
+import math
+import time
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .emeterstatus import EmeterStatus
+from .exceptions import SmartDeviceException
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# only power is kept by default, the other metrics are opt-in
+DEFAULT_METRICS = ("power",)
+ALL_METRICS = ("power", "voltage", "current", "total")
+
+# 24 hours of samples taken every 5 seconds
+DEFAULT_CAPACITY = 24 * 60 * 60 // 5
+
+
+class EmeterRingBuffer:
+    """Fixed size, column oriented history of emeter readings for one device.
+
+    Every metric is kept in its own preallocated `array.array` column together
+    with a column of timestamps (whole seconds). Once the buffer is full the
+    oldest sample is overwritten, so appending never allocates.
+
+    By default only `power` is kept: with float32 columns a sample takes 8
+    bytes, i.e. ~138 kB per device for 24 hours at 5 second intervals
+    (~41 MB for 300 devices). Passing `metrics=ALL_METRICS` also keeps
+    voltage, current and total, at 20 bytes per sample (~104 MB for 300
+    devices).
+
+    Examples:
+        >>> buf = EmeterRingBuffer(capacity=3)
+        >>> for i in range(4):
+        ...     buf.append(EmeterStatus(power=i), timestamp=i)
+        >>> len(buf)
+        3
+        >>> [list(view) for view in buf.views("power")]
+        [[1.0, 2.0], [3.0]]
+        >>> buf.downsample("power", bucket=2)
+        [(0, 1.0, 1.0, 1.0), (2, 2.0, 3.0, 2.5)]
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        metrics: Sequence[str] = DEFAULT_METRICS,
+        typecode: str = "f",
+    ) -> None:
+        """Create a new buffer.
+
+        :param capacity: number of samples to keep
+        :param metrics: EmeterStatus properties to store (default: power only)
+        :param typecode: array typecode used for the metric columns
+        """
+        if capacity < 1:
+            raise SmartDeviceException("capacity needs to be at least 1")
+
+        self.capacity = capacity
+        self.metrics = tuple(metrics)
+        self._timestamps = array("I", [0]) * capacity
+        self._columns: Dict[str, array] = {
+            metric: array(typecode, [math.nan]) * capacity for metric in self.metrics
+        }
+        # next slot to write, and number of valid samples
+        self._index = 0
+        self._size = 0
+
+    def append(self, status: EmeterStatus, timestamp: Optional[float] = None) -> None:
+        """Store a reading, overwriting the oldest one when full."""
+        if timestamp is None:
+            timestamp = time.time()
+
+        index = self._index
+        self._timestamps[index] = int(timestamp)
+        for metric, column in self._columns.items():
+            value = getattr(status, metric)
+            column[index] = math.nan if value is None else value
+
+        self._index = (index + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the columns in bytes."""
+        columns = [self._timestamps, *self._columns.values()]
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def _start(self) -> int:
+        """Return the physical index of the oldest sample."""
+        return (self._index - self._size) % self.capacity
+
+    def _physical(self, logical: int) -> int:
+        return (self._start() + logical) % self.capacity
+
+    def _bisect(self, timestamp: float) -> int:
+        """Return the logical index of the first sample at or after timestamp."""
+        low, high = 0, self._size
+        timestamps = self._timestamps
+        start, capacity = self._start(), self.capacity
+        while low < high:
+            mid = (low + high) // 2
+            if timestamps[(start + mid) % capacity] < timestamp:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _range(self, start: Optional[float], end: Optional[float]) -> Tuple[int, int]:
+        """Return the logical [first, last) indexes for a time range."""
+        first = 0 if start is None else self._bisect(start)
+        last = self._size if end is None else self._bisect(end)
+        return first, max(first, last)
+
+    def _segments(self, first: int, last: int) -> List[Tuple[int, int]]:
+        """Split a logical range into at most two physical ranges."""
+        if first == last:
+            return []
+        begin = self._physical(first)
+        end = begin + (last - first)
+        if end <= self.capacity:
+            return [(begin, end)]
+        return [(begin, self.capacity), (0, end - self.capacity)]
+
+    def views(
+        self, metric: str, start: Optional[float] = None, end: Optional[float] = None
+    ) -> List[memoryview]:
+        """Return zero-copy views of a metric for a time range, oldest first.
+
+        As the buffer wraps around, the range is returned in one or two parts.
+
+        :param metric: metric (or "timestamp") to return
+        :param start: first timestamp to include (default: oldest sample)
+        :param end: timestamp to stop before (default: include newest sample)
+        """
+        column = self._timestamps if metric == "timestamp" else self._columns[metric]
+        view = memoryview(column)
+        segments = self._segments(*self._range(start, end))
+        return [view[begin:end_] for begin, end_ in segments]
+
+    def _samples(
+        self, metric: str, start: Optional[float], end: Optional[float]
+    ) -> Iterator[Tuple[int, float]]:
+        column = self._columns[metric]
+        timestamps = self._timestamps
+        for begin, end_ in self._segments(*self._range(start, end)):
+            for index in range(begin, end_):
+                yield timestamps[index], column[index]
+
+    def downsample(
+        self,
+        metric: str,
+        bucket: float,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> List[Tuple[int, float, float, float]]:
+        """Aggregate a metric into fixed width time buckets.
+
+        Missing readings are ignored, empty buckets are left out.
+
+        :param metric: metric to aggregate
+        :param bucket: bucket width in seconds
+        :param start: first timestamp to include (default: oldest sample)
+        :param end: timestamp to stop before (default: include newest sample)
+        :return: list of (bucket start, min, max, mean) tuples
+        """
+        result = []
+        current = None
+        low = high = total = 0.0
+        count = 0
+        for timestamp, value in self._samples(metric, start, end):
+            if math.isnan(value):
+                continue
+            bucket_start = int(timestamp // bucket * bucket)
+            if bucket_start != current:
+                if count:
+                    result.append((current, low, high, total / count))
+                current = bucket_start
+                low = high = total = value
+                count = 1
+                continue
+            if value < low:
+                low = value
+            elif value > high:
+                high = value
+            total += value
+            count += 1
+
+        if count:
+            result.append((current, low, high, total / count))
+
+        return result
+
+
+class EmeterHistory:
+    """In-memory emeter history for many devices, keyed by device id."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        metrics: Sequence[str] = DEFAULT_METRICS,
+        typecode: str = "f",
+    ) -> None:
+        """Create a new history, per-device buffers are created on first use."""
+        self.capacity = capacity
+        self.metrics = tuple(metrics)
+        self.typecode = typecode
+        self._buffers: Dict[str, EmeterRingBuffer] = {}
+
+    def append(
+        self, device_id: str, status: EmeterStatus, timestamp: Optional[float] = None
+    ) -> None:
+        """Store a reading for a device."""
+        try:
+            buffer = self._buffers[device_id]
+        except KeyError:
+            _LOGGER.debug("Allocating emeter history for %s", device_id)
+            buffer = self._buffers[device_id] = EmeterRingBuffer(
+                self.capacity, self.metrics, self.typecode
+            )
+        buffer.append(status, timestamp)
+
+    def __getitem__(self, device_id: str) -> EmeterRingBuffer:
+        return self._buffers[device_id]
+
+    def __contains__(self, device_id: str) -> bool:
+        return device_id in self._buffers
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def remove(self, device_id: str) -> None:
+        """Drop the history of a device."""
+        self._buffers.pop(device_id, None)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by all buffers in bytes."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
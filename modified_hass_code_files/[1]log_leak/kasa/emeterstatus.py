@@ -1,10 +1,43 @@
 """Module for emeter container."""
 import logging
-from typing import Optional
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional
+
 
 
 _LOGGER = logging.getLogger(__name__)
 
+_VALID_KEYS = frozenset(
+    [
+        "voltage_mv",
+        "power_mw",
+        "current_ma",
+        "energy_wh",
+        "total_wh",
+        "voltage",
+        "power",
+        "current",
+        "total",
+        "energy",
+    ]
+)
+
+# base unit key -> key postfixed with the milli unit used by newer firmware
+_UNIT_KEYS = {
+    "voltage": "voltage_mv",
+    "power": "power_mw",
+    "current": "current_ma",
+    "total": "total_wh",
+    "energy": "energy_wh",
+}
+
+# any valid key -> (slot holding the base unit value, scale to apply)
+_KEY_MAP = {
+    **{base: (f"_{base}", 1) for base in _UNIT_KEYS},
+    **{milli: (f"_{base}", 1000) for base, milli in _UNIT_KEYS.items()},
+}
+
 
 class EmeterStatus(dict):
     """Container for converting different representations of emeter data.
@@ -21,7 +54,8 @@ class EmeterStatus(dict):
         """Return voltage in V."""
 
         try:
-            _LOGGER.info("CustomLog || Kasa || EmeterStatus class || voltage method || Voltage: %sV", self["voltage"])
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("CustomLog || Kasa || EmeterStatus class || voltage method || Voltage: %sV", self["voltage"])
             return self["voltage"]
         except ValueError:
             return None
@@ -30,10 +64,10 @@ class EmeterStatus(dict):
     def power(self) -> Optional[float]:
         """Return power in W."""
         try:
-            #define variable for power and round up to 2 decimal places
-            emeterPower = round(self["power"],2)
-
-            _LOGGER.info(f"CustomLog || Kasa || EmeterStatus class || power method || Power: {emeterPower}W")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                #define variable for power and round up to 2 decimal places
+                emeterPower = round(self["power"],2)
+                _LOGGER.info(f"CustomLog || Kasa || EmeterStatus class || power method || Power: {emeterPower}W")
 
             return self["power"]
         except ValueError:
@@ -44,7 +78,8 @@ class EmeterStatus(dict):
         """Return current in A."""
 
         try:
-            _LOGGER.info("CustomLog || Kasa || EmeterStatus class || current method || Current: %sA", self["current"])
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("CustomLog || Kasa || EmeterStatus class || current method || Current: %sA", self["current"])
             return self["current"]
         except ValueError:
             return None
@@ -53,7 +88,8 @@ class EmeterStatus(dict):
     def total(self) -> Optional[float]:
         """Return total in kWh."""
         try:
-            _LOGGER.info("CustomLog || Kasa || EmeterStatus class || total method || Total consumption: %skWh", self["total"])
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("CustomLog || Kasa || EmeterStatus class || total method || Total consumption: %skWh", self["total"])
             return self["total"]
         except ValueError:
             return None
@@ -61,25 +97,12 @@ class EmeterStatus(dict):
     def __repr__(self):
 
 
-        _LOGGER.info(f"CustomLog || Kasa || EmeterStatus class || __repr__ method || power:{self.power}W ; voltage:{self.voltage}V ; current:{self.current}A ; total:{self.total}kWh")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || EmeterStatus class || __repr__ method || power:{self.power}W ; voltage:{self.voltage}V ; current:{self.current}A ; total:{self.total}kWh")
 
         return f"<EmeterStatus power={self.power} voltage={self.voltage} current={self.current} total={self.total}>"
 
     def __getitem__(self, item):
-        valid_keys = [
-            "voltage_mv",
-            "power_mw",
-            "current_ma",
-            "energy_wh",
-            "total_wh",
-            "voltage",
-            "power",
-            "current",
-            "total",
-            "energy",
-        ]
-
-
         # 1. if requested data is available, return it
         if item in super().keys():
             # _LOGGER.info(f"CustomLog || Kasa || EmeterStatus class || __getitem__ method || item: {item}")
@@ -87,7 +110,7 @@ class EmeterStatus(dict):
 
         # otherwise decide how to convert it
         else:
-            if item not in valid_keys:
+            if item not in _VALID_KEYS:
                 raise KeyError(item)
             if "_" in item:  # upscale
                 return super().__getitem__(item[: item.find("_")]) * 1000
@@ -98,3 +121,173 @@ class EmeterStatus(dict):
 
                 _LOGGER.debug(f"Unable to find value for '{item}'")
                 return None
+
+
+class NormalizedEmeterStatus(EmeterStatus):
+    """Emeter container which converts the units once, at construction.
+
+    Both naming conventions are normalized into base unit float slots,
+    so the accessors and item lookups do not search or convert anything.
+    Raw values are still returned as-is for keys present in the response.
+    """
+
+    __slots__ = tuple(f"_{base}" for base in _UNIT_KEYS)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._normalize()
+
+    def _normalize(self) -> None:
+        for base, milli in _UNIT_KEYS.items():
+            value = dict.get(self, base)
+            if value is None:
+                value = dict.get(self, milli)
+                if value is not None:
+                    value = value / 1000
+            setattr(self, f"_{base}", None if value is None else float(value))
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._normalize()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._normalize()
+
+    def update(self, *args, **kwargs):
+        """Update the data and normalize it again."""
+        super().update(*args, **kwargs)
+        self._normalize()
+
+    def pop(self, *args):
+        """Remove a key and normalize the data again."""
+        value = super().pop(*args)
+        self._normalize()
+        return value
+
+    def popitem(self):
+        """Remove the last item and normalize the data again."""
+        item = super().popitem()
+        self._normalize()
+        return item
+
+    def setdefault(self, key, default=None):
+        """Set a missing key and normalize the data again."""
+        value = super().setdefault(key, default)
+        self._normalize()
+        return value
+
+    def clear(self) -> None:
+        """Remove all data."""
+        super().clear()
+        self._normalize()
+
+    @property
+    def voltage(self) -> Optional[float]:
+        """Return voltage in V."""
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || EmeterStatus class || voltage method || Voltage: %sV", self._voltage)
+        return self._voltage
+
+    @property
+    def power(self) -> Optional[float]:
+        """Return power in W."""
+        if _LOGGER.isEnabledFor(logging.INFO) and self._power is not None:
+            #define variable for power and round up to 2 decimal places
+            emeterPower = round(self._power,2)
+            _LOGGER.info(f"CustomLog || Kasa || EmeterStatus class || power method || Power: {emeterPower}W")
+        return self._power
+
+    @property
+    def current(self) -> Optional[float]:
+        """Return current in A."""
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || EmeterStatus class || current method || Current: %sA", self._current)
+        return self._current
+
+    @property
+    def total(self) -> Optional[float]:
+        """Return total in kWh."""
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || EmeterStatus class || total method || Total consumption: %skWh", self._total)
+        return self._total
+
+    def __getitem__(self, item):
+        if dict.__contains__(self, item):
+            return dict.__getitem__(self, item)
+
+        slot, scale = _KEY_MAP[item]
+        value = getattr(self, slot)
+        if value is None:
+            return None
+        return value * scale
+
+
+class EmeterStats(Mapping):
+    """Daily or monthly energy statistics stored in typed arrays.
+
+    `keys` holds the day (or month) of each row and `values` the energy,
+    in kWh or Wh. The object itself is a read-only mapping from day/month
+    to energy, like the dict returned by the emeter statistics calls.
+    """
+
+    def __init__(self, entry_key: str, keys: array, values: array) -> None:
+        self.entry_key = entry_key
+        self.keys_array = keys
+        self.values_array = values
+        self._positions: Optional[Dict[int, int]] = None
+
+    def __getitem__(self, key: int) -> float:
+        if self._positions is None:
+            # later rows win, as they would when building a dict
+            self._positions = {k: i for i, k in enumerate(self.keys_array)}
+        return self.values_array[self._positions[key]]
+
+    def __iter__(self) -> Iterator[int]:
+        if self._positions is not None:
+            return iter(self._positions)
+        return iter(dict.fromkeys(self.keys_array))
+
+    def __len__(self) -> int:
+        if self._positions is not None:
+            return len(self._positions)
+        return len(set(self.keys_array))
+
+    def as_dict(self) -> Dict[int, float]:
+        """Return the statistics as a plain dict."""
+        return dict(zip(self.keys_array, self.values_array))
+
+    def __repr__(self):
+        return f"<EmeterStats {self.entry_key} rows={len(self.keys_array)}>"
+
+
+def convert_emeter_stats(data: List[Dict], kwh: bool = True) -> EmeterStats:
+    """Convert a raw day_list or month_list into an EmeterStats.
+
+    Rows are converted in a single pass, without creating an EmeterStatus
+    for each of them.
+
+    :param data: list of rows as returned by get_daystat/get_monthstat
+    :param kwh: return energy in kWh instead of Wh
+    """
+    if not data:
+        return EmeterStats("day", array("H"), array("d"))
+
+    first = data[0]
+    entry_key = "day" if "day" in first else "month"
+    raw_key = "energy_wh" if "energy_wh" in first else "energy"
+
+    keys = array("H", [row[entry_key] for row in data])
+    try:
+        if raw_key == "energy_wh" and kwh:
+            values = array("d", [row[raw_key] / 1000 for row in data])
+        elif raw_key == "energy" and not kwh:
+            values = array("d", [row[raw_key] * 1000 for row in data])
+        else:
+            values = array("d", [row[raw_key] for row in data])
+    except KeyError:
+        # firmware mixing both unit conventions, convert row by row
+        energy_key = "energy" if kwh else "energy_wh"
+        values = array("d", [EmeterStatus(**row)[energy_key] for row in data])
+
+    return EmeterStats(entry_key, keys, values)
@@ -0,0 +1,157 @@
+"""Module for streaming realtime emeter readings to many consumers."""
+import asyncio
+import logging
+from collections import deque
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Deque, Iterable, List, Optional, Set, Tuple
+
+from .exceptions import SmartDeviceException
+
+if TYPE_CHECKING:
+    from .smartdevice import SmartDevice
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EmeterSubscription:
+    """Async iterator over the readings of an :class:`EmeterStream`.
+
+    Every subscriber gets a bounded buffer. When a slow consumer lets it fill
+    up the oldest reading is dropped, so with the default size of one the
+    consumer always gets the latest reading and never queues up old ones.
+    """
+
+    def __init__(self, stream: "EmeterStream", maxsize: int = 1) -> None:
+        if maxsize < 1:
+            raise SmartDeviceException("maxsize needs to be at least 1")
+
+        self._stream = stream
+        self._maxsize = maxsize
+        self._buffer: Deque[Tuple[float, Any]] = deque()
+        self._event = asyncio.Event()
+        self._closed = False
+        # readings dropped because the consumer was too slow
+        self.dropped = 0
+        self.delivered = 0
+        # seconds between a reading being received and being consumed
+        self.lag = 0.0
+        self.max_lag = 0.0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of readings waiting to be consumed."""
+        return len(self._buffer)
+
+    def _push(self, item: Any, received: float) -> None:
+        if len(self._buffer) >= self._maxsize:
+            self._buffer.popleft()
+            self.dropped += 1
+        self._buffer.append((received, item))
+        self._event.set()
+
+    def __aiter__(self) -> "EmeterSubscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._buffer:
+            if self._closed:
+                raise StopAsyncIteration
+            self._event.clear()
+            await self._event.wait()
+
+        received, item = self._buffer.popleft()
+        self.delivered += 1
+        self.lag = monotonic() - received
+        if self.lag > self.max_lag:
+            self.max_lag = self.lag
+        return item
+
+    def close(self) -> None:
+        """Stop receiving readings, the iteration ends once drained."""
+        if self._closed:
+            return
+        self._closed = True
+        self._event.set()
+        self._stream._unsubscribe(self)
+
+    async def __aenter__(self) -> "EmeterSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+
+class EmeterStream:
+    """Poll realtime emeter readings once and share them between subscribers.
+
+    A single task queries the devices every `interval` seconds while there are
+    subscribers, and stops when the last one goes away. Streams created for
+    a single device yield :class:`EmeterStatus` objects, streams over several
+    devices yield (device, EmeterStatus) tuples.
+
+    Examples (need reachable devices):
+        >>> from kasa import SmartPlug
+        >>> plugs = [SmartPlug("192.168.0.10"), SmartPlug("192.168.0.11")]
+        >>> stream = EmeterStream(plugs, interval=5)
+        >>> async with stream.subscribe() as readings:  # doctest: +SKIP
+        ...     async for dev, status in readings:
+        ...         print(dev.alias, status.power)
+    """
+
+    def __init__(
+        self, devices: Iterable["SmartDevice"], interval: float = 5, fleet: bool = True
+    ) -> None:
+        """Create a new stream.
+
+        :param devices: devices to query
+        :param interval: seconds between queries
+        :param fleet: yield (device, reading) tuples instead of readings
+        """
+        self.devices: List["SmartDevice"] = list(devices)
+        self.interval = interval
+        self.fleet = fleet
+        self.errors = 0
+        self._subscribers: Set[EmeterSubscription] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, maxsize: int = 1) -> EmeterSubscription:
+        """Subscribe to the readings, starting the polling if needed.
+
+        :param maxsize: readings buffered for the subscriber before dropping
+        """
+        subscription = EmeterSubscription(self, maxsize)
+        self._subscribers.add(subscription)
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll())
+        return subscription
+
+    def _unsubscribe(self, subscription: EmeterSubscription) -> None:
+        self._subscribers.discard(subscription)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @property
+    def subscribers(self) -> int:
+        """Return the number of subscribers."""
+        return len(self._subscribers)
+
+    async def _poll(self) -> None:
+        while True:
+            started = monotonic()
+            results = await asyncio.gather(
+                *(dev.get_emeter_realtime() for dev in self.devices),
+                return_exceptions=True,
+            )
+            received = monotonic()
+            for dev, result in zip(self.devices, results):
+                if isinstance(result, BaseException):
+                    self.errors += 1
+                    _LOGGER.debug("Unable to read emeter of %s: %s", dev.host, result)
+                    continue
+                item = (dev, result) if self.fleet else result
+                for subscription in self._subscribers:
+                    subscription._push(item, received)
+
+            await asyncio.sleep(max(0.0, self.interval - (monotonic() - started)))
@@ -0,0 +1,108 @@
+"""Module for plausibility checks of emeter readings."""
+import logging
+from typing import Dict
+
+from .emeterstatus import EmeterStatus
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EmeterValidator:
+    """Check emeter readings for physically implausible values.
+
+    The checks are cheap enough to run on every reading:
+
+    * power has to be between `min_power_factor` and `1 + tolerance` times
+      the apparent power (voltage * current),
+    * no value may be negative,
+    * the total consumption of a device may never decrease.
+
+    Violations are only counted, the offending readings are returned as-is.
+
+    Examples:
+        >>> validator = EmeterValidator()
+        >>> validator.check("plug1", EmeterStatus(power=0, voltage=230, current=0.5))
+        False
+        >>> validator.violations
+        {'power_mismatch': 1, 'negative': 0, 'total_decrease': 0}
+    """
+
+    __slots__ = (
+        "tolerance",
+        "min_power_factor",
+        "min_apparent_power",
+        "samples",
+        "power_mismatch",
+        "negative",
+        "total_decrease",
+        "_totals",
+    )
+
+    def __init__(
+        self,
+        tolerance: float = 0.1,
+        min_power_factor: float = 0.1,
+        min_apparent_power: float = 1.0,
+    ) -> None:
+        """Create a new validator.
+
+        :param tolerance: relative error allowed above the apparent power
+        :param min_power_factor: lowest accepted ratio of power to apparent power
+        :param min_apparent_power: apparent power (VA) below which readings
+                                   are considered idle noise
+        """
+        self.tolerance = tolerance
+        self.min_power_factor = min_power_factor
+        self.min_apparent_power = min_apparent_power
+        self.samples = 0
+        self.power_mismatch = 0
+        self.negative = 0
+        self.total_decrease = 0
+        self._totals: Dict[str, float] = {}
+
+    def check(self, device_id: str, status: EmeterStatus) -> bool:
+        """Check a reading, return False if it violates any invariant."""
+        self.samples += 1
+        valid = True
+
+        power = status.power
+        voltage = status.voltage
+        current = status.current
+        if power is not None and voltage is not None and current is not None:
+            if power < 0 or voltage < 0 or current < 0:
+                self.negative += 1
+                valid = False
+            else:
+                apparent = voltage * current
+                if apparent < self.min_apparent_power:
+                    apparent = self.min_apparent_power
+                    lower = 0.0
+                else:
+                    lower = apparent * self.min_power_factor
+                if power > apparent * (1 + self.tolerance) or power < lower:
+                    self.power_mismatch += 1
+                    valid = False
+
+        total = status.total
+        if total is not None:
+            last = self._totals.get(device_id)
+            if last is not None and total < last:
+                self.total_decrease += 1
+                valid = False
+            self._totals[device_id] = total
+
+        return valid
+
+    def reset(self, device_id: str) -> None:
+        """Forget the last total of a device, e.g. after erasing its statistics."""
+        self._totals.pop(device_id, None)
+
+    @property
+    def violations(self) -> Dict[str, int]:
+        """Return the violation counters."""
+        return {
+            "power_mismatch": self.power_mismatch,
+            "negative": self.negative,
+            "total_decrease": self.total_decrease,
+        }
@@ -36,7 +36,8 @@ class TPLinkSmartHomeProtocol:
     def __init__(self, host: str) -> None:
         """Create a protocol object."""
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || __init__ method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || __init__ method")        
 
         self.host = host
         self.reader: Optional[asyncio.StreamReader] = None
@@ -47,7 +48,8 @@ class TPLinkSmartHomeProtocol:
     def _detect_event_loop_change(self) -> None:
         """Check if this object has been reused betwen event loops."""
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _detect_event_loop_change method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _detect_event_loop_change method")
 
         loop = asyncio.get_running_loop()
         if not self.loop:
@@ -56,18 +58,21 @@ class TPLinkSmartHomeProtocol:
             _LOGGER.warning("Detected protocol reuse between different event loop")
             self._reset()
 
-    async def query(self, request: Union[str, Dict], retry_count: int = 3) -> Dict:
+    async def query(
+        self, request: Union[str, Dict, bytes], retry_count: int = 3
+    ) -> Dict:
         """Request information from a TP-Link SmartHome Device.
 
         :param str host: host name or ip address of the device
-        :param request: command to send to the device (can be either dict or
-        json string)
+        :param request: command to send to the device (can be either dict,
+        json string or a frame already produced by :func:`encode_request`)
         :param retry_count: how many retries to do in case of failure
         :return: response dict
         """
         self._detect_event_loop_change()
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || query method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || query method")        
 
         if not self.query_lock:
             self.query_lock = asyncio.Lock()
@@ -84,7 +89,8 @@ class TPLinkSmartHomeProtocol:
     async def _connect(self, timeout: int) -> None:
         """Try to connect or reconnect to the device."""
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _connect method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _connect method")
 
         if self.writer:
             return
@@ -97,12 +103,14 @@ class TPLinkSmartHomeProtocol:
         #define variable for plug default port
         plugPort = TPLinkSmartHomeProtocol.DEFAULT_PORT
 
-        _LOGGER.info(f"CustomLog || Kasa || TPLinkSmartHomeProtocol class || _connect method || Host: {self.host} ; Default port: {plugPort}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || TPLinkSmartHomeProtocol class || _connect method || Host: {self.host} ; Default port: {plugPort}")
 
-    async def _execute_query(self, request: str) -> Dict:
+    async def _execute_query(self, request: Union[str, bytes]) -> Dict:
         """Execute a query on the device and wait for the response."""
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _execute_query method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _execute_query method")
 
         assert self.writer is not None
         assert self.reader is not None
@@ -110,7 +118,10 @@ class TPLinkSmartHomeProtocol:
 
         if debug_log:
             _LOGGER.debug("%s >> %s", self.host, request)
-        self.writer.write(TPLinkSmartHomeProtocol.encrypt(request))
+        if isinstance(request, bytes):
+            self.writer.write(request)
+        else:
+            self.writer.write(TPLinkSmartHomeProtocol.encrypt(request))
         await self.writer.drain()
 
         packed_block_size = await self.reader.readexactly(self.BLOCK_SIZE)
@@ -127,7 +138,8 @@ class TPLinkSmartHomeProtocol:
     async def close(self) -> None:
         """Close the connection."""
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || close method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || close method")
 
         writer = self.writer
         self.reader = self.writer = None
@@ -139,11 +151,14 @@ class TPLinkSmartHomeProtocol:
     def _reset(self) -> None:
         """Clear any varibles that should not survive between loops."""
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || reset method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || reset method")        
 
         self.reader = self.writer = self.loop = self.query_lock = None
 
-    async def _query(self, request: str, retry_count: int, timeout: int) -> Dict:
+    async def _query(
+        self, request: Union[str, bytes], retry_count: int, timeout: int
+    ) -> Dict:
         """Try to query a device."""
         #
         #Most of the time we will already be connected if the device is online
@@ -156,7 +171,8 @@ class TPLinkSmartHomeProtocol:
         #
 
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _query method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _query method")
 
         for retry in range(retry_count + 1):
             try:
@@ -206,7 +222,8 @@ class TPLinkSmartHomeProtocol:
 
     def __del__(self) -> None:
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || __del__ method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || __del__ method")
 
         if self.writer and self.loop and self.loop.is_running():
             #Since __del__ will be called when python does
@@ -219,7 +236,8 @@ class TPLinkSmartHomeProtocol:
     @staticmethod
     def _xor_payload(unencrypted: bytes) -> Generator[int, None, None]:
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _xor_payload method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _xor_payload method")
 
         key = TPLinkSmartHomeProtocol.INITIALIZATION_VECTOR
         for unencryptedbyte in unencrypted:
@@ -234,20 +252,38 @@ class TPLinkSmartHomeProtocol:
         :return: ciphertext to be send over wire, in bytes
         """
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || encrypt method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || encrypt method")
 
         plainbytes = request.encode()
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || encrypt method || encrypted payload: %s", (struct.pack(">I", len(plainbytes)) + bytes(TPLinkSmartHomeProtocol._xor_payload(plainbytes))))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || encrypt method || encrypted payload: %s", (struct.pack(">I", len(plainbytes)) + bytes(TPLinkSmartHomeProtocol._xor_payload(plainbytes))))
 
         return struct.pack(">I", len(plainbytes)) + bytes(
             TPLinkSmartHomeProtocol._xor_payload(plainbytes)
         )
 
+    @staticmethod
+    def encode_request(request: Union[str, Dict]) -> bytes:
+        """Serialize and encrypt a request once so it can be sent many times.
+
+        The returned frame can be passed to :func:`query` in place of the
+        request, skipping json encoding and encryption on every send.
+
+        :param request: command to encode (either dict or json string)
+        :return: ciphertext frame, in bytes
+        """
+        if isinstance(request, dict):
+            request = json.dumps(request)
+
+        return TPLinkSmartHomeProtocol.encrypt(request)
+
     @staticmethod
     def _xor_encrypted_payload(ciphertext: bytes) -> Generator[int, None, None]:
 
-        _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _xor_encrypted_payload method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || TPLinkSmartHomeProtocol class || _xor_encrypted_payload method")
 
         key = TPLinkSmartHomeProtocol.INITIALIZATION_VECTOR
         for cipherbyte in ciphertext:
@@ -267,7 +303,8 @@ class TPLinkSmartHomeProtocol:
         decryptedPayload = (bytes(TPLinkSmartHomeProtocol._xor_encrypted_payload(ciphertext)).decode())
 
         #write to homeassistant's logfile
-        _LOGGER.info(f"CustomLog || Kasa || TPLinkSmartHomeProtocol class || decrypt method || decrypted payload: {decryptedPayload}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || TPLinkSmartHomeProtocol class || decrypt method || decrypted payload: {decryptedPayload}")
 
         return bytes(
             TPLinkSmartHomeProtocol._xor_encrypted_payload(ciphertext)
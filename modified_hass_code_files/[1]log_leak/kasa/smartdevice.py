@@ -11,6 +11,7 @@ Stroetmann which is licensed under the Apache License, Version 2.0.
 You may obtain a copy of the license at
 http://www.apache.org/licenses/LICENSE-2.0
 """
+import asyncio
 import collections.abc
 import functools
 import inspect
@@ -18,9 +19,22 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Set
-
-from .emeterstatus import EmeterStatus
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .emeterstatus import EmeterStatus, NormalizedEmeterStatus, convert_emeter_stats
+from .emeterstream import EmeterStream, EmeterSubscription
+from .emetervalidator import EmeterValidator
 from .exceptions import SmartDeviceException
 from .modules import Emeter, Module
 from .protocol import TPLinkSmartHomeProtocol
@@ -40,7 +54,8 @@ class DeviceType(Enum):
     LightStrip = auto()
     Unknown = -1
 
-    _LOGGER.info(f"CustomLog || Kasa || DeviceType class || NA || Device details - Plug: {Plug} ; Bulb: {Bulb} ; Strip: {Strip} ; StripSocket: {StripSocket} ; Dimmer: {Dimmer} ; LightStrip: {LightStrip}")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(f"CustomLog || Kasa || DeviceType class || NA || Device details - Plug: {Plug} ; Bulb: {Bulb} ; Strip: {Strip} ; StripSocket: {StripSocket} ; Dimmer: {Dimmer} ; LightStrip: {LightStrip}")
 
 
 @dataclass
@@ -59,7 +74,8 @@ class WifiNetwork:
 def merge(d, u):
     """Update dict recursively."""
 
-    _LOGGER.info("CustomLog || Kasa || WifiNetwork class || merge method")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("CustomLog || Kasa || WifiNetwork class || merge method")
 
     for k, v in u.items():
         if isinstance(v, collections.abc.Mapping):
@@ -69,10 +85,21 @@ def merge(d, u):
     return d
 
 
+SubscriptionCallback = Callable[["SmartDevice", Set[str]], None]
+
+
+def _child_aliases(sys_info) -> List[str]:
+    """Return the aliases of the children reported in sysinfo."""
+    if not sys_info:
+        return []
+    return [child.get("alias") for child in sys_info.get("children", [])]
+
+
 def requires_update(f):
     """Indicate that `update` should be called before accessing this method."""  # noqa: D202
 
-    _LOGGER.info("CustomLog || Kasa || WifiNetwork class || requires_update method")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("CustomLog || Kasa || WifiNetwork class || requires_update method")
 
     if inspect.iscoroutinefunction(f):
 
@@ -197,6 +224,23 @@ class SmartDevice:
 
     emeter_type = "emeter"
 
+    # Bumped whenever any device drops its child index,
+    # allows fleet-wide indexes to detect staleness with a single comparison.
+    _child_index_generation = 0
+
+    # How often the background clock sync re-reads the device clock (in seconds)
+    CLOCK_SYNC_INTERVAL = 3600
+
+    # When set, every update checks the realtime emeter reading for plausibility
+    emeter_validator: Optional[EmeterValidator] = None
+
+    # How long wifi scan results are reused (in seconds)
+    WIFI_SCAN_TTL = 60
+    # Scan results and in-flight scans shared by all devices, keyed by host
+    # or by the scan group passed to wifi_scan
+    _wifi_scans: Dict[str, Tuple[float, List[WifiNetwork]]] = {}
+    _wifi_scan_tasks: Dict[str, asyncio.Task] = {}
+
     def __init__(self, host: str) -> None:
         """Create a new SmartDevice instance.
 
@@ -206,7 +250,8 @@ class SmartDevice:
 
         self.protocol = TPLinkSmartHomeProtocol(host)
         _LOGGER.debug("Initializing %s of type %s", self.host, type(self))
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || __init__ method || Initializing host [{self.host}] of type {type(self)}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || __init__ method || Initializing host [{self.host}] of type {type(self)}")
 
         self._device_type = DeviceType.Unknown
         # TODO: typing Any is just as using Optional[Dict] would require separate checks in
@@ -216,16 +261,135 @@ class SmartDevice:
         self._sys_info: Any = None  # TODO: this is here to avoid changing tests
         self.modules: Dict[str, Any] = {}
 
-        self.children: List["SmartDevice"] = []
+        self._children: List["SmartDevice"] = []
+        self._children_by_alias: Optional[Dict[str, "SmartDevice"]] = None
+        self._children_by_id: Optional[Dict[str, "SmartDevice"]] = None
+
+        # Device clock captured at host monotonic time _clock_mono,
+        # `time` is derived from these without touching the time module.
+        self._clock_base: Optional[datetime] = None
+        self._clock_mono = 0.0
+        self._clock_sync_task: Optional[asyncio.Task] = None
+        self._on_since: Optional[datetime] = None
+        # sys_info _on_since was derived from, it is anchored once per update
+        self._on_since_info: Any = None
+
+        # callback -> fields it is interested in
+        self._subscribers: Dict[SubscriptionCallback, FrozenSet[str]] = {}
+        # last seen values of all subscribed fields
+        self._field_values: Dict[str, Any] = {}
+        # interval -> shared realtime emeter stream
+        self._emeter_streams: Dict[float, EmeterStream] = {}
+
+    @property
+    def children(self) -> List["SmartDevice"]:
+        """Return child devices."""
+        return self._children
+
+    @children.setter
+    def children(self, children: List["SmartDevice"]) -> None:
+        self._children = children
+        self._invalidate_child_index()
+
+    def _invalidate_child_index(self) -> None:
+        """Drop the child lookup indexes, they are rebuilt on next lookup."""
+        self._children_by_alias = self._children_by_id = None
+        SmartDevice._child_index_generation += 1
+
+    def _child_index(
+        self,
+    ) -> Tuple[Dict[str, "SmartDevice"], Dict[str, "SmartDevice"]]:
+        """Return (by alias, by device id) child indexes, building them if needed.
+
+        The size check catches children appended in-place to the list.
+        """
+        if self._children_by_id is None or len(self._children_by_id) != len(
+            self._children
+        ):
+            self._build_child_index()
+        assert self._children_by_alias is not None
+        assert self._children_by_id is not None
+
+        return self._children_by_alias, self._children_by_id
+
+    def _build_child_index(self) -> None:
+        """Index children by their alias and device id."""
+        by_alias: Dict[str, "SmartDevice"] = {}
+        by_id: Dict[str, "SmartDevice"] = {}
+        for child in self._children:
+            # keep the first match for duplicate aliases, as the linear scan did
+            by_alias.setdefault(child.alias, child)
+            by_id[child.device_id] = child
+
+        self._children_by_alias = by_alias
+        self._children_by_id = by_id
+
+    def subscribe(
+        self, fields: Iterable[str], callback: "SubscriptionCallback"
+    ) -> Callable[[], None]:
+        """Call `callback` when any of the given properties change.
+
+        The callback receives the device and the set of changed field names,
+        and is called at most once per update regardless of how many of its
+        fields changed. Fields are names of properties, e.g. `is_on`
+        or `emeter_realtime`.
+
+        :param fields: names of the properties to watch
+        :param callback: callable(device, changed_fields)
+        :return: callable removing the subscription
+        """
+        fields = frozenset(fields)
+        self._subscribers[callback] = fields
+        if self._last_update is not None:
+            # record the current values so only later changes are reported
+            for field in fields - self._field_values.keys():
+                self._field_values[field] = self._read_field(field)
+
+        def _unsubscribe():
+            self._subscribers.pop(callback, None)
+
+        return _unsubscribe
+
+    def _read_field(self, field: str) -> Any:
+        try:
+            return getattr(self, field)
+        except (SmartDeviceException, KeyError, NotImplementedError):
+            return None
+
+    def _notify_subscribers(self) -> None:
+        """Dispatch changed fields to subscribers, once per callback."""
+        if not self._subscribers:
+            return
+
+        watched: Set[str] = set().union(*self._subscribers.values())
+        changed = set()
+        for field in watched:
+            value = self._read_field(field)
+            if field not in self._field_values or self._field_values[field] != value:
+                self._field_values[field] = value
+                changed.add(field)
+
+        if not changed:
+            return
+
+        for callback, fields in list(self._subscribers.items()):
+            if fields.isdisjoint(changed):
+                continue
+            try:
+                callback(self, fields & changed)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in subscriber of %s", self.host)
 
     def add_module(self, name: str, module: Module):
         """Register a module."""
         if name in self.modules:
             _LOGGER.debug("Module %s already registered, ignoring..." % name)
-            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || add_module method || Ignoring module {name} since it is already registered")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || add_module method || Ignoring module {name} since it is already registered")
             return
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || add_module method || Registering module: {name not in self.modules}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || add_module method || Registering module: {name not in self.modules}")
 
         assert name not in self.modules
 
@@ -236,20 +400,23 @@ class SmartDevice:
         self, target: str, cmd: str, arg: Optional[Dict] = None, child_ids=None
     ):
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || _create_request method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || _create_request method")
 
         request: Dict[str, Any] = {target: {cmd: arg}}
         if child_ids is not None:
             request = {"context": {"child_ids": child_ids}, target: {cmd: arg}}
 
-            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || _create_request method || Request - {request}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || _create_request method || Request - {request}")
 
         return request
 
     def _verify_emeter(self) -> None:
         """Raise an exception if there is no emeter."""
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || _verify_emeter method || has_emeter? {self.has_emeter}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || _verify_emeter method || has_emeter? {self.has_emeter}")
 
         if not self.has_emeter:
             raise SmartDeviceException("Device has no emeter")
@@ -274,6 +441,38 @@ class SmartDevice:
         except Exception as ex:
             raise SmartDeviceException(f"Communication error on {target}:{cmd}") from ex
 
+        result = self._unwrap_response(target, cmd, response)
+
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || _query_helper method || Request - {request}")        
+
+        return result
+
+    async def _query_encoded(
+        self, frame: bytes, request: Dict, target: str, cmd: str
+    ) -> Any:
+        """Send a pre-encoded request frame, return results or raise an exception.
+
+        :param frame: request encoded with :func:`TPLinkSmartHomeProtocol.encode_request`
+        :param request: the request the frame was encoded from
+        :param target: Target system the frame was built for
+        :param cmd: Command the frame was built for
+        :return: Unwrapped result for the call.
+        """
+        try:
+            response = await self.protocol.query(request=frame)
+        except Exception as ex:
+            raise SmartDeviceException(f"Communication error on {target}:{cmd}") from ex
+
+        result = self._unwrap_response(target, cmd, response)
+
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || _query_helper method || Request - {request}")
+
+        return result
+
+    def _unwrap_response(self, target: str, cmd: str, response: Dict) -> Any:
+        """Return the result for target and cmd or raise an exception."""
         if target not in response:
             raise SmartDeviceException(f"No required {target} in response: {response}")
 
@@ -290,8 +489,6 @@ class SmartDevice:
         if "err_code" in result:
             del result["err_code"]
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || _query_helper method || Request - {request}")        
-
         return result
 
     @property  # type: ignore
@@ -300,7 +497,8 @@ class SmartDevice:
         """Return a set of features that the device supports."""
         try:
 
-            _LOGGER.info("CustomLog || Kasa || SmartDevice class || features method || Features: %s", set(self.sys_info["feature"].split(":")))  
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("CustomLog || Kasa || SmartDevice class || features method || Features: %s", set(self.sys_info["feature"].split(":")))  
 
             return set(self.sys_info["feature"].split(":"))
         except KeyError:
@@ -320,14 +518,16 @@ class SmartDevice:
     def has_emeter(self) -> bool:
         """Return True if device has an energy meter."""
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || has_emeter method || Has energy meter? {'ENE' in self.features}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || has_emeter method || Has energy meter? {'ENE' in self.features}")
 
         return "ENE" in self.features
 
     async def get_sys_info(self) -> Dict[str, Any]:
         """Retrieve system information."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || get_sys_info method || System info: %s", self._query_helper("system", "get_sysinfo"))     
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || get_sys_info method || System info: %s", self._query_helper("system", "get_sysinfo"))     
 
         return await self._query_helper("system", "get_sysinfo")
 
@@ -339,7 +539,8 @@ class SmartDevice:
         req = {}
         req.update(self._create_request("system", "get_sysinfo"))
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || update method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || update method")
 
 
         # If this is the initial update, check only for the sysinfo
@@ -349,17 +550,32 @@ class SmartDevice:
             _LOGGER.debug("Performing the initial update to obtain sysinfo")
             self._last_update = await self.protocol.query(req)
             self._sys_info = self._last_update["system"]["get_sysinfo"]
-            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || update method || Initial system info update: {self._sys_info}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || update method || Initial system info update: {self._sys_info}")
 
+        old_sys_info = self._sys_info
         await self._modular_update(req)
         self._sys_info = self._last_update["system"]["get_sysinfo"]
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || update method || Last system info update: {self._sys_info}")
+        if self._children and _child_aliases(old_sys_info) != _child_aliases(
+            self._sys_info
+        ):
+            self._invalidate_child_index()
+        self._update_clock()
+        if self.emeter_validator is not None and "emeter" in self.modules:
+            self.emeter_validator.check(self.host, self.emeter_realtime)
+        self._notify_subscribers()
+        # strip sockets read their state from the sysinfo of the parent
+        for child in self._children:
+            child._notify_subscribers()
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || update method || Last system info update: {self._sys_info}")
 
 
     async def _modular_update(self, req: dict) -> None:
         """Execute an update query."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || _modular_update method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || _modular_update method")
 
         if self.has_emeter:
             _LOGGER.debug(
@@ -380,10 +596,14 @@ class SmartDevice:
     def update_from_discover_info(self, info):
         """Update state from info from the discover call."""
         self._last_update = info
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || update_from_discover_info method || Info: {self._last_update}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || update_from_discover_info method || Info: {self._last_update}")
 
         self._sys_info = info["system"]["get_sysinfo"]
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || update_from_discover_info method || Update system info: {self._sys_info}")
+        self._update_clock()
+        self._notify_subscribers()
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || update_from_discover_info method || Update system info: {self._sys_info}")
 
 
     @property  # type: ignore
@@ -391,7 +611,8 @@ class SmartDevice:
     def sys_info(self) -> Dict[str, Any]:
         """Return system information."""
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || sys_info method || sys_info: {self._sys_info}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || sys_info method || sys_info: {self._sys_info}")
 
         return self._sys_info  # type: ignore
 
@@ -401,7 +622,8 @@ class SmartDevice:
         """Return device model."""
         sys_info = self.sys_info
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || model method || Device model: {str(sys_info['model'])}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || model method || Device model: {str(sys_info['model'])}")
 
         return str(sys_info["model"])
 
@@ -411,32 +633,115 @@ class SmartDevice:
         """Return device name (alias)."""
         sys_info = self.sys_info
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || alias method || Device alias: {str(sys_info['alias'])}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || alias method || Device alias: {str(sys_info['alias'])}")
 
         return str(sys_info["alias"])
 
     async def set_alias(self, alias: str) -> None:
         """Set the device name (alias)."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || set_alias method || alias: %s", self._query_helper("system", "set_dev_alias", {"alias": alias}))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || set_alias method || alias: %s", self._query_helper("system", "set_dev_alias", {"alias": alias}))
+
+        res = await self._query_helper("system", "set_dev_alias", {"alias": alias})
 
-        return await self._query_helper("system", "set_dev_alias", {"alias": alias})
+        parent = getattr(self, "parent", None)
+        if parent is not None:
+            parent._invalidate_child_index()
+
+        return res
+
+    def _update_clock(self) -> None:
+        """Capture the device clock and on-time from the latest update."""
+        self._anchor_on_since()
+
+        device_time = None
+        if "time" in self.modules:
+            try:
+                device_time = self.modules["time"].time
+            except (KeyError, TypeError, SmartDeviceException) as ex:
+                _LOGGER.debug("Unable to read device time: %s", ex)
+        self._sync_clock(device_time)
+
+    def _anchor_on_since(self) -> None:
+        """Derive the switch-on time from the on_time of the latest sys_info."""
+        self._on_since_info = self._sys_info
+        on_time = self._sys_info.get("on_time")
+        if on_time is None:
+            self._on_since = None
+        else:
+            self._on_since = datetime.now().replace(microsecond=0) - timedelta(
+                seconds=on_time
+            )
+
+    def _sync_clock(self, device_time: Optional[datetime]) -> None:
+        """Anchor the device clock to the host monotonic clock."""
+        self._clock_base = device_time
+        self._clock_mono = monotonic()
+
+    async def sync_clock(self) -> Optional[datetime]:
+        """Re-read the device clock, correcting drift of the derived `time`."""
+        if "time" not in self.modules:
+            return None
+
+        device_time = await self.modules["time"].get_time()
+        self._sync_clock(device_time)
+        return device_time
+
+    def start_clock_sync(self, interval: Optional[float] = None) -> asyncio.Task:
+        """Start re-reading the device clock in the background.
+
+        :param interval: seconds between syncs (default: CLOCK_SYNC_INTERVAL)
+        """
+        if interval is None:
+            interval = self.CLOCK_SYNC_INTERVAL
+
+        async def _sync_loop():
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.sync_clock()
+                except SmartDeviceException as ex:
+                    _LOGGER.debug("Clock sync failed for %s: %s", self.host, ex)
+
+        self.stop_clock_sync()
+        self._clock_sync_task = asyncio.create_task(_sync_loop())
+        return self._clock_sync_task
+
+    def stop_clock_sync(self) -> None:
+        """Stop the background clock sync."""
+        if self._clock_sync_task is not None:
+            self._clock_sync_task.cancel()
+            self._clock_sync_task = None
 
     @property  # type: ignore
     @requires_update
     def time(self) -> datetime:
-        """Return current time from the device."""
+        """Return current time from the device.
+
+        This is derived from the device clock captured at the last update
+        (or clock sync) plus the host time elapsed since then.
+        """
+        if self._clock_base is None:
+            device_time = self.modules["time"].time
+        else:
+            device_time = self._clock_base + timedelta(
+                seconds=monotonic() - self._clock_mono
+            )
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || time method || Device current time: {self.modules['time'].time}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || time method || Device current time: {device_time}")
 
-        return self.modules["time"].time
+        return device_time
 
     @property  # type: ignore
     @requires_update
     def timezone(self) -> Dict:
         """Return the current timezone."""
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || timezone method || Device current timezone: {self.modules['time'].timezone}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || timezone method || Device current timezone: {self.modules['time'].timezone}")
 
         return self.modules["time"].timezone
 
@@ -446,9 +751,12 @@ class SmartDevice:
             "Use `time` property instead, this call will be removed in the future."
         )
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_time method || Get current device time: {self.modules['time'].get_time()}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_time method || Get current device time: {self.modules['time'].get_time()}")
 
-        return await self.modules["time"].get_time()
+        device_time = await self.modules["time"].get_time()
+        self._sync_clock(device_time)
+        return device_time
 
     async def get_timezone(self) -> Dict:
         """Return timezone information."""
@@ -456,7 +764,8 @@ class SmartDevice:
             "Use `timezone` property instead, this call will be removed in the future."
         )
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_timezone method || Get current device timezone: {self.modules['time'].get_timezone()}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_timezone method || Get current device timezone: {self.modules['time'].get_timezone()}")
 
         return await self.modules["time"].get_timezone()
 
@@ -482,7 +791,8 @@ class SmartDevice:
 
         sys_info = self.sys_info
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || hw_info method || System hardware info: {sys_info}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || hw_info method || System hardware info: {sys_info}")
 
         return {key: sys_info[key] for key in keys if key in sys_info}
 
@@ -496,15 +806,18 @@ class SmartDevice:
         if "latitude" in sys_info and "longitude" in sys_info:
             loc["latitude"] = sys_info["latitude"]
             loc["longitude"] = sys_info["longitude"]
-            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || location method || Device coordinates - Latitude: {loc['latitude']} ; Longitude: {loc['longitude']}")            
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || location method || Device coordinates - Latitude: {loc['latitude']} ; Longitude: {loc['longitude']}")            
         elif "latitude_i" in sys_info and "longitude_i" in sys_info:
             loc["latitude"] = sys_info["latitude_i"] / 10000
             loc["longitude"] = sys_info["longitude_i"] / 10000
-            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || location method || Device coordinates - Latitude/10000: {loc['latitude_i']} ; Longitude/10000: {loc['longitude_i']}")                        
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || location method || Device coordinates - Latitude/10000: {loc['latitude_i']} ; Longitude/10000: {loc['longitude_i']}")                        
         else:
             _LOGGER.debug("Unsupported device location.")
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || location method || Device location: {loc}")           
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || location method || Device location: {loc}")           
         return loc
 
     @property  # type: ignore
@@ -513,7 +826,8 @@ class SmartDevice:
         """Return WiFi signal strenth (rssi)."""
         rssi = self.sys_info.get("rssi")
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || rssi method || WiFi signal strength (RSSI): {None if rssi is None else int(rssi)}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || rssi method || WiFi signal strength (RSSI): {None if rssi is None else int(rssi)}")
 
         return None if rssi is None else int(rssi)
 
@@ -534,9 +848,11 @@ class SmartDevice:
 
         if ":" not in mac:
             mac = ":".join(format(s, "02x") for s in bytes.fromhex(mac))
-            _LOGGER.info("CustomLog || Kasa || SmartDevice class || mac method || MAC: %s", mac)            
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("CustomLog || Kasa || SmartDevice class || mac method || MAC: %s", mac)            
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || mac method || MAC address: %s", mac)            
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || mac method || MAC address: %s", mac)            
 
         return mac
 
@@ -546,7 +862,8 @@ class SmartDevice:
         :param str mac: mac in hexadecimal with colons, e.g. 01:23:45:67:89:ab
         """
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || set_mac method || Setting MAC: %s", (self._query_helper("system", "set_mac_addr", {"mac": mac})))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || set_mac method || Setting MAC: %s", (self._query_helper("system", "set_mac_addr", {"mac": mac})))
 
         return await self._query_helper("system", "set_mac_addr", {"mac": mac})
 
@@ -556,17 +873,40 @@ class SmartDevice:
         """Return current energy readings."""
         self._verify_emeter()
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || emeter_realtime method || Current energy readings: {EmeterStatus(self.modules['emeter'].realtime)}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || emeter_realtime method || Current energy readings: {EmeterStatus(self.modules['emeter'].realtime)}")
 
-        return EmeterStatus(self.modules["emeter"].realtime)
+        return NormalizedEmeterStatus(self.modules["emeter"].realtime)
 
     async def get_emeter_realtime(self) -> EmeterStatus:
         """Retrieve current energy readings."""
         self._verify_emeter()
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_emeter_realtime method || Get current energy readings: {EmeterStatus(self.modules['emeter'].get_realtime())}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_emeter_realtime method || Get current energy readings: {EmeterStatus(self.modules['emeter'].get_realtime())}")
+
+        return NormalizedEmeterStatus(await self.modules["emeter"].get_realtime())
+
+    def emeter_stream(
+        self, interval: float = 5, maxsize: int = 1
+    ) -> EmeterSubscription:
+        """Return an async iterator yielding realtime readings every interval.
 
-        return EmeterStatus(await self.modules["emeter"].get_realtime())
+        All subscribers with the same interval share one query to the device.
+        Slow consumers get the latest readings instead of an unbounded queue,
+        see :class:`EmeterSubscription` for the lag and drop counters.
+
+        :param interval: seconds between readings
+        :param maxsize: readings buffered for the subscriber before dropping
+        """
+        self._verify_emeter()
+
+        stream = self._emeter_streams.get(interval)
+        if stream is None:
+            stream = self._emeter_streams[interval] = EmeterStream(
+                [self], interval, fleet=False
+            )
+        return stream.subscribe(maxsize)
 
     @property  # type: ignore
     @requires_update
@@ -574,7 +914,8 @@ class SmartDevice:
         """Return today's energy consumption in kWh."""
         self._verify_emeter()
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || emeter_today method || Today's energy consumption: {self.modules['emeter'].emeter_today}kWh")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || emeter_today method || Today's energy consumption: {self.modules['emeter'].emeter_today}kWh")
 
         return self.modules["emeter"].emeter_today
 
@@ -584,28 +925,17 @@ class SmartDevice:
         """Return this month's energy consumption in kWh."""
         self._verify_emeter()
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || emeter_today method || This month's energy consumption: {self.modules['emeter'].emeter_this_month}kWh")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || emeter_today method || This month's energy consumption: {self.modules['emeter'].emeter_this_month}kWh")
 
         return self.modules["emeter"].emeter_this_month
 
     def _emeter_convert_emeter_data(self, data, kwh=True) -> Dict:
         """Return emeter information keyed with the day/month.."""
-        response = [EmeterStatus(**x) for x in data]
+        data = convert_emeter_stats(data, kwh).as_dict()
 
-        if not response:
-            return {}
-
-        energy_key = "energy_wh"
-        if kwh:
-            energy_key = "energy"
-
-        entry_key = "month"
-        if "day" in response[0]:
-            entry_key = "day"
-
-        data = {entry[entry_key]: entry[energy_key] for entry in response}
-
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || _emeter_convert_emeter_data method || Return emeter information: {data}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || _emeter_convert_emeter_data method || Return emeter information: {data}")
 
         return data
 
@@ -622,7 +952,8 @@ class SmartDevice:
         """
         self._verify_emeter()
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || get_emeter_daily method || Daily stats for the month: %s", (self.modules["emeter"].get_daystat(year=year, month=month, kwh=kwh)))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || get_emeter_daily method || Daily stats for the month: %s", (self.modules["emeter"].get_daystat(year=year, month=month, kwh=kwh)))
 
         return await self.modules["emeter"].get_daystat(year=year, month=month, kwh=kwh)
 
@@ -636,7 +967,8 @@ class SmartDevice:
         """
         self._verify_emeter()
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || get_emeter_daily method || Monthly stats for the year: %s", (self.modules["emeter"].get_monthstat(year=year, kwh=kwh)))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || get_emeter_daily method || Monthly stats for the year: %s", (self.modules["emeter"].get_monthstat(year=year, kwh=kwh)))
 
         return await self.modules["emeter"].get_monthstat(year=year, kwh=kwh)
 
@@ -645,7 +977,8 @@ class SmartDevice:
         """Erase energy meter statistics."""
         self._verify_emeter()
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || erase_emeter_stats method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || erase_emeter_stats method")        
 
         return await self.modules["emeter"].erase_stats()
 
@@ -655,7 +988,8 @@ class SmartDevice:
         self._verify_emeter()
         response = self.emeter_realtime
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || current_consumption method || Current power consumption: {float(response['power'])}W")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || current_consumption method || Current power consumption: {float(response['power'])}W")        
 
         return float(response["power"])
 
@@ -666,14 +1000,16 @@ class SmartDevice:
         as the device reboots immediately without responding to the call.
         """
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || reboot method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || reboot method")        
 
         await self._query_helper("system", "reboot", {"delay": delay})
 
     async def turn_off(self, **kwargs) -> Dict:
         """Turn off the device."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || turn_off method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || turn_off method")        
 
         raise NotImplementedError("Device subclass needs to implement this.")
 
@@ -682,14 +1018,16 @@ class SmartDevice:
     def is_off(self) -> bool:
         """Return True if device is off."""
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || is_off method || Is device off? {not self.is_on}")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || is_off method || Is device off? {not self.is_on}")        
 
         return not self.is_on
 
     async def turn_on(self, **kwargs) -> Dict:
         """Turn device on."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || turn_on method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || turn_on method")        
 
         raise NotImplementedError("Device subclass needs to implement this.")
 
@@ -698,7 +1036,8 @@ class SmartDevice:
     def is_on(self) -> bool:
         """Return True if the device is on."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_on method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_on method")        
 
         raise NotImplementedError("Device subclass needs to implement this.")
 
@@ -712,19 +1051,22 @@ class SmartDevice:
         if self.is_off:
             return None
 
-        on_time = self.sys_info["on_time"]
+        if self._on_since_info is not self._sys_info:
+            # not anchored by update(), e.g. sys_info set directly
+            self._anchor_on_since()
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || on_since method || on_time: {on_time}") 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || on_since method || Device on_since: %s", (datetime.now().replace(microsecond=0) - timedelta(seconds=on_time))) 
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || on_since method || Device on_since: %s", self._on_since) 
 
-        return datetime.now().replace(microsecond=0) - timedelta(seconds=on_time)
+        return self._on_since
 
     @property  # type: ignore
     @requires_update
     def state_information(self) -> Dict[str, Any]:
         """Return device-type specific, end-user friendly state information."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || state_information method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || state_information method")        
 
         raise NotImplementedError("Device subclass needs to implement this.")
 
@@ -736,16 +1078,76 @@ class SmartDevice:
         If not overridden, this is the MAC address of the device.
         Individual sockets on strips will override this.
         """
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || device_id method || Device unique ID (MAC): {self.mac}")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || device_id method || Device unique ID (MAC): {self.mac}")        
 
         return self.mac
 
-    async def wifi_scan(self) -> List[WifiNetwork]:  # noqa: D202
-        """Scan for available wifi networks."""
+    async def wifi_scan(
+        self,
+        max_age: Optional[float] = None,
+        background: bool = False,
+        scan_group: Optional[str] = None,
+    ) -> List[WifiNetwork]:
+        """Scan for available wifi networks.
+
+        Scanning blocks the device radio for several seconds, so results are
+        cached and concurrent scans for the same key share a single request.
+
+        :param max_age: maximum age of a cached result in seconds
+                        (default: WIFI_SCAN_TTL, 0 forces a new scan)
+        :param background: return a stale cached result right away while
+                           a new scan runs in the background
+        :param scan_group: cache key to share results between devices
+                           on the same access point (default: the host)
+        :return: list of networks seen by the device
+        """
+        key = scan_group or self.host
+        if max_age is None:
+            max_age = self.WIFI_SCAN_TTL
+
+        cached = SmartDevice._wifi_scans.get(key)
+        if cached is not None:
+            scanned_at, networks = cached
+            if monotonic() - scanned_at <= max_age:
+                return list(networks)
+            if background:
+                self._start_wifi_scan(key)
+                return list(networks)
+
+        networks = await asyncio.shield(self._start_wifi_scan(key))
+        return list(networks)
+
+    def _start_wifi_scan(self, key: str) -> asyncio.Task:
+        """Return the running scan for key, starting one if needed."""
+        task = SmartDevice._wifi_scan_tasks.get(key)
+        if task is not None:
+            return task
+
+        async def _scan_and_store():
+            try:
+                networks = await self._wifi_scan()
+                SmartDevice._wifi_scans[key] = (monotonic(), networks)
+                return networks
+            finally:
+                SmartDevice._wifi_scan_tasks.pop(key, None)
+
+        def _log_failure(task: asyncio.Task):
+            if not task.cancelled() and task.exception() is not None:
+                _LOGGER.debug("Wifi scan failed for %s: %s", key, task.exception())
+
+        task = asyncio.create_task(_scan_and_store())
+        task.add_done_callback(_log_failure)
+        SmartDevice._wifi_scan_tasks[key] = task
+        return task
+
+    async def _wifi_scan(self) -> List[WifiNetwork]:  # noqa: D202
+        """Query the device for available wifi networks."""
 
         async def _scan(target):
 
-            _LOGGER.info("CustomLog || Kasa || SmartDevice class || wifi_scan method >> _scan method || Scan: %s", (self._query_helper(target, "get_scaninfo", {"refresh": 1})))             
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("CustomLog || Kasa || SmartDevice class || wifi_scan method >> _scan method || Scan: %s", (self._query_helper(target, "get_scaninfo", {"refresh": 1})))             
 
             return await self._query_helper(target, "get_scaninfo", {"refresh": 1})
 
@@ -760,7 +1162,8 @@ class SmartDevice:
         if "ap_list" not in info:
             raise SmartDeviceException("Invalid response for wifi scan: %s" % info)
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || wifi_scan method || WifiNetwork: %s", ([WifiNetwork(**x) for x in info["ap_list"]]))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || wifi_scan method || WifiNetwork: %s", ([WifiNetwork(**x) for x in info["ap_list"]]))
 
         return [WifiNetwork(**x) for x in info["ap_list"]]
 
@@ -772,13 +1175,15 @@ class SmartDevice:
 
         async def _join(target, payload):
 
-            _LOGGER.info("CustomLog || Kasa || SmartDevice class || wifi_join method >> _join method || Join: %s", (self._query_helper(target, "set_stainfo", payload)))            
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("CustomLog || Kasa || SmartDevice class || wifi_join method >> _join method || Join: %s", (self._query_helper(target, "set_stainfo", payload)))            
 
             return await self._query_helper(target, "set_stainfo", payload)
 
         payload = {"ssid": ssid, "password": password, "key_type": keytype}
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || wifi_join method || Payload: {payload}") 
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || wifi_join method || Payload: {payload}") 
 
         try:
             return await _join("netif", payload)
@@ -790,31 +1195,46 @@ class SmartDevice:
 
     def get_plug_by_name(self, name: str) -> "SmartDevice":
         """Return child device for the given name."""
-        for p in self.children:
-            if p.alias == name:
+        p = self._child_index()[0].get(name)
+        if p is not None:
+            if _LOGGER.isEnabledFor(logging.INFO):
                 _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_plug_by_name method || Plug child device: {p}")            
-                return p
+            return p
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_plug_by_name method || Plug name: {name}")            
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_plug_by_name method || Plug name: {name}")            
 
         raise SmartDeviceException(f"Device has no child with {name}")
 
+    def get_plug_by_id(self, device_id: str) -> "SmartDevice":
+        """Return child device for the given device id."""
+        try:
+            return self._child_index()[1][device_id]
+        except KeyError:
+            raise SmartDeviceException(f"Device has no child with id {device_id}")
+
     def get_plug_by_index(self, index: int) -> "SmartDevice":
         """Return child device for the given index."""
-        if index + 1 > len(self.children) or index < 0:
+        try:
+            if index < 0:
+                raise IndexError
+            child = self._children[index]
+        except IndexError:
             raise SmartDeviceException(
-                f"Invalid index {index}, device has {len(self.children)} plugs"
+                f"Invalid index {index}, device has {len(self._children)} plugs"
             )
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_plug_by_index method || Child device index: {self.children[index]}")            
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || get_plug_by_index method || Child device index: {child}")            
 
-        return self.children[index]
+        return child
 
     @property
     def device_type(self) -> DeviceType:
         """Return the device type."""
 
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || device_type method || Device type: {self._device_type}")            
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || device_type method || Device type: {self._device_type}")            
 
         return self._device_type
 
@@ -822,7 +1242,8 @@ class SmartDevice:
     def is_bulb(self) -> bool:
         """Return True if the device is a bulb."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_bulb method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_bulb method")
 
         return self._device_type == DeviceType.Bulb
 
@@ -830,7 +1251,8 @@ class SmartDevice:
     def is_light_strip(self) -> bool:
         """Return True if the device is a led strip."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_light_strip method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_light_strip method")
 
         return self._device_type == DeviceType.LightStrip
 
@@ -838,7 +1260,8 @@ class SmartDevice:
     def is_plug(self) -> bool:
         """Return True if the device is a plug."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_plug method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_plug method")
 
         return self._device_type == DeviceType.Plug
 
@@ -846,7 +1269,8 @@ class SmartDevice:
     def is_strip(self) -> bool:
         """Return True if the device is a strip."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_strip method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_strip method")
 
         return self._device_type == DeviceType.Strip
 
@@ -854,7 +1278,8 @@ class SmartDevice:
     def is_strip_socket(self) -> bool:
         """Return True if the device is a strip socket."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_strip_socket method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_strip_socket method")
 
         return self._device_type == DeviceType.StripSocket
 
@@ -862,7 +1287,8 @@ class SmartDevice:
     def is_dimmer(self) -> bool:
         """Return True if the device is a dimmer."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_dimmer method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_dimmer method")
 
         return self._device_type == DeviceType.Dimmer
 
@@ -870,7 +1296,8 @@ class SmartDevice:
     def is_dimmable(self) -> bool:
         """Return  True if the device is dimmable."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_dimmable method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_dimmable method")
 
         return False
 
@@ -878,7 +1305,8 @@ class SmartDevice:
     def is_variable_color_temp(self) -> bool:
         """Return True if the device supports color temperature."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_variable_color_temp method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_variable_color_temp method")        
 
         return False
 
@@ -886,7 +1314,8 @@ class SmartDevice:
     def is_color(self) -> bool:
         """Return True if the device supports color changes."""
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_color method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || is_color method")        
 
         return False
 
@@ -901,10 +1330,12 @@ class SmartDevice:
 
     def __repr__(self):
 
-        _LOGGER.info("CustomLog || Kasa || SmartDevice class || __repr__ method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || Kasa || SmartDevice class || __repr__ method")        
 
         if self._last_update is None:
-            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || __repr__ method || No last update: <{self._device_type} at {self.host} - update needed>")        
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || __repr__ method || No last update: <{self._device_type} at {self.host} - update needed>")        
             return f"<{self._device_type} at {self.host} - update() needed>"
 
         deviceType = self._device_type
@@ -912,6 +1343,7 @@ class SmartDevice:
         deviceOnSince = self.on_since
 
         #write to homeassistant's logfile
-        _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || __repr__ method || Last update: {deviceType} of model {self.model} has IP {self.host}, and alias {self.alias} // is_on? {deviceIsOn} since {deviceOnSince} // device state info: {self.state_information}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || Kasa || SmartDevice class || __repr__ method || Last update: {deviceType} of model {self.model} has IP {self.host}, and alias {self.alias} // is_on? {deviceIsOn} since {deviceOnSince} // device state info: {self.state_information}")
 
         return f"<{self._device_type} model {self.model} at {self.host} ({self.alias}), is_on: {self.is_on} - dev specific: {self.state_information}>"
@@ -0,0 +1,56 @@
+"""Tests for the property change subscriptions of SmartDevice."""
+import copy
+
+from kasa import SmartStrip
+
+SYSINFO = {
+    "sw_ver": "1.0.6 Build 200821 Rel.090909",
+    "hw_ver": "1.0",
+    "model": "HS300(US)",
+    "deviceId": "8006",
+    "alias": "strip",
+    "mic_type": "IOT.SMARTPLUGSWITCH",
+    "feature": "TIM",
+    "mac": "00:00:00:00:00:00",
+    "led_off": 0,
+    "rssi": -50,
+    "children": [
+        {"id": "800600", "state": 0, "alias": "plug 0", "on_time": 0},
+        {"id": "800601", "state": 0, "alias": "plug 1", "on_time": 0},
+    ],
+    "child_num": 2,
+}
+
+
+def _strip(sysinfo):
+    strip = SmartStrip("127.0.0.1")
+    state = {"sysinfo": sysinfo}
+
+    async def _query(request, retry_count=3):
+        return {"system": {"get_sysinfo": copy.deepcopy(state["sysinfo"])}}
+
+    strip.protocol.query = _query
+    return strip, state
+
+
+async def test_strip_socket_subscribers_are_notified():
+    """A socket subscriber is told when the parent update changes it."""
+    strip, state = _strip(copy.deepcopy(SYSINFO))
+    await strip.update()
+    child = strip.children[0]
+    parent_changes = []
+    child_changes = []
+    strip.subscribe(["is_on"], lambda dev, changed: parent_changes.append(changed))
+    child.subscribe(["is_on"], lambda dev, changed: child_changes.append(changed))
+
+    state["sysinfo"]["children"][0]["state"] = 1
+    await strip.update()
+
+    assert child.is_on
+    assert parent_changes == [{"is_on"}]
+    assert child_changes == [{"is_on"}]
+
+    # nothing changed, nothing is reported
+    await strip.update()
+    assert child_changes == [{"is_on"}]
+    assert strip.children[1].is_on is False
@@ -0,0 +1,90 @@
+"""Tests for the command scheduling of Yeelight lights."""
+import asyncio
+from types import SimpleNamespace
+
+from homeassistant.components.yeelight.const import (
+    CONF_MODE_MUSIC,
+    CONF_SAVE_ON_CHANGE,
+    CONF_TRANSITION,
+)
+from homeassistant.components.yeelight.light import (
+    YeelightColorLightWithoutNightlightSwitch,
+)
+from homeassistant.components.yeelight.scheduler import async_get_scheduler
+
+
+class _FakeBulb:
+    """Bulb recording the commands sent to it."""
+
+    music_mode = False
+    model = "color"
+
+    def __init__(self):
+        self.last_properties = {
+            "power": "on",
+            "bright": "80",
+            "ct": "4000",
+            "rgb": "16711680",
+            "hue": "0",
+            "sat": "100",
+            "color_mode": "1",
+        }
+        self.sent = []
+
+    def get_model_specs(self):
+        return {"color_temp": {"min": 1700, "max": 6500}}
+
+    def __getattr__(self, name):
+        if not name.startswith("async_"):
+            raise AttributeError(name)
+
+        async def _async_send(*args, **kwargs):
+            self.sent.append((name, args))
+
+        return _async_send
+
+
+def _make_light(bulb):
+    device = SimpleNamespace(
+        bulb=bulb,
+        available=True,
+        name="bulb",
+        host="192.168.1.10",
+        model="color",
+        fw_version="1",
+        config={
+            CONF_MODE_MUSIC: False,
+            CONF_SAVE_ON_CHANGE: False,
+            CONF_TRANSITION: 350,
+        },
+        is_color_flow_enabled=False,
+        is_nightlight_supported=False,
+        is_nightlight_enabled=False,
+    )
+    entry = SimpleNamespace(unique_id="bulb", entry_id="bulb")
+    light = YeelightColorLightWithoutNightlightSwitch(device, entry)
+    light.hass = SimpleNamespace()
+    light._async_schedule_state_check = lambda expected_power_state: None
+    return light
+
+
+async def test_skipped_commands_do_not_replace_queued_ones():
+    """A turn on without a color keeps the queued color of the previous one."""
+    bulb = _FakeBulb()
+    light = _make_light(bulb)
+    scheduler = async_get_scheduler(bulb, "192.168.1.10")
+    # the burst is used up, the next commands are queued
+    scheduler._tokens = 0.0
+    scheduler.rate = 100.0
+
+    await asyncio.gather(
+        light.async_turn_on(hs_color=(1, 2)),
+        light.async_turn_on(brightness=50),
+    )
+
+    assert bulb.sent == [
+        ("async_set_hsv", (1, 2)),
+        ("async_set_brightness", (50 / 255 * 100,)),
+    ]
+    assert scheduler.coalesced == 0
+    assert scheduler.executed == 2
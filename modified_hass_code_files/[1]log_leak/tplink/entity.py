@@ -7,6 +7,7 @@ from typing import Any, TypeVar
 from kasa import SmartDevice
 from typing_extensions import Concatenate, ParamSpec
 
+from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -27,11 +28,13 @@ def async_refresh_after(
 ) -> Callable[Concatenate[_T, _P], Coroutine[Any, Any, None]]:
     """Define a wrapper to refresh after."""
 
-    _LOGGER.info("CustomLog || TPLink || NA || async_refresh_after method")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("CustomLog || TPLink || NA || async_refresh_after method")
 
     async def _async_wrap(self: _T, *args: _P.args, **kwargs: _P.kwargs) -> None:
 
-        _LOGGER.info("CustomLog || TPLink || NA || async_refresh_after method >> _async_wrap method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || TPLink || NA || async_refresh_after method >> _async_wrap method")
 
         await func(self, *args, **kwargs)
         await self.coordinator.async_request_refresh_without_children()
@@ -42,6 +45,13 @@ def async_refresh_after(
 class CoordinatedTPLinkEntity(CoordinatorEntity[TPLinkDataUpdateCoordinator]):
     """Common base class for all coordinated tplink entities."""
 
+    # Opt-in: device properties rendered by the entity. A subclass that sets
+    # them (e.g. frozenset({"is_on", "alias"}) for a plug switch) only writes
+    # its state after coordinator refreshes that changed one of them. They
+    # must cover every property the subclass renders, the default None
+    # writes the state after every refresh.
+    _tracked_fields: frozenset[str] | None = None
+
     def __init__(
         self, device: SmartDevice, coordinator: TPLinkDataUpdateCoordinator
     ) -> None:
@@ -50,15 +60,47 @@ class CoordinatedTPLinkEntity(CoordinatorEntity[TPLinkDataUpdateCoordinator]):
         self.device: SmartDevice = device
         self._attr_name = self.device.alias
         self._attr_unique_id = self.device.device_id
-
-        _LOGGER.info(f"CustomLog || TPLink || CoordinatedTPLinkEntity class || __init__ method || device: {device} ; name (alias): {self.device.alias} ; device unique_id: {self.device.device_id}")
-
+        self._fields_changed = True
+        self._written_available: bool | None = None
+
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || TPLink || CoordinatedTPLinkEntity class || __init__ method || device: {device} ; name (alias): {self.device.alias} ; device unique_id: {self.device.device_id}")
+
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to changes of the tracked device fields."""
+        await super().async_added_to_hass()
+        if self._tracked_fields is not None:
+            self.async_on_remove(
+                self.device.subscribe(self._tracked_fields, self._async_device_changed)
+            )
+
+    @callback
+    def _async_device_changed(self, device: SmartDevice, changed: set[str]) -> None:
+        """Mark the state dirty, it is written by the coordinator update."""
+        self._fields_changed = True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if a tracked field or availability changed."""
+        available = self.available
+        if (
+            self._tracked_fields is not None
+            and not self._fields_changed
+            and available == self._written_available
+        ):
+            return
+
+        self._fields_changed = False
+        self._written_available = available
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return information about the device."""
 
-        _LOGGER.info(f"CustomLog || TPLink || CoordinatedTPLinkEntity class || device_info method || connections - device mac: {self.device.mac} ; identifiers - DOMAIN: {DOMAIN} // device_id: {str(self.device.device_id)} ; model: {self.device.model} ; manufacturer: TP-Link ; name (alias): {self.device.alias} ; sw_version: {self.device.hw_info['sw_ver']} ; hw_version: {self.device.hw_info['hw_ver']}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || TPLink || CoordinatedTPLinkEntity class || device_info method || connections - device mac: {self.device.mac} ; identifiers - DOMAIN: {DOMAIN} // device_id: {str(self.device.device_id)} ; model: {self.device.model} ; manufacturer: TP-Link ; name (alias): {self.device.alias} ; sw_version: {self.device.hw_info['sw_ver']} ; hw_version: {self.device.hw_info['hw_ver']}")
 
         return DeviceInfo(
             connections={(dr.CONNECTION_NETWORK_MAC, self.device.mac)},
@@ -77,6 +119,7 @@ class CoordinatedTPLinkEntity(CoordinatorEntity[TPLinkDataUpdateCoordinator]):
         switchOn = bool(self.device.is_on)
 
         #write to homeassistant's logfile
-        _LOGGER.info(f"CustomLog || TPLink || CoordinatedTPLinkEntity class || is_on method || is the switch on? {switchOn}")     
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || TPLink || CoordinatedTPLinkEntity class || is_on method || is the switch on? {switchOn}")     
 
         return bool(self.device.is_on)
@@ -0,0 +1,179 @@
+"""Apply a Yeelight service to many bulbs concurrently."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import logging
+from time import monotonic
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, service
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import (
+    DATA_ENTITY_PLATFORM,
+    EntityPlatform,
+)
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 16
+
+EVENT_BULK_SERVICE = f"{DOMAIN}_bulk_service"
+
+# builds the shared payload of a service call: entity method, args, kwargs
+PayloadBuilder = Callable[[ServiceCall], tuple[str, tuple, dict[str, Any]]]
+
+
+@dataclass
+class BulkResult:
+    """Result of a bulk service call for a single entity."""
+
+    entity_id: str
+    duration: float
+    error: Exception | None = None
+
+
+@dataclass
+class BulkCallResult:
+    """Aggregate result of a bulk service call."""
+
+    service: str
+    duration: float = 0.0
+    results: list[BulkResult] = field(default_factory=list)
+
+    @property
+    def failures(self) -> dict[str, str]:
+        """Return the errors by entity id."""
+        return {
+            result.entity_id: str(result.error) or type(result.error).__name__
+            for result in self.results
+            if result.error is not None
+        }
+
+    def as_event_data(self) -> dict[str, Any]:
+        """Return the result as event data."""
+        return {
+            "service": self.service,
+            "entities": len(self.results),
+            "duration": round(self.duration, 3),
+            "max_entity_duration": round(
+                max((result.duration for result in self.results), default=0.0), 3
+            ),
+            "failures": self.failures,
+        }
+
+
+async def async_fan_out(
+    service_name: str,
+    entities: list[Entity],
+    call: Callable[[Entity], Awaitable[Any]],
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+) -> BulkCallResult:
+    """Run call for all entities concurrently, at most max_concurrency at once."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    result = BulkCallResult(service_name)
+
+    async def _async_call(entity: Entity) -> BulkResult:
+        async with semaphore:
+            start = monotonic()
+            try:
+                await call(entity)
+            except Exception as ex:  # pylint: disable=broad-except
+                return BulkResult(entity.entity_id, monotonic() - start, ex)
+            return BulkResult(entity.entity_id, monotonic() - start)
+
+    start = monotonic()
+    result.results = await asyncio.gather(
+        *(_async_call(entity) for entity in entities)
+    )
+    result.duration = monotonic() - start
+    return result
+
+
+@callback
+def _async_platforms(hass: HomeAssistant, domain: str) -> list[EntityPlatform]:
+    """Return the yeelight platforms of an entity domain."""
+    return [
+        platform
+        for platform in hass.data.get(DATA_ENTITY_PLATFORM, {}).get(DOMAIN, [])
+        if platform.domain == domain
+    ]
+
+
+@callback
+def _async_target_entities(hass: HomeAssistant, domain: str, call: ServiceCall):
+    """Return the available entities targeted by a service call."""
+    select_all = call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL
+    if not select_all:
+        referenced = service.async_extract_referenced_entity_ids(hass, call)
+        entity_ids = referenced.referenced | referenced.indirectly_referenced
+    entities = []
+    for platform in _async_platforms(hass, domain):
+        for entity_id, entity in platform.entities.items():
+            if (select_all or entity_id in entity_ids) and entity.available:
+                entities.append(entity)
+    return entities
+
+
+@callback
+def async_register_bulk_service(
+    hass: HomeAssistant,
+    domain: str,
+    name: str,
+    schema: dict,
+    build_payload: PayloadBuilder,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+) -> None:
+    """Register an entity service applied to all targeted bulbs concurrently.
+
+    `domain` is the entity domain of the bulbs (light), the service is
+    registered in the yeelight domain.
+
+    The payload is built once per service call and shared by all entities.
+    The aggregate timing and the per-bulb failures are fired as an
+    EVENT_BULK_SERVICE event, and any failure is raised afterwards.
+    Calls by non-admin users use the regular entity service path, which
+    checks the entity permissions.
+    """
+    schema = cv.make_entity_service_schema(schema)
+
+    async def _async_handle(call: ServiceCall) -> None:
+        method, args, kwargs = build_payload(call)
+
+        # also the entity service function, which gets the call as well
+        async def _async_call(entity: Entity, _: ServiceCall | None = None) -> None:
+            entity.async_set_context(call.context)
+            await getattr(entity, method)(*args, **kwargs)
+
+        if call.context.user_id:
+            user = await hass.auth.async_get_user(call.context.user_id)
+            if user is None or not user.is_admin:
+                await service.entity_service_call(
+                    hass, _async_platforms(hass, domain), _async_call, call
+                )
+                return
+
+        entities = _async_target_entities(hass, domain, call)
+        result = await async_fan_out(name, entities, _async_call, max_concurrency)
+        _LOGGER.debug(
+            "%s on %s bulbs took %.3fs, %s failed",
+            name,
+            len(entities),
+            result.duration,
+            len(result.failures),
+        )
+        hass.bus.async_fire(EVENT_BULK_SERVICE, result.as_event_data())
+        if failures := result.failures:
+            details = ", ".join(f"{key}: {error}" for key, error in failures.items())
+            raise HomeAssistantError(
+                f"{name} failed for {len(failures)} of {len(entities)} bulbs: "
+                f"{details}"
+            )
+
+    hass.services.async_register(DOMAIN, name, _async_handle, schema)
@@ -0,0 +1,109 @@
+"""Coalescing of bursty Yeelight state updates into single state writes."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+# quiet time after an update before the state is written
+DEFAULT_DELAY = 0.05
+# the state is written at the latest this long after the first update
+DEFAULT_MAX_DELAY = 0.25
+
+
+class StateWriteCounters:
+    """Requested and performed state writes of all the debounced entities."""
+
+    __slots__ = ("requested", "written")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.requested = 0
+        self.written = 0
+
+    @property
+    def saved(self) -> int:
+        """Return the number of updates merged into another write."""
+        return self.requested - self.written
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters."""
+        return {
+            "requested": self.requested,
+            "written": self.written,
+            "saved": self.saved,
+        }
+
+
+STATE_WRITES = StateWriteCounters()
+
+
+class StateWriteDebouncer:
+    """Merge the state updates of an entity into one write per burst.
+
+    The write happens once no update arrived for `delay` seconds, but at
+    most `max_delay` seconds after the first update of the burst. A delay of
+    0 writes every update immediately.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        write: Callable[[], None],
+        delay: float = DEFAULT_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ) -> None:
+        """Initialize the debouncer."""
+        self.hass = hass
+        self.delay = delay
+        self.max_delay = max_delay
+        self.counters = StateWriteCounters()
+        self._write = write
+        self._first: float | None = None
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def pending(self) -> bool:
+        """Return True if an update is waiting to be written."""
+        return self._first is not None
+
+    @callback
+    def async_request(self) -> None:
+        """Write the state once the burst is over."""
+        self.counters.requested += 1
+        STATE_WRITES.requested += 1
+        if self.delay <= 0:
+            self._first = self.hass.loop.time()
+            self.async_flush()
+            return
+
+        now = self.hass.loop.time()
+        if self._first is None:
+            self._first = now
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self.hass.loop.call_at(
+            min(now + self.delay, self._first + self.max_delay), self.async_flush
+        )
+
+    @callback
+    def async_flush(self) -> None:
+        """Write a pending state now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._first is None:
+            return
+        self._first = None
+        self.counters.written += 1
+        STATE_WRITES.written += 1
+        self._write()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop a pending state write."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._first = None
@@ -0,0 +1,91 @@
+"""Cached effect flows for Yeelight lights."""
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from yeelight import Flow
+
+
+class CompiledFlow(Flow):
+    """Flow whose start_cf parameters are serialized once.
+
+    The transitions must not be changed after creating the flow.
+    """
+
+    def __init__(self, count=0, action=Flow.actions.recover, transitions=None):
+        """Initialize the flow and serialize its transitions."""
+        super().__init__(count, action, transitions)
+        self._expression = super().expression
+        self._start_flow_params = (
+            self.count * len(self.transitions),
+            self.action.value,
+            self._expression,
+        )
+
+    @classmethod
+    def from_flow(cls, flow: Flow) -> CompiledFlow:
+        """Compile an existing flow."""
+        return cls(flow.count, flow.action, flow.transitions)
+
+    @property
+    def expression(self) -> str:
+        """Return the serialized transitions."""
+        return self._expression
+
+    @property
+    def as_start_flow_params(self) -> tuple[int, int, str]:
+        """Return the start_cf parameters."""
+        return self._start_flow_params
+
+
+class CustomEffects(dict):
+    """Parsed custom effects by name, compiling their flows on first use.
+
+    Shared by all the entities set up with the same effects configuration.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the effects."""
+        super().__init__(*args, **kwargs)
+        self._flows: dict[str, CompiledFlow] = {}
+
+    def flow(self, name: str) -> CompiledFlow:
+        """Return the flow of a custom effect."""
+        if (flow := self._flows.get(name)) is None:
+            flow = self._flows[name] = CompiledFlow(**self[name])
+        return flow
+
+
+class EffectFlowCache:
+    """Build the flow of every effect once.
+
+    Effects picking random colors (e.g. "Random Loop") are rebuilt on every
+    activation, all others are compiled on first use and reused after.
+    """
+
+    def __init__(
+        self,
+        factories: dict[str, Callable[[], Flow]],
+        random_effects: frozenset[str] = frozenset(),
+    ) -> None:
+        """Initialize the cache."""
+        self._factories = factories
+        self._random_effects = random_effects
+        self._flows: dict[str, Flow] = {}
+
+    def __contains__(self, effect: str) -> bool:
+        """Return True if the effect is known."""
+        return effect in self._factories
+
+    def get(self, effect: str) -> Flow:
+        """Return the flow of an effect."""
+        if (flow := self._flows.get(effect)) is not None:
+            return flow
+        flow = self._factories[effect]()
+        if effect not in self._random_effects:
+            flow = self._flows[effect] = CompiledFlow.from_flow(flow)
+        return flow
+
+    def clear(self) -> None:
+        """Drop the compiled flows."""
+        self._flows.clear()
@@ -2,12 +2,23 @@
 from __future__ import annotations
 
 import asyncio
+from functools import partial
+import hashlib
+import json
 import logging
 import math
+from typing import Any, NamedTuple
 
 import voluptuous as vol
 import yeelight
-from yeelight import Flow, RGBTransition, SleepTransition, flows
+from yeelight import (
+    Flow,
+    HSVTransition,
+    RGBTransition,
+    SleepTransition,
+    TemperatureTransition,
+    flows,
+)
 from yeelight.aio import AsyncBulb
 from yeelight.enums import BulbType, LightType, PowerMode, SceneClass
 from yeelight.main import BulbException
@@ -33,9 +44,11 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_platform
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later
 import homeassistant.util.color as color_util
 from homeassistant.util.color import (
     color_temperature_kelvin_to_mired as kelvin_to_mired,
@@ -43,6 +56,7 @@ from homeassistant.util.color import (
 )
 
 from . import YEELIGHT_FLOW_TRANSITION_SCHEMA
+from .bulk import async_register_bulk_service
 from .const import (
     ACTION_RECOVER,
     ATTR_ACTION,
@@ -62,7 +76,17 @@ from .const import (
     MODELS_WITH_DELAYED_ON_TRANSITION,
     POWER_STATE_CHANGE_TIME,
 )
+from .debounce import (
+    DEFAULT_DELAY as DEBOUNCE_DELAY,
+    DEFAULT_MAX_DELAY as DEBOUNCE_MAX_DELAY,
+    StateWriteDebouncer,
+)
+from .effects import CompiledFlow, CustomEffects, EffectFlowCache
 from .entity import YeelightEntity
+from .music import MusicModeManager, async_get_music_manager
+from .scheduler import async_get_scheduler
+from .state_check import StateCheckWheel, async_get_state_check_wheel
+from .validator import LIGHT_VALIDATOR
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -163,6 +187,19 @@ EFFECTS_MAP = {
     EFFECT_CANDLE_FLICKER: flows.candle_flicker,
 }
 
+EFFECT_FLOWS = EffectFlowCache(
+    {
+        **EFFECTS_MAP,
+        EFFECT_FAST_RANDOM_LOOP: lambda: flows.random_loop(duration=250),
+        EFFECT_WHATSAPP: lambda: flows.pulse(37, 211, 102, count=2),
+        EFFECT_FACEBOOK: lambda: flows.pulse(59, 89, 152, count=2),
+        EFFECT_TWITTER: lambda: flows.pulse(0, 172, 237, count=2),
+    },
+    random_effects=frozenset(
+        {EFFECT_RANDOM_LOOP, EFFECT_FAST_RANDOM_LOOP, EFFECT_SLOWDOWN}
+    ),
+)
+
 VALID_BRIGHTNESS = vol.All(vol.Coerce(int), vol.Range(min=1, max=100))
 
 SERVICE_SCHEMA_SET_MODE = {
@@ -206,15 +243,27 @@ SERVICE_SCHEMA_SET_AUTO_DELAY_OFF_SCENE = {
 }
 
 
+# transition classes by name
+_TRANSITION_CLASSES: dict[str, type] = {}
+
+# parsed custom effects of the current configuration, by content hash
+_CUSTOM_EFFECTS_CACHE: dict[str, CustomEffects] = {}
+
+
 @callback
 def _transitions_config_parser(transitions):
     """Parse transitions config into initialized objects."""
     transition_objects = []
     for transition_config in transitions:
-        transition, params = list(transition_config.items())[0]
-        transition_objects.append(getattr(yeelight, transition)(*params))
+        transition, params = next(iter(transition_config.items()))
+        if (transition_class := _TRANSITION_CLASSES.get(transition)) is None:
+            transition_class = _TRANSITION_CLASSES[transition] = getattr(
+                yeelight, transition
+            )
+        transition_objects.append(transition_class(*params))
 
-    _LOGGER.info(f"CustomLog || YeelightComponents || NA || _transitions_config_parser method || transition_objects: {transition_objects}")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(f"CustomLog || YeelightComponents || NA || _transitions_config_parser method || transition_objects: {transition_objects}")
 
     return transition_objects
 
@@ -222,9 +271,16 @@ def _transitions_config_parser(transitions):
 @callback
 def _parse_custom_effects(effects_config):
 
-    _LOGGER.info("CustomLog || YeelightComponents || NA || _parse_custom_effects method")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("CustomLog || YeelightComponents || NA || _parse_custom_effects method")
 
-    effects = {}
+    key = hashlib.sha1(
+        json.dumps(effects_config, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    if (effects := _CUSTOM_EFFECTS_CACHE.get(key)) is not None:
+        return effects
+
+    effects = CustomEffects()
     for config in effects_config:
         params = config[CONF_FLOW_PARAMS]
         action = Flow.actions[params[ATTR_ACTION]]
@@ -236,16 +292,19 @@ def _parse_custom_effects(effects_config):
             ATTR_TRANSITIONS: transitions,
         }
 
+    # a changed configuration replaces the effects of the previous one
+    _CUSTOM_EFFECTS_CACHE.clear()
+    _CUSTOM_EFFECTS_CACHE[key] = effects
     return effects
 
 
 def _async_cmd(func):
     """Define a wrapper to catch exceptions from the bulb."""
 
-    _LOGGER.info("CustomLog || YeelightComponents || NA || _async_cmd method")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("CustomLog || YeelightComponents || NA || _async_cmd method")
 
     async def _async_wrap(self: "YeelightGenericLight", *args, **kwargs):
-
         for attempts in range(2):
             try:
                 _LOGGER.debug("Calling %s with %s %s", func, args, kwargs)
@@ -274,7 +333,35 @@ def _async_cmd(func):
                     f"{self.device.name} at {self.device.host}: {str(ex) or type(ex)}"
                 ) from ex
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || NA || _async_cmd method >> _async_wrap method || _async_wrap: {_async_wrap}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || NA || _async_cmd method >> _async_wrap method || _async_wrap: {_async_wrap}")
+
+    return _async_wrap
+
+
+async def _async_start_music(
+    hass: HomeAssistant, host: str, bulb: AsyncBulb
+) -> None:
+    """Start music mode for the scheduler of a bulb under sustained load."""
+    await async_get_music_manager(hass).async_start(bulb)
+    # the entities of the bulb drop their snapshots and write the new state
+    async_dispatcher_send(hass, DATA_UPDATED.format(host))
+
+
+def _live_properties(func):
+    """Read the bulb properties instead of the snapshot in a command path.
+
+    In music mode the bulb confirms nothing, so the properties may change
+    without a state update refreshing the snapshot.
+    """
+
+    async def _async_wrap(self: "YeelightGenericLight", *args, **kwargs):
+        self._live_reads += 1
+        self._snapshot = None
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            self._live_reads -= 1
 
     return _async_wrap
 
@@ -296,55 +383,69 @@ async def async_setup_entry(
 
     device_type = device.type
 
-    _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method || Integrating device: {device.name}")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method || Integrating device: {device.name}")
 
 
     def _lights_setup_helper(klass):
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || device_type: {device_type}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || device_type: {device_type}")
 
         lights.append(klass(device, config_entry, custom_effects=custom_effects))
 
     if device_type == BulbType.White:
         _lights_setup_helper(YeelightGenericLight)
-        _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.White: {_lights_setup_helper(YeelightGenericLight)}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.White: {_lights_setup_helper(YeelightGenericLight)}")
 
     elif device_type == BulbType.Color:
         if nl_switch_light and device.is_nightlight_supported:
             _lights_setup_helper(YeelightColorLightWithNightlightSwitch)
-            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.Color - YeelightColorLightWithNightlightSwitch: {_lights_setup_helper(YeelightColorLightWithNightlightSwitch)}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.Color - YeelightColorLightWithNightlightSwitch: {_lights_setup_helper(YeelightColorLightWithNightlightSwitch)}")
             _lights_setup_helper(YeelightNightLightModeWithoutBrightnessControl)
-            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.Color - YeelightNightLightModeWithoutBrightnessControl: {_lights_setup_helper(YeelightNightLightModeWithoutBrightnessControl)}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.Color - YeelightNightLightModeWithoutBrightnessControl: {_lights_setup_helper(YeelightNightLightModeWithoutBrightnessControl)}")
         else:
             _lights_setup_helper(YeelightColorLightWithoutNightlightSwitch)
-            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.Color - YeelightColorLightWithoutNightlightSwitch: {_lights_setup_helper(YeelightColorLightWithoutNightlightSwitch)}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.Color - YeelightColorLightWithoutNightlightSwitch: {_lights_setup_helper(YeelightColorLightWithoutNightlightSwitch)}")
 
     elif device_type == BulbType.WhiteTemp:
         if nl_switch_light and device.is_nightlight_supported:
             _lights_setup_helper(YeelightWithNightLight)
-            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTemp - YeelightWithNightLight: {_lights_setup_helper(YeelightWithNightLight)}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTemp - YeelightWithNightLight: {_lights_setup_helper(YeelightWithNightLight)}")
             _lights_setup_helper(YeelightNightLightMode)
-            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTemp - YeelightNightLightMode: {_lights_setup_helper(YeelightNightLightMode)}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTemp - YeelightNightLightMode: {_lights_setup_helper(YeelightNightLightMode)}")
         else:
             _lights_setup_helper(YeelightWhiteTempWithoutNightlightSwitch)
-            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTemp - YeelightWhiteTempWithoutNightlightSwitch: {_lights_setup_helper(YeelightWhiteTempWithoutNightlightSwitch)}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTemp - YeelightWhiteTempWithoutNightlightSwitch: {_lights_setup_helper(YeelightWhiteTempWithoutNightlightSwitch)}")
 
     elif device_type == BulbType.WhiteTempMood:
         if nl_switch_light and device.is_nightlight_supported:
             _lights_setup_helper(YeelightNightLightModeWithAmbientSupport)
-            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTempMood - YeelightNightLightModeWithAmbientSupport: {_lights_setup_helper(YeelightNightLightModeWithAmbientSupport)}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTempMood - YeelightNightLightModeWithAmbientSupport: {_lights_setup_helper(YeelightNightLightModeWithAmbientSupport)}")
             _lights_setup_helper(YeelightWithAmbientAndNightlight)
-            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTempMood - YeelightWithAmbientAndNightlight: {_lights_setup_helper(YeelightWithAmbientAndNightlight)}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTempMood - YeelightWithAmbientAndNightlight: {_lights_setup_helper(YeelightWithAmbientAndNightlight)}")
 
         else:
             _lights_setup_helper(YeelightWithAmbientWithoutNightlight)
-            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTempMood - YeelightWithAmbientWithoutNightlight: {_lights_setup_helper(YeelightWithAmbientWithoutNightlight)}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTempMood - YeelightWithAmbientWithoutNightlight: {_lights_setup_helper(YeelightWithAmbientWithoutNightlight)}")
         _lights_setup_helper(YeelightAmbientLight)
-        _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTempMood - YeelightAmbientLight: {_lights_setup_helper(YeelightAmbientLight)}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || BulbType.WhiteTempMood - YeelightAmbientLight: {_lights_setup_helper(YeelightAmbientLight)}")
 
     else:
         _lights_setup_helper(YeelightGenericLight)
-        _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || Cannot determine device type for {device.host}, {device.name}. Falling back to white only - YeelightGenericLight: {_lights_setup_helper(YeelightGenericLight)}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || NA || async_setup_entry method >> _lights_setup_helper method || Cannot determine device type for {device.host}, {device.name}. Falling back to white only - YeelightGenericLight: {_lights_setup_helper(YeelightGenericLight)}")
         _LOGGER.warning(
             "Cannot determine device type for %s, %s. Falling back to white only",
             device.host,
@@ -359,103 +460,152 @@ async def async_setup_entry(
 def _async_setup_services(hass: HomeAssistant):
     """Set up custom services."""
 
-    _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method")
 
-    async def _async_start_flow(entity, service_call):
+    # payloads are built once per service call and shared by all bulbs
+    @callback
+    def _start_flow_payload(service_call):
 
-        _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_start_flow method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_start_flow method")
 
         params = {**service_call.data}
-        params.pop(ATTR_ENTITY_ID)
+        params.pop(ATTR_ENTITY_ID, None)
         params[ATTR_TRANSITIONS] = _transitions_config_parser(params[ATTR_TRANSITIONS])
-        await entity.async_start_flow(**params)
+        return "async_start_flow", (), params
 
-    async def _async_set_color_scene(entity, service_call):
+    @callback
+    def _set_color_scene_payload(service_call):
 
-        _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_set_color_scene method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_set_color_scene method")
 
-        await entity.async_set_scene(
-            SceneClass.COLOR,
-            *service_call.data[ATTR_RGB_COLOR],
-            service_call.data[ATTR_BRIGHTNESS],
+        return (
+            "async_set_scene",
+            (
+                SceneClass.COLOR,
+                *service_call.data[ATTR_RGB_COLOR],
+                service_call.data[ATTR_BRIGHTNESS],
+            ),
+            {},
         )
 
-    async def _async_set_hsv_scene(entity, service_call):
+    @callback
+    def _set_hsv_scene_payload(service_call):
 
-        _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_set_hsv_scene method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_set_hsv_scene method")
 
-        await entity.async_set_scene(
-            SceneClass.HSV,
-            *service_call.data[ATTR_HS_COLOR],
-            service_call.data[ATTR_BRIGHTNESS],
+        return (
+            "async_set_scene",
+            (
+                SceneClass.HSV,
+                *service_call.data[ATTR_HS_COLOR],
+                service_call.data[ATTR_BRIGHTNESS],
+            ),
+            {},
         )
 
-    async def _async_set_color_temp_scene(entity, service_call):
+    @callback
+    def _set_color_temp_scene_payload(service_call):
 
-        _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_set_color_temp_scene method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_set_color_temp_scene method")
 
-        await entity.async_set_scene(
-            SceneClass.CT,
-            service_call.data[ATTR_KELVIN],
-            service_call.data[ATTR_BRIGHTNESS],
+        return (
+            "async_set_scene",
+            (
+                SceneClass.CT,
+                service_call.data[ATTR_KELVIN],
+                service_call.data[ATTR_BRIGHTNESS],
+            ),
+            {},
         )
 
-    async def _async_set_color_flow_scene(entity, service_call):
-        flow = Flow(
+    @callback
+    def _set_color_flow_scene_payload(service_call):
+        flow = CompiledFlow(
             count=service_call.data[ATTR_COUNT],
             action=Flow.actions[service_call.data[ATTR_ACTION]],
             transitions=_transitions_config_parser(service_call.data[ATTR_TRANSITIONS]),
         )
 
-        _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_set_color_flow_scene method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_set_color_flow_scene method")
 
-        await entity.async_set_scene(SceneClass.CF, flow)
+        return "async_set_scene", (SceneClass.CF, flow), {}
 
-    async def _async_set_auto_delay_off_scene(entity, service_call):
+    @callback
+    def _set_auto_delay_off_scene_payload(service_call):
 
-        _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_set_auto_delay_off_scene method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || NA || _async_setup_services method >> _async_set_auto_delay_off_scene method")
 
-        await entity.async_set_scene(
-            SceneClass.AUTO_DELAY_OFF,
-            service_call.data[ATTR_BRIGHTNESS],
-            service_call.data[ATTR_MINUTES],
+        return (
+            "async_set_scene",
+            (
+                SceneClass.AUTO_DELAY_OFF,
+                service_call.data[ATTR_BRIGHTNESS],
+                service_call.data[ATTR_MINUTES],
+            ),
+            {},
         )
 
-    platform = entity_platform.async_get_current_platform()
-    _LOGGER.info(f"CustomLog || YeelightComponents || NA || _async_setup_services method || Current platform: {platform}")
+    @callback
+    def _set_mode_payload(service_call):
+        return "async_set_mode", (service_call.data[ATTR_MODE],), {}
 
-    platform.async_register_entity_service(
-        SERVICE_SET_MODE, SERVICE_SCHEMA_SET_MODE, "async_set_mode"
-    )
-    platform.async_register_entity_service(
-        SERVICE_START_FLOW, SERVICE_SCHEMA_START_FLOW, _async_start_flow
-    )
-    platform.async_register_entity_service(
-        SERVICE_SET_COLOR_SCENE, SERVICE_SCHEMA_SET_COLOR_SCENE, _async_set_color_scene
-    )
-    platform.async_register_entity_service(
-        SERVICE_SET_HSV_SCENE, SERVICE_SCHEMA_SET_HSV_SCENE, _async_set_hsv_scene
-    )
-    platform.async_register_entity_service(
-        SERVICE_SET_COLOR_TEMP_SCENE,
-        SERVICE_SCHEMA_SET_COLOR_TEMP_SCENE,
-        _async_set_color_temp_scene,
-    )
-    platform.async_register_entity_service(
-        SERVICE_SET_COLOR_FLOW_SCENE,
-        SERVICE_SCHEMA_SET_COLOR_FLOW_SCENE,
-        _async_set_color_flow_scene,
-    )
-    platform.async_register_entity_service(
-        SERVICE_SET_AUTO_DELAY_OFF_SCENE,
-        SERVICE_SCHEMA_SET_AUTO_DELAY_OFF_SCENE,
-        _async_set_auto_delay_off_scene,
-    )
+    platform = entity_platform.async_get_current_platform()
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(f"CustomLog || YeelightComponents || NA || _async_setup_services method || Current platform: {platform}")
+
+    for name, schema, build_payload in (
+        (SERVICE_SET_MODE, SERVICE_SCHEMA_SET_MODE, _set_mode_payload),
+        (SERVICE_START_FLOW, SERVICE_SCHEMA_START_FLOW, _start_flow_payload),
+        (
+            SERVICE_SET_COLOR_SCENE,
+            SERVICE_SCHEMA_SET_COLOR_SCENE,
+            _set_color_scene_payload,
+        ),
+        (SERVICE_SET_HSV_SCENE, SERVICE_SCHEMA_SET_HSV_SCENE, _set_hsv_scene_payload),
+        (
+            SERVICE_SET_COLOR_TEMP_SCENE,
+            SERVICE_SCHEMA_SET_COLOR_TEMP_SCENE,
+            _set_color_temp_scene_payload,
+        ),
+        (
+            SERVICE_SET_COLOR_FLOW_SCENE,
+            SERVICE_SCHEMA_SET_COLOR_FLOW_SCENE,
+            _set_color_flow_scene_payload,
+        ),
+        (
+            SERVICE_SET_AUTO_DELAY_OFF_SCENE,
+            SERVICE_SCHEMA_SET_AUTO_DELAY_OFF_SCENE,
+            _set_auto_delay_off_scene_payload,
+        ),
+    ):
+        async_register_bulk_service(
+            hass, platform.domain, name, schema, build_payload
+        )
     platform.async_register_entity_service(
         SERVICE_SET_MUSIC_MODE, SERVICE_SCHEMA_SET_MUSIC_MODE, "async_set_music_mode"
     )
 
 
+class _LightSnapshot(NamedTuple):
+    """Derived light state, computed once per state update."""
+
+    is_on: bool
+    brightness: int
+    hs_color: tuple[int, int] | None
+    rgb_color: tuple[int, int, int] | None
+    color_temp: int | None
+    color_mode: ColorMode | None
+    effect: str | None
+    extra_state_attributes: dict[str, Any]
+
+
 class YeelightGenericLight(YeelightEntity, LightEntity):
     """Representation of a Yeelight generic light."""
 
@@ -467,12 +617,21 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         | LightEntityFeature.EFFECT
     )
     _attr_should_poll = False
+    # state read by the property getters until the next state update
+    _snapshot: _LightSnapshot | None = None
+    # command paths in progress, which read the bulb properties directly
+    _live_reads = 0
+    # bursts of bulb notifications are merged into one state write
+    _state_write_delay = DEBOUNCE_DELAY
+    _state_write_max_delay = DEBOUNCE_MAX_DELAY
+    _state_writer: StateWriteDebouncer | None = None
 
     def __init__(self, device, entry, custom_effects=None):
         """Initialize the Yeelight light."""
         super().__init__(device, entry)
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || __init__ method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || __init__ method")
 
         self.config = device.config
 
@@ -488,25 +647,66 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         if custom_effects:
             self._custom_effects = custom_effects
         else:
-            self._custom_effects = {}
-
-        self._unexpected_state_check = None
+            self._custom_effects = CustomEffects()
 
     @callback
     def async_state_changed(self):
         """Call when the device changes state."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_state_changed method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_state_changed method")
 
+        # computed again when the state is written
+        self._snapshot = None
         if not self._device.available:
             self._async_cancel_pending_state_check()
+        if (writer := self._state_writer) is None:
+            self._async_write_state()
+            return
+        writer.async_request()
+        if not self._device.available:
+            # unavailability is reported right away
+            writer.async_flush()
+
+    @callback
+    def _async_write_state(self):
+        """Write the state of a burst of updates."""
+        self._async_update_snapshot()
+        if self._device.available:
+            LIGHT_VALIDATOR.check_rgb(self._get_property("rgb"), self.rgb_color)
         self.async_write_ha_state()
 
+    @callback
+    def _async_update_snapshot(self):
+        """Compute the derived state from the latest bulb properties."""
+        self._snapshot = None
+        if not self._device.available or self._live_reads:
+            # the properties of an unavailable bulb may be missing
+            return
+        self._snapshot = _LightSnapshot(
+            self.is_on,
+            self.brightness,
+            self.hs_color,
+            self.rgb_color,
+            self.color_temp,
+            self.color_mode,
+            self.effect,
+            self.extra_state_attributes,
+        )
+
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_added_to_hass method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_added_to_hass method")
 
+        self._state_writer = StateWriteDebouncer(
+            self.hass,
+            self._async_write_state,
+            self._state_write_delay,
+            self._state_write_max_delay,
+        )
+        self.async_on_remove(self._state_writer.async_cancel)
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
@@ -516,21 +716,31 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         )
         await super().async_added_to_hass()
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Keep the music mode connection for the next bulb object."""
+        # the platforms are unloaded before the bulb stops listening
+        self._music.async_park_on_unload(self._bulb)
+        await super().async_will_remove_from_hass()
+
     @property
     def effect_list(self):
         """Return the list of supported effects."""
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || effect_list method || custom_effects = predefined_effects: {self._predefined_effects}  +  custom_effects_names: {self.custom_effects_names}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || effect_list method || custom_effects = predefined_effects: {self._predefined_effects}  +  custom_effects_names: {self.custom_effects_names}")
 
         return self._predefined_effects + self.custom_effects_names
 
     @property
     def color_temp(self) -> int:
         """Return the color temperature."""
+        if self._snapshot is not None:
+            return self._snapshot.color_temp
         if temp_in_k := self._get_property("ct"):
             self._color_temp = kelvin_to_mired(int(temp_in_k))
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || color_temp method || color_temp: {self._color_temp}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || color_temp method || color_temp: {self._color_temp}")
 
         return self._color_temp
 
@@ -538,25 +748,31 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     def name(self) -> str:
         """Return the name of the device if any."""
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || name method || device name: {self.device.name}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || name method || device name: {self.device.name}")
 
         return self.device.name
 
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
+        if self._snapshot is not None:
+            return self._snapshot.is_on
 
         #define variable for the is_on boolean
         bulbOn = self._get_property(self._power_property) == "on"
 
         #write to homeassistant's logfile
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || is_on method || bulb on? {bulbOn}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || is_on method || bulb on? {bulbOn}")
 
         return self._get_property(self._power_property) == "on"
 
     @property
     def brightness(self) -> int:
         """Return the brightness of this light between 1..255."""
+        if self._snapshot is not None:
+            return self._snapshot.brightness
         # Always use "bright" as property name in music mode
         # Since music mode states are only caches in upstream library
         # and the cache key is always "bright" for brightness
@@ -565,7 +781,8 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         )
         brightness = self._get_property(brightness_property) or 0
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || brightness method || brightness: {brightness}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || brightness method || brightness: {brightness}")
 
         return round(255 * (int(brightness) / 100))
 
@@ -573,7 +790,8 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     def min_mireds(self):
         """Return minimum supported color temperature."""
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || min_mireds method || _min_mireds: {self._min_mireds}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || min_mireds method || _min_mireds: {self._min_mireds}")
 
         return self._min_mireds
 
@@ -581,7 +799,8 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     def max_mireds(self):
         """Return maximum supported color temperature."""
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _max_mireds method || _max_mireds: {self._max_mireds}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _max_mireds method || _max_mireds: {self._max_mireds}")
 
         return self._max_mireds
 
@@ -589,7 +808,8 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     def custom_effects(self):
         """Return dict with custom effects."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || custom_effects method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || custom_effects method")
 
         return self._custom_effects
 
@@ -597,7 +817,8 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     def custom_effects_names(self):
         """Return list with custom effects names."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || custom_effects_names method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || custom_effects_names method")
 
         return list(self.custom_effects)
 
@@ -605,25 +826,31 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     def light_type(self):
         """Return light type."""
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || light_type method || light type: {self._light_type}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || light_type method || light type: {self._light_type}")
 
         return self._light_type
 
     @property
     def hs_color(self) -> tuple[int, int] | None:
         """Return the color property."""
+        if self._snapshot is not None:
+            return self._snapshot.hs_color
         hue = self._get_property("hue")
         sat = self._get_property("sat")
         if hue is None or sat is None:
             return None
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || hs_color method ||  Hue: {int(hue)} ; Saturation: {int(sat)}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || hs_color method ||  Hue: {int(hue)} ; Saturation: {int(sat)}")
 
         return (int(hue), int(sat))
 
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Return the color property."""
+        if self._snapshot is not None:
+            return self._snapshot.rgb_color
         if (rgb := self._get_property("rgb")) is None:
             return None
 
@@ -633,7 +860,8 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         red = (rgb >> 16) & 0xFF
 
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || rgb_color method || Red: {red} ; Green: {green} ; Blue: {blue}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || rgb_color method || Red: {red} ; Green: {green} ; Blue: {blue}")
 
 
         return (red, green, blue)
@@ -641,18 +869,47 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     @property
     def effect(self):
         """Return the current effect."""
+        if self._snapshot is not None:
+            return self._snapshot.effect
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || effect method || effect: {self._effect if self.device.is_color_flow_enabled else None}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || effect method || effect: {self._effect if self.device.is_color_flow_enabled else None}")
 
         return self._effect if self.device.is_color_flow_enabled else None
 
     @property
     def _bulb(self) -> AsyncBulb:
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _bulb method || {self.device.bulb}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _bulb method || {self.device.bulb}")
 
         return self.device.bulb
 
+    async def _async_send(self, coalesce_key, method, *args, **kwargs):
+        """Send a command to the bulb once its rate limit allows it.
+
+        Of the queued commands with the same coalesce_key and light type,
+        only the latest one is sent. Call it only for commands that reach
+        the bulb, after the checks that skip them.
+        """
+        scheduler = async_get_scheduler(
+            self._bulb,
+            self.device.host,
+            partial(_async_start_music, self.hass, self.device.host),
+        )
+        key = None if coalesce_key is None else (coalesce_key, self.light_type)
+        return await scheduler.async_run(key, partial(method, *args, **kwargs))
+
+    @property
+    def _music(self) -> MusicModeManager:
+        """Return the music mode manager shared by all bulbs."""
+        return async_get_music_manager(self.hass)
+
+    @property
+    def _state_checks(self) -> StateCheckWheel:
+        """Return the state check wheel shared by all lights."""
+        return async_get_state_check_wheel(self.hass, POWER_STATE_CHANGE_TIME)
+
     @property
     def _properties(self) -> dict:
 
@@ -662,47 +919,55 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         lastProp = (self._bulb.last_properties if self._bulb else {})
 
         #write to homeassistant's logfile
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _properties method || bulb: {bulbProp} ; last_properties: {lastProp}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _properties method || bulb: {bulbProp} ; last_properties: {lastProp}")
 
         return self._bulb.last_properties if self._bulb else {}
 
     def _get_property(self, prop, default=None):
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _get_property method || prop: {prop} ; default: {default} ; properties: {self._properties.get(prop, default)}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _get_property method || prop: {prop} ; default: {default} ; properties: {self._properties.get(prop, default)}")
 
         return self._properties.get(prop, default)
 
     @property
     def _brightness_property(self):
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _brightness_property method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _brightness_property method")
 
         return "bright"
 
     @property
     def _power_property(self):
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _power_property method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _power_property method")
 
         return "power"
 
     @property
     def _turn_on_power_mode(self):
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _turn_on_power_mode method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _turn_on_power_mode method")
 
         return PowerMode.LAST
 
     @property
     def _predefined_effects(self):
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _predefined_effects method || YEELIGHT_MONO_EFFECT_LIST: {YEELIGHT_MONO_EFFECT_LIST}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _predefined_effects method || YEELIGHT_MONO_EFFECT_LIST: {YEELIGHT_MONO_EFFECT_LIST}")
 
         return YEELIGHT_MONO_EFFECT_LIST
 
     @property
     def extra_state_attributes(self):
         """Return the device specific state attributes."""
+        if self._snapshot is not None:
+            return self._snapshot.extra_state_attributes
         attributes = {
             "flowing": self.device.is_color_flow_enabled,
             "music_mode": self._bulb.music_mode,
@@ -712,7 +977,8 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
             attributes["night_light"] = self.device.is_nightlight_enabled
 
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || extra_state_attributes method || attributes: {attributes}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || extra_state_attributes method || attributes: {attributes}")
 
 
         return attributes
@@ -721,21 +987,24 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     def device(self):
         """Return yeelight device."""
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || device method || {self._device}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || device method || {self._device}")
 
         return self._device
 
     async def async_update(self):
         """Update light properties."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_update method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_update method")
 
         await self.device.async_update(True)
 
     async def async_set_music_mode(self, music_mode) -> None:
         """Set the music mode on or off."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_music_mode method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_music_mode method")
 
         try:
             await self._async_set_music_mode(music_mode)
@@ -746,13 +1015,19 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     async def _async_set_music_mode(self, music_mode) -> None:
         """Set the music mode on or off wrapped with _async_cmd."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _async_set_music_mode method wrapped with _async_cmd")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _async_set_music_mode method wrapped with _async_cmd")
 
         bulb = self._bulb
         if music_mode:
-            await bulb.async_start_music()
+            if bulb.music_mode:
+                raise AssertionError(
+                    "Already in music mode, please stop music mode first."
+                )
+            await self._music.async_start(bulb)
         else:
             await bulb.async_stop_music()
+        self._snapshot = None
 
     @_async_cmd
     async def async_set_brightness(self, brightness, duration) -> None:
@@ -764,17 +1039,23 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
             and self._bulb.model not in MODELS_WITH_DELAYED_ON_TRANSITION
         ):
 
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_brightness method || brightness already set to: {brightness}")        
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_brightness method || brightness already set to: {brightness}")        
             _LOGGER.debug("brightness already set to: %s", brightness)
             # Already set, and since we get pushed updates
             # we avoid setting it again to ensure we do not
             # hit the rate limit
             return
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_brightness method || Setting brightness: %s", (round(brightness / 255 * 100)))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_brightness method || Setting brightness: %s", (round(brightness / 255 * 100)))
         _LOGGER.debug("Setting brightness: %s", brightness)
-        await self._bulb.async_set_brightness(
-            brightness / 255 * 100, duration=duration, light_type=self.light_type
+        await self._async_send(
+            "brightness",
+            self._bulb.async_set_brightness,
+            brightness / 255 * 100,
+            duration=duration,
+            light_type=self.light_type,
         )
 
     @_async_cmd
@@ -792,17 +1073,24 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
             and self.hs_color == hs_color
         ):
 
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_hs method || HS already set to: {hs_color}")        
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_hs method || HS already set to: {hs_color}")        
             _LOGGER.debug("HS already set to: %s", hs_color)
             # Already set, and since we get pushed updates
             # we avoid setting it again to ensure we do not
             # hit the rate limit
             return
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_hs method || Setting HS: {hs_color}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_hs method || Setting HS: {hs_color}")
         _LOGGER.debug("Setting HS: %s", hs_color)
-        await self._bulb.async_set_hsv(
-            hs_color[0], hs_color[1], duration=duration, light_type=self.light_type
+        await self._async_send(
+            "color",
+            self._bulb.async_set_hsv,
+            hs_color[0],
+            hs_color[1],
+            duration=duration,
+            light_type=self.light_type,
         )
 
     @_async_cmd
@@ -820,17 +1108,23 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
             and self.rgb_color == rgb
         ):
 
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_rgb method || RGB already set to: {rgb}")        
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_rgb method || RGB already set to: {rgb}")        
             _LOGGER.debug("RGB already set to: %s", rgb)
             # Already set, and since we get pushed updates
             # we avoid setting it again to ensure we do not
             # hit the rate limit
             return
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_rgb method || Setting RGB: {rgb}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_rgb method || Setting RGB: {rgb}")
         _LOGGER.debug("Setting RGB: %s", rgb)
-        await self._bulb.async_set_rgb(
-            *rgb, duration=duration, light_type=self.light_type
+        await self._async_send(
+            "color",
+            self._bulb.async_set_rgb,
+            *rgb,
+            duration=duration,
+            light_type=self.light_type,
         )
 
     @_async_cmd
@@ -850,32 +1144,40 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
             and self.color_temp == colortemp
         ):
             
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_colortemp method || Color temp already set to: {temp_in_k}k")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_colortemp method || Color temp already set to: {temp_in_k}k")
             _LOGGER.debug("Color temp already set to: %s", temp_in_k)
             # Already set, and since we get pushed updates
             # we avoid setting it again to ensure we do not
             # hit the rate limit
             return
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_colortemp method || Setting color temp to: {temp_in_k}k")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_colortemp method || Setting color temp to: {temp_in_k}k")
 
-        await self._bulb.async_set_color_temp(
-            temp_in_k, duration=duration, light_type=self.light_type
+        await self._async_send(
+            "color",
+            self._bulb.async_set_color_temp,
+            temp_in_k,
+            duration=duration,
+            light_type=self.light_type,
         )
 
     @_async_cmd
     async def async_set_default(self) -> None:
         """Set current options as default."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_default method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_default method")
 
-        await self._bulb.async_set_default()
+        await self._async_send(None, self._bulb.async_set_default)
 
     @_async_cmd
     async def async_set_flash(self, flash) -> None:
         """Activate flash."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_flash method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_flash method")
 
         if not flash:
             return
@@ -903,56 +1205,142 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         )
 
         flow = Flow(count=count, transitions=transitions)
-        await self._bulb.async_start_flow(flow, light_type=self.light_type)
+        await self._async_send(
+            None, self._bulb.async_start_flow, flow, light_type=self.light_type
+        )
 
     @_async_cmd
     async def async_set_effect(self, effect) -> None:
         """Activate effect."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_effect method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_effect method")
 
         if not effect:
             return
 
         if effect == EFFECT_STOP:
 
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_effect method || EFFECT_STOP: {self._bulb.async_stop_flow(light_type=self.light_type)}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_effect method || EFFECT_STOP: {self._bulb.async_stop_flow(light_type=self.light_type)}")
 
-            await self._bulb.async_stop_flow(light_type=self.light_type)
+            await self._async_send(
+                None, self._bulb.async_stop_flow, light_type=self.light_type
+            )
             return
 
-        if effect in self.custom_effects_names:
-            flow = Flow(**self.custom_effects[effect])
-        elif effect in EFFECTS_MAP:
-            flow = EFFECTS_MAP[effect]()
-        elif effect == EFFECT_FAST_RANDOM_LOOP:
-            flow = flows.random_loop(duration=250)
-        elif effect == EFFECT_WHATSAPP:
-            flow = flows.pulse(37, 211, 102, count=2)
-        elif effect == EFFECT_FACEBOOK:
-            flow = flows.pulse(59, 89, 152, count=2)
-        elif effect == EFFECT_TWITTER:
-            flow = flows.pulse(0, 172, 237, count=2)
+        if effect in self.custom_effects:
+            flow = self.custom_effects.flow(effect)
+        elif effect in EFFECT_FLOWS:
+            flow = EFFECT_FLOWS.get(effect)
         else:
             return
 
-        await self._bulb.async_start_flow(flow, light_type=self.light_type)
+        await self._async_send(
+            None, self._bulb.async_start_flow, flow, light_type=self.light_type
+        )
         self._effect = effect
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_effect method || Flow effect: {self._effect}")
+        self._snapshot = None
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_effect method || Flow effect: {self._effect}")
+
+
+    def _plan_turn_on_flow(self, brightness, colortemp, hs_color, rgb, duration):
+        """Fold power, color and brightness into a single one-step flow.
 
+        Return None when the sequence of single commands has to be used, or
+        would send fewer than two commands anyway. In music mode the bulb
+        confirms nothing and python-yeelight does not update the cached
+        properties for set_scene, so music mode uses the single commands.
+        """
+        if (
+            self._bulb.music_mode
+            or self.config[CONF_MODE_MUSIC]
+            or self.light_type == LightType.Nightlight
+            or self._turn_on_power_mode != PowerMode.LAST
+            or len([color for color in (colortemp, hs_color, rgb) if color]) > 1
+        ):
+            return None
+
+        commands = 0 if self.is_on else 1
+        color_modes = self.supported_color_modes or set()
+        flow_enabled = self.device.is_color_flow_enabled
+        transition = None
+        if brightness is None:
+            if not (brightness := self.brightness):
+                return None
+        elif math.floor(self.brightness) != math.floor(brightness):
+            commands += 1
+        duration = max(duration, 50)
+        percent = min(100, max(1, round(brightness / 255 * 100)))
+
+        if hs_color:
+            if ColorMode.HS not in color_modes:
+                return None
+            if (
+                flow_enabled
+                or self.color_mode != ColorMode.HS
+                or self.hs_color != hs_color
+            ):
+                commands += 1
+            transition = HSVTransition(
+                hs_color[0], hs_color[1], duration=duration, brightness=percent
+            )
+        elif rgb:
+            if ColorMode.RGB not in color_modes:
+                return None
+            if (
+                flow_enabled
+                or self.color_mode != ColorMode.RGB
+                or self.rgb_color != rgb
+            ):
+                commands += 1
+            transition = RGBTransition(*rgb, duration=duration, brightness=percent)
+        elif colortemp:
+            if ColorMode.COLOR_TEMP not in color_modes:
+                return None
+            if (
+                flow_enabled
+                or self.color_mode != ColorMode.COLOR_TEMP
+                or self.color_temp != colortemp
+            ):
+                commands += 1
+            transition = TemperatureTransition(
+                mired_to_kelvin(colortemp), duration=duration, brightness=percent
+            )
+
+        if transition is None or commands < 2:
+            return None
+        return Flow(count=1, action=Flow.actions.stay, transitions=[transition])
+
+    @_async_cmd
+    async def _async_turn_on_flow(self, flow) -> None:
+        """Turn on the bulb and apply a flow in one command wrapped with _async_cmd."""
+        _LOGGER.debug("Turning on with %s", flow.expression)
+        await self._async_send(
+            None,
+            self._bulb.async_set_scene,
+            SceneClass.CF,
+            flow,
+            light_type=self.light_type,
+        )
 
     @_async_cmd
     async def _async_turn_on(self, duration) -> None:
         """Turn on the bulb for with a transition duration wrapped with _async_cmd."""
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method (wrapped with _async_cmd) || duration: {duration} ; light_type: {self.light_type} ; _turn_on_power_mode: {self._turn_on_power_mode}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method (wrapped with _async_cmd) || duration: {duration} ; light_type: {self.light_type} ; _turn_on_power_mode: {self._turn_on_power_mode}")
 
-        await self._bulb.async_turn_on(
+        await self._async_send(
+            None,
+            self._bulb.async_turn_on,
             duration=duration,
             light_type=self.light_type,
             power_mode=self._turn_on_power_mode,
         )
 
+    @_live_properties
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the bulb on."""
         brightness = kwargs.get(ATTR_BRIGHTNESS)
@@ -965,36 +1353,51 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         duration = int(self.config[CONF_TRANSITION])  # in ms
 
         #write to homeassistant's logfile
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || Bulb has been on for: {duration}ms")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || Bulb has been on for: {duration}ms")
 
         if ATTR_TRANSITION in kwargs:  # passed kwarg overrides config
             duration = int(kwargs[ATTR_TRANSITION] * 1000)  # kwarg in s
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || duration#2: {int(kwargs[ATTR_TRANSITION] * 1000)}s")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || duration#2: {int(kwargs[ATTR_TRANSITION] * 1000)}s")
 
-        if not self.is_on:
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || bulb not on? {not self.is_on} ; and for how long? {self._async_turn_on(duration)}")
+        # power, color and brightness in a single command when possible
+        flow = self._plan_turn_on_flow(brightness, colortemp, hs_color, rgb, duration)
+        if flow is not None:
+            await self._async_turn_on_flow(flow)
+
+        elif not self.is_on:
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || bulb not on? {not self.is_on} ; and for how long? {self._async_turn_on(duration)}")
             await self._async_turn_on(duration)
 
         if self.config[CONF_MODE_MUSIC] and not self._bulb.music_mode:
             await self.async_set_music_mode(True)
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_hs to hs_color: {hs_color} with duration: {duration}")
-        await self.async_set_hs(hs_color, duration)
+        if flow is None:
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_hs to hs_color: {hs_color} with duration: {duration}")
+            await self.async_set_hs(hs_color, duration)
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_rgb to rgb: {rgb} with duration: {duration}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_rgb to rgb: {rgb} with duration: {duration}")
 
-        await self.async_set_rgb(rgb, duration)
+            await self.async_set_rgb(rgb, duration)
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_colortemp to colortemp: {colortemp} with duration: {duration}")
-        await self.async_set_colortemp(colortemp, duration)
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_colortemp to colortemp: {colortemp} with duration: {duration}")
+            await self.async_set_colortemp(colortemp, duration)
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_brightness to brightness: {brightness} with duration: {duration}")
-        await self.async_set_brightness(brightness, duration)
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_brightness to brightness: {brightness} with duration: {duration}")
+            await self.async_set_brightness(brightness, duration)
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_flash to flash: {flash}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_flash to flash: {flash}")
         await self.async_set_flash(flash)
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_effect to effect {effect}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_on method || async_set_effect to effect {effect}")
         await self.async_set_effect(effect)
 
         # save the current state if we had a manual change.
@@ -1007,11 +1410,10 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     def _async_cancel_pending_state_check(self):
         """Cancel a pending state check."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _async_cancel_pending_state_check method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _async_cancel_pending_state_check method")
 
-        if self._unexpected_state_check:
-            self._unexpected_state_check()
-            self._unexpected_state_check = None
+        self._state_checks.async_cancel(self)
 
     @callback
     def _async_schedule_state_check(self, expected_power_state):
@@ -1021,30 +1423,26 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         so we need to force a refresh.
         """
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _async_schedule_state_check method")
-
-        self._async_cancel_pending_state_check()
-
-        async def _async_update_if_state_unexpected(*_):
-
-            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _async_schedule_state_check method >> _async_update_if_state_unexpected method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _async_schedule_state_check method")
 
-            self._unexpected_state_check = None
-            if self.is_on != expected_power_state:
-                await self.device.async_update(True)
-
-        self._unexpected_state_check = async_call_later(
-            self.hass, POWER_STATE_CHANGE_TIME, _async_update_if_state_unexpected
-        )
+        self._state_checks.async_schedule(self, expected_power_state)
 
     @_async_cmd
     async def _async_turn_off(self, duration) -> None:
         """Turn off with a given transition duration wrapped with _async_cmd."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_off method (wrapped with _async_cmd)")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || _async_turn_off method (wrapped with _async_cmd)")
 
-        await self._bulb.async_turn_off(duration=duration, light_type=self.light_type)
+        await self._async_send(
+            None,
+            self._bulb.async_turn_off,
+            duration=duration,
+            light_type=self.light_type,
+        )
 
+    @_live_properties
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off."""
         if not self.is_on:
@@ -1052,11 +1450,13 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
 
         duration = int(self.config[CONF_TRANSITION])  # in ms
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_turn_off method || duration: %s", int(self.config[CONF_TRANSITION]))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_turn_off method || duration: %s", int(self.config[CONF_TRANSITION]))
 
         if ATTR_TRANSITION in kwargs:  # passed kwarg overrides config
             duration = int(kwargs[ATTR_TRANSITION] * 1000)  # kwarg in s
-            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_turn_off method || duration: %s", int(kwargs.get(ATTR_TRANSITION) * 1000))
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_turn_off method || duration: %s", int(kwargs.get(ATTR_TRANSITION) * 1000))
 
 
         await self._async_turn_off(duration)
@@ -1066,9 +1466,12 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
     async def async_set_mode(self, mode: str):
         """Set a power mode."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_mode method || PowerMode: %s", PowerMode[mode.upper()])
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightGenericLight class || async_set_mode method || PowerMode: %s", PowerMode[mode.upper()])
 
-        await self._bulb.async_set_power_mode(PowerMode[mode.upper()])
+        await self._async_send(
+            None, self._bulb.async_set_power_mode, PowerMode[mode.upper()]
+        )
         self._async_schedule_state_check(True)
 
     @_async_cmd
@@ -1076,9 +1479,12 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         """Start flow."""
         flow = Flow(count=count, action=Flow.actions[action], transitions=transitions)
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_start_flow method || Current flow: {flow}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_start_flow method || Current flow: {flow}")
 
-        await self._bulb.async_start_flow(flow, light_type=self.light_type)
+        await self._async_send(
+            None, self._bulb.async_start_flow, flow, light_type=self.light_type
+        )
 
     @_async_cmd
     async def async_set_scene(self, scene_class, *args):
@@ -1088,9 +1494,10 @@ class YeelightGenericLight(YeelightEntity, LightEntity):
         If the light is off, it will first be turned on.
         """
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_scene method || scene_class: {scene_class}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightGenericLight class || async_set_scene method || scene_class: {scene_class}")
 
-        await self._bulb.async_set_scene(scene_class, *args)
+        await self._async_send(None, self._bulb.async_set_scene, scene_class, *args)
 
 
 class YeelightColorLightSupport(YeelightGenericLight):
@@ -1101,17 +1508,23 @@ class YeelightColorLightSupport(YeelightGenericLight):
     @property
     def color_mode(self) -> ColorMode:
         """Return the color mode."""
+        if self._snapshot is not None:
+            return self._snapshot.color_mode
         color_mode = int(self._get_property("color_mode"))
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightColorLightSupport class || color_mode method || color_mode (default): {color_mode}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightColorLightSupport class || color_mode method || color_mode (default): {color_mode}")
 
         if color_mode == 1:  # RGB
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightColorLightSupport class || color_mode method || color_mode RGB? ({color_mode==1}) = {ColorMode.RGB}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightColorLightSupport class || color_mode method || color_mode RGB? ({color_mode==1}) = {ColorMode.RGB}")
             return ColorMode.RGB
         if color_mode == 2:  # color temperature
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightColorLightSupport class || color_mode method || color_mode colortemp? ({color_mode==2}) = {ColorMode.COLOR_TEMP}")            
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightColorLightSupport class || color_mode method || color_mode colortemp? ({color_mode==2}) = {ColorMode.COLOR_TEMP}")            
             return ColorMode.COLOR_TEMP
         if color_mode == 3:  # hsv
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightColorLightSupport class || color_mode method || color_mode HS? ({color_mode==3}) = {ColorMode.HS}")            
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightColorLightSupport class || color_mode method || color_mode HS? ({color_mode==3}) = {ColorMode.HS}")            
             return ColorMode.HS
         _LOGGER.debug("Light reported unknown color mode: %s", color_mode)
         return ColorMode.UNKNOWN
@@ -1119,7 +1532,8 @@ class YeelightColorLightSupport(YeelightGenericLight):
     @property
     def _predefined_effects(self):
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightColorLightSupport class || _predefined_effects method || YEELIGHT_COLOR_EFFECT_LIST: {YEELIGHT_COLOR_EFFECT_LIST}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightColorLightSupport class || _predefined_effects method || YEELIGHT_COLOR_EFFECT_LIST: {YEELIGHT_COLOR_EFFECT_LIST}")
 
         return YEELIGHT_COLOR_EFFECT_LIST
 
@@ -1130,12 +1544,14 @@ class YeelightWhiteTempLightSupport(YeelightGenericLight):
     _attr_color_mode = ColorMode.COLOR_TEMP
     _attr_supported_color_modes = {ColorMode.COLOR_TEMP}
 
-    _LOGGER.info(f"CustomLog || YeelightComponents || YeelightWhiteTempLightSupport class || NA || _attr_color_mode: {_attr_color_mode} ; _attr_supported_color_modes: {_attr_supported_color_modes}")    
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightWhiteTempLightSupport class || NA || _attr_color_mode: {_attr_color_mode} ; _attr_supported_color_modes: {_attr_supported_color_modes}")    
 
     @property
     def _predefined_effects(self):
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightWhiteTempLightSupport || _predefined_effects method || YEELIGHT_TEMP_ONLY_EFFECT_LIST: {YEELIGHT_TEMP_ONLY_EFFECT_LIST}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightWhiteTempLightSupport || _predefined_effects method || YEELIGHT_TEMP_ONLY_EFFECT_LIST: {YEELIGHT_TEMP_ONLY_EFFECT_LIST}")
 
         return YEELIGHT_TEMP_ONLY_EFFECT_LIST
 
@@ -1146,7 +1562,8 @@ class YeelightNightLightSupport:
     @property
     def _turn_on_power_mode(self):
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightSupport || _turn_on_power_mode method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightSupport || _turn_on_power_mode method")
 
         return PowerMode.NORMAL
 
@@ -1160,7 +1577,8 @@ class YeelightWithoutNightlightSwitchMixIn(YeelightGenericLight):
         # want to "current_brightness" since it will check
         # "bg_power" and main light could still be on
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightWithoutNightlightSwitchMixIn class || _brightness_property method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightWithoutNightlightSwitchMixIn class || _brightness_property method")
 
         if self.device.is_nightlight_enabled:
             return "nl_br"
@@ -1169,8 +1587,11 @@ class YeelightWithoutNightlightSwitchMixIn(YeelightGenericLight):
     @property
     def color_temp(self) -> int:
         """Return the color temperature."""
+        if self._snapshot is not None:
+            return self._snapshot.color_temp
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightWithoutNightlightSwitchMixIn class || color_temp method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightWithoutNightlightSwitchMixIn class || color_temp method")
 
         if self.device.is_nightlight_enabled:
             # Enabling the nightlight locks the colortemp to max
@@ -1183,7 +1604,8 @@ class YeelightColorLightWithoutNightlightSwitch(
 ):
     """Representation of a Color Yeelight light."""
 
-    _LOGGER.info("CustomLog || YeelightComponents || YeelightColorLightWithoutNightlightSwitch class || NA")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("CustomLog || YeelightComponents || YeelightColorLightWithoutNightlightSwitch class || NA")
 
 
 class YeelightColorLightWithNightlightSwitch(
@@ -1197,8 +1619,11 @@ class YeelightColorLightWithNightlightSwitch(
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
+        if self._snapshot is not None:
+            return self._snapshot.is_on
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightColorLightWithNightlightSwitch class ||  is_on method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightColorLightWithNightlightSwitch class ||  is_on method")
 
         return super().is_on and not self.device.is_nightlight_enabled
 
@@ -1220,8 +1645,11 @@ class YeelightWithNightLight(
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
+        if self._snapshot is not None:
+            return self._snapshot.is_on
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightWithNightLight class || is_on method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightWithNightLight class || is_on method")
 
         return super().is_on and not self.device.is_nightlight_enabled
 
@@ -1232,7 +1660,8 @@ class YeelightNightLightMode(YeelightGenericLight):
     _attr_color_mode = ColorMode.BRIGHTNESS
     _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
 
-    _LOGGER.info(f"CustomLog || YeelightComponents || YeelightNightLightMode class || NA || _attr_color_mode: {_attr_color_mode} ; _attr_supported_color_modes: {_attr_supported_color_modes}")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightNightLightMode class || NA || _attr_color_mode: {_attr_color_mode} ; _attr_supported_color_modes: {_attr_supported_color_modes}")
 
 
     @property
@@ -1240,7 +1669,8 @@ class YeelightNightLightMode(YeelightGenericLight):
         """Return a unique ID."""
         unique = super().unique_id
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightNightLightMode class || unique_id method || Nightlight unique ID: {unique}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightNightLightMode class || unique_id method || Nightlight unique ID: {unique}")
 
         return f"{unique}-nightlight"
 
@@ -1248,7 +1678,8 @@ class YeelightNightLightMode(YeelightGenericLight):
     def name(self) -> str:
         """Return the name of the device if any."""
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightNightLightMode class || name method || Nightlight device name: {self.device.name}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightNightLightMode class || name method || Nightlight device name: {self.device.name}")
 
         return f"{self.device.name} Nightlight"
 
@@ -1256,29 +1687,35 @@ class YeelightNightLightMode(YeelightGenericLight):
     def icon(self):
         """Return the icon to use in the frontend, if any."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightMode class || icon method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightMode class || icon method")
 
         return "mdi:weather-night"
 
     @property
     def is_on(self) -> bool:
         """Return true if device is on."""
+        if self._snapshot is not None:
+            return self._snapshot.is_on
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightMode class || is_on method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightMode class || is_on method")
 
         return super().is_on and self.device.is_nightlight_enabled
 
     @property
     def _brightness_property(self):
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightMode class || _brightness_property method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightMode class || _brightness_property method")
 
         return "nl_br"
 
     @property
     def _turn_on_power_mode(self):
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightMode class || _turn_on_power_mode method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightMode class || _turn_on_power_mode method")
 
         return PowerMode.MOONLIGHT
 
@@ -1286,7 +1723,8 @@ class YeelightNightLightMode(YeelightGenericLight):
     def supported_features(self):
         """Flag no supported features."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightMode class || supported_features method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightMode class || supported_features method")
 
         return 0
 
@@ -1297,7 +1735,8 @@ class YeelightNightLightModeWithAmbientSupport(YeelightNightLightMode):
     @property
     def _power_property(self):
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightModeWithAmbientSupport class || _power_property method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightNightLightModeWithAmbientSupport class || _power_property method")
 
         return "main_power"
 
@@ -1311,7 +1750,8 @@ class YeelightNightLightModeWithoutBrightnessControl(YeelightNightLightMode):
     _attr_color_mode = ColorMode.ONOFF
     _attr_supported_color_modes = {ColorMode.ONOFF}
 
-    _LOGGER.info(f"CustomLog || YeelightComponents || YeelightNightLightModeWithoutBrightnessControl class || NA || _attr_color_mode: {_attr_color_mode} ; _attr_supported_color_modes: {_attr_supported_color_modes}")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightNightLightModeWithoutBrightnessControl class || NA || _attr_color_mode: {_attr_color_mode} ; _attr_supported_color_modes: {_attr_supported_color_modes}")
 
 
 
@@ -1324,7 +1764,8 @@ class YeelightWithAmbientWithoutNightlight(YeelightWhiteTempWithoutNightlightSwi
     @property
     def _power_property(self):
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightWithAmbientWithoutNightlight class || _power_property method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightWithAmbientWithoutNightlight class || _power_property method")
 
         return "main_power"
 
@@ -1338,7 +1779,8 @@ class YeelightWithAmbientAndNightlight(YeelightWithNightLight):
     @property
     def _power_property(self):
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightWithAmbientAndNightlight class || _power_property method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightWithAmbientAndNightlight class || _power_property method")
 
         return "main_power"
 
@@ -1347,13 +1789,15 @@ class YeelightAmbientLight(YeelightColorLightWithoutNightlightSwitch):
     """Representation of a Yeelight ambient light."""
 
     PROPERTIES_MAPPING = {"color_mode": "bg_lmode"}
-    _LOGGER.info(f"CustomLog || YeelightComponents || YeelightAmbientLight class || NA || PROPERTIES_MAPPING: {PROPERTIES_MAPPING}")
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightAmbientLight class || NA || PROPERTIES_MAPPING: {PROPERTIES_MAPPING}")
 
     def __init__(self, *args, **kwargs):
         """Initialize the Yeelight Ambient light."""
         super().__init__(*args, **kwargs)
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightAmbientLight class || __init__ method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightAmbientLight class || __init__ method")
 
         self._min_mireds = kelvin_to_mired(6500)
         self._max_mireds = kelvin_to_mired(1700)
@@ -1365,7 +1809,8 @@ class YeelightAmbientLight(YeelightColorLightWithoutNightlightSwitch):
         """Return a unique ID."""
         unique = super().unique_id
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightAmbientLight class || name method || Ambilight unique ID: {unique}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightAmbientLight class || name method || Ambilight unique ID: {unique}")
 
         return f"{unique}-ambilight"
 
@@ -1373,20 +1818,23 @@ class YeelightAmbientLight(YeelightColorLightWithoutNightlightSwitch):
     def name(self) -> str:
         """Return the name of the device if any."""
 
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightAmbientLight class || name method || Ambilight device name: {self.device.name}")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightAmbientLight class || name method || Ambilight device name: {self.device.name}")
 
         return f"{self.device.name} Ambilight"
 
     @property
     def _brightness_property(self):
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightAmbientLight class || _brightness_property method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightAmbientLight class || _brightness_property method")
 
         return "bright"
 
     def _get_property(self, prop, default=None):
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightAmbientLight class || _get_property method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightAmbientLight class || _get_property method")
 
         if not (bg_prop := self.PROPERTIES_MAPPING.get(prop)):
             bg_prop = f"bg_{prop}"
@@ -0,0 +1,341 @@
+"""Shared music mode connections for Yeelight bulbs.
+
+In music mode the bulb connects back to Home Assistant and accepts commands
+without rate limit. python-yeelight opens a listening server for every
+start; :class:`MusicModeManager` instead accepts the connections of all
+bulbs on a single port and hands each one to its bulb.
+
+The handover mirrors `AsyncBulb.async_start_music` of python-yeelight 0.7
+and relies on its private connection attributes.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import contextlib
+import logging
+import socket
+from time import monotonic
+from typing import Any
+
+from yeelight.aio import KEY_CONNECTED, AsyncBulb
+from yeelight.main import BulbException
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_MUSIC_MANAGER = "yeelight_music_manager"
+
+# python-yeelight waits as long for the bulb to connect
+CONNECT_TIMEOUT = 5
+# a connection of an unloaded bulb is kept this long for the next bulb object
+PARK_TIMEOUT = 60
+LATENCY_SAMPLES = 100
+
+
+class WriteStats:
+    """Latency from a command being written to it reaching the socket."""
+
+    __slots__ = ("writes", "flushes", "last", "max", "_samples")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.writes = 0
+        self.flushes = 0
+        self.last = 0.0
+        self.max = 0.0
+        self._samples: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def add(self, latency: float) -> None:
+        """Record the latency of a command in seconds."""
+        self.writes += 1
+        self.last = latency
+        self.max = max(self.max, latency)
+        self._samples.append(latency)
+
+    @property
+    def mean(self) -> float:
+        """Return the mean latency of the recent commands."""
+        return sum(self._samples) / len(self._samples) if self._samples else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters."""
+        return {
+            "writes": self.writes,
+            "flushes": self.flushes,
+            "last_latency": self.last,
+            "mean_latency": self.mean,
+            "max_latency": self.max,
+        }
+
+
+class _BatchingWriter:
+    """StreamWriter proxy sending the commands of a loop iteration at once.
+
+    Once `park_on_close` is set by :meth:`MusicModeManager.async_park_on_unload`,
+    closing the writer of a bulb that is still in music mode parks the
+    connection in the manager instead, so the next bulb object of the same
+    host can reuse it. Any other close closes the connection.
+    """
+
+    def __init__(
+        self,
+        manager: MusicModeManager,
+        host: str,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        stats: WriteStats,
+    ) -> None:
+        self._manager = manager
+        self._host = host
+        self._reader = reader
+        self._writer = writer
+        self._stats = stats
+        self._buffer: list[bytes] = []
+        self._queued: list[float] = []
+        self._handle: asyncio.Handle | None = None
+        self.bulb: AsyncBulb | None = None
+        self.park_on_close = False
+
+    def write(self, data: bytes) -> None:
+        """Queue data until the end of the current loop iteration."""
+        self._buffer.append(data)
+        self._queued.append(monotonic())
+        if self._handle is None:
+            self._handle = asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._handle = None
+        if not self._buffer:
+            return
+        self._writer.write(b"".join(self._buffer))
+        now = monotonic()
+        for queued in self._queued:
+            self._stats.add(now - queued)
+        self._stats.flushes += 1
+        self._buffer.clear()
+        self._queued.clear()
+
+    def close(self) -> None:
+        """Send the queued data, then close or park the connection."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._flush()
+        bulb = self.bulb
+        if (
+            self.park_on_close
+            and bulb is not None
+            and bulb.music_mode
+            and not self._writer.is_closing()
+            and not self._reader.at_eof()
+        ):
+            self.bulb = None
+            self._manager.park(self._host, self)
+            return
+        self._writer.close()
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection is closed, parked ones stay open."""
+        if self._writer.is_closing():
+            await self._writer.wait_closed()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._writer, name)
+
+
+class MusicModeManager:
+    """Accept the music mode connections of all bulbs on a single port."""
+
+    def __init__(self, port: int = 0, host: str | None = None) -> None:
+        """Initialize the manager, the server is started on first use."""
+        self.port = port
+        self.host = host
+        self._server: asyncio.AbstractServer | None = None
+        self._server_lock = asyncio.Lock()
+        self._pending: dict[str, asyncio.Future] = {}
+        self._parked: dict[str, tuple[_BatchingWriter, asyncio.TimerHandle]] = {}
+        self.stats: dict[str, WriteStats] = {}
+        self.reused = 0
+
+    async def _async_ensure_server(self) -> None:
+        async with self._server_lock:
+            if self._server is not None:
+                return
+            # the bulbs connect over IPv4, a dual stack server would listen
+            # on a different port per family
+            self._server = await asyncio.start_server(
+                self._on_connect,
+                self.host,
+                self.port,
+                family=socket.AF_INET,
+                reuse_address=True,
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            _LOGGER.debug("Listening for music mode connections on %s", self.port)
+
+    def _on_connect(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        address = writer.get_extra_info("peername")[0]
+        future = self._pending.pop(address, None)
+        if future is None or future.done():
+            _LOGGER.debug("Unexpected music mode connection from %s", address)
+            writer.close()
+            return
+        future.set_result((reader, writer))
+
+    @callback
+    def async_park_on_unload(self, bulb: AsyncBulb) -> None:
+        """Park the music mode connection of the bulb once it stops listening.
+
+        Call it when the bulb object is unloaded, before
+        `async_stop_listening`, so the next bulb object of the same host can
+        reuse the connection.
+        """
+        writer = bulb._async_writer  # pylint: disable=protected-access
+        if isinstance(writer, _BatchingWriter) and writer.bulb is bulb:
+            writer.park_on_close = True
+
+    @callback
+    def park(self, host: str, writer: _BatchingWriter) -> None:
+        """Keep the connection of an unloaded bulb for PARK_TIMEOUT."""
+        self._unpark(host, close=True)
+        handle = asyncio.get_running_loop().call_later(
+            PARK_TIMEOUT, self._unpark, host, True
+        )
+        self._parked[host] = (writer, handle)
+
+    def _unpark(self, host: str, close: bool) -> _BatchingWriter | None:
+        if (parked := self._parked.pop(host, None)) is None:
+            return None
+        writer, handle = parked
+        handle.cancel()
+        # pylint: disable-next=protected-access
+        if close or writer._writer.is_closing() or writer._reader.at_eof():
+            writer._writer.close()  # pylint: disable=protected-access
+            return None
+        return writer
+
+    @staticmethod
+    async def _async_bulb_address(bulb: AsyncBulb, host: str) -> str:
+        """Return the address the bulb connects from, host may be a name."""
+        # pylint: disable-next=protected-access
+        if bulb._async_writer is not None and (
+            peer := bulb._async_writer.get_extra_info("peername")
+        ):
+            return peer[0]
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, None, family=socket.AF_INET, type=socket.SOCK_STREAM
+        )
+        return infos[0][4][0]
+
+    def _local_ip(self, bulb: AsyncBulb) -> str:
+        """Return the address of this host as seen by the bulb."""
+        if self.host:
+            return self.host
+        # pylint: disable=protected-access
+        if bulb._async_writer is not None:
+            return bulb._async_writer.get_extra_info("sockname")[0]
+        return bulb._socket.getsockname()[0]
+
+    async def async_start(self, bulb: AsyncBulb) -> None:
+        """Switch the bulb to music mode over the shared server."""
+        # pylint: disable=protected-access
+        host = bulb._ip
+        async with bulb._music_mode_lock:
+            if bulb._music_mode_state:
+                return
+            bulb._music_mode = True
+            stats = self.stats.setdefault(host, WriteStats())
+            writer = self._unpark(host, close=False)
+            try:
+                if writer is None:
+                    await bulb.async_get_properties()
+                    await self._async_ensure_server()
+                else:
+                    self.reused += 1
+                # hold the lock until the bulb is fully switched
+                async with bulb._async_command_lock:
+                    if writer is None:
+                        writer = await self._async_connect(bulb, host, stats)
+                    else:
+                        await bulb.async_stop_listening(False)
+                    await self._async_attach(bulb, writer)
+            except (asyncio.TimeoutError, OSError) as ex:
+                # ensures a full reconnect to the bulb
+                await bulb.async_stop_music(force=True)
+                raise BulbException(
+                    f"Timed out enabling music mode on the bulb at {host}"
+                ) from ex
+        if bulb._async_callback:
+            bulb._async_callback({KEY_CONNECTED: True})
+        _LOGGER.debug("%s: Music mode started on port %s", bulb, self.port)
+
+    async def _async_connect(
+        self, bulb: AsyncBulb, host: str, stats: WriteStats
+    ) -> _BatchingWriter:
+        """Ask the bulb to connect and wait for its connection."""
+        # the connection comes from the address of a bulb set up by hostname
+        address = await self._async_bulb_address(bulb, host)
+        future = self._pending[address] = asyncio.get_running_loop().create_future()
+        try:
+            await bulb.async_send_command(
+                "set_music", [1, self._local_ip(bulb), self.port]
+            )
+            await bulb.async_stop_listening(False)
+            reader, writer = await asyncio.wait_for(future, CONNECT_TIMEOUT)
+        finally:
+            self._pending.pop(address, None)
+        return _BatchingWriter(self, host, reader, writer, stats)
+
+    @staticmethod
+    async def _async_attach(bulb: AsyncBulb, writer: _BatchingWriter) -> None:
+        """Make the connection the command connection of the bulb.
+
+        Reconnects after a dropped connection go through python-yeelight,
+        with a listening server of its own.
+        """
+        # pylint: disable=protected-access
+        writer.bulb = bulb
+        writer.park_on_close = False
+        bulb._is_listening = True
+        bulb._async_connected(writer, writer._reader)
+        bulb._music_mode_state = True
+        bulb._listen_event = asyncio.Event()
+        bulb._async_listen_task = asyncio.ensure_future(bulb._async_run_listen())
+        await asyncio.wait_for(bulb._listen_event.wait(), CONNECT_TIMEOUT)
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """Return the write latency counters by bulb host."""
+        return {host: stats.as_dict() for host, stats in self.stats.items()}
+
+    async def async_stop(self) -> None:
+        """Close the server and the parked connections."""
+        for host in list(self._parked):
+            self._unpark(host, close=True)
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._server is not None:
+            self._server.close()
+            with contextlib.suppress(OSError):
+                await self._server.wait_closed()
+            self._server = None
+
+
+@callback
+def async_get_music_manager(hass: HomeAssistant) -> MusicModeManager:
+    """Return the manager shared by all config entries.
+
+    It outlives the config entries, so parked connections survive a reload.
+    """
+    if (manager := hass.data.get(DATA_MUSIC_MANAGER)) is None:
+        manager = hass.data[DATA_MUSIC_MANAGER] = MusicModeManager()
+
+        async def _async_stop(event: Event) -> None:
+            await manager.async_stop()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    return manager
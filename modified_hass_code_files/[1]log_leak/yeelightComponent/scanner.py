@@ -40,7 +40,8 @@ class YeelightScanner:
     def async_get(cls, hass: HomeAssistant) -> YeelightScanner:
         """Get scanner instance."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || async_get method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || async_get method")
 
         if cls._scanner is None:
             cls._scanner = cls(hass)
@@ -59,7 +60,8 @@ class YeelightScanner:
     async def async_setup(self) -> None:
         """Set up the scanner."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || async_setup method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || async_setup method")
 
         if self._connected_events:
             await self._async_wait_connected()
@@ -71,7 +73,8 @@ class YeelightScanner:
             def _wrap_async_connected_idx(idx) -> Callable[[], Awaitable[None]]:
                 """Create a function to capture the idx cell variable."""
 
-                _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || async_setup method >> _wrap_async_connected_idx method")                
+                if _LOGGER.isEnabledFor(logging.INFO):
+                    _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || async_setup method >> _wrap_async_connected_idx method")                
 
                 async def _async_connected() -> None:
                     self._connected_events[idx].set()
@@ -117,7 +120,8 @@ class YeelightScanner:
     async def _async_wait_connected(self):
         """Wait for the listeners to be up and connected."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_wait_connected method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_wait_connected method")
 
         await asyncio.gather(*(event.wait() for event in self._connected_events))
 
@@ -127,10 +131,12 @@ class YeelightScanner:
         sources: set[IPv4Address] = set()
         if network.async_only_default_interface_enabled(adapters):
             sources.add(IPv4Address("0.0.0.0"))
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightScanner class || _async_build_source_set method || sources: {sources}")            
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightScanner class || _async_build_source_set method || sources: {sources}")            
             return sources
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_build_source_set method")
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_build_source_set method")
 
 
         return {
@@ -142,7 +148,8 @@ class YeelightScanner:
     async def async_discover(self) -> ValuesView[CaseInsensitiveDict]:
         """Discover bulbs."""
 
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || async_discover method || Yeelight discover with interval %s", DISCOVERY_SEARCH_INTERVAL)
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || async_discover method || Yeelight discover with interval %s", DISCOVERY_SEARCH_INTERVAL)
 
         _LOGGER.debug("Yeelight discover with interval %s", DISCOVERY_SEARCH_INTERVAL)
         await self.async_setup()
@@ -157,7 +164,8 @@ class YeelightScanner:
         _LOGGER.debug("Yeelight scanning")
         for listener in self._listeners:
             listener.async_search()
-            _LOGGER.info(f"CustomLog || YeelightComponents || async_scan method || async_search: {listener.async_search()}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || async_scan method || async_search: {listener.async_search()}")
 
 
     async def async_get_capabilities(self, host: str) -> CaseInsensitiveDict | None:
@@ -171,19 +179,22 @@ class YeelightScanner:
 
         for listener in self._listeners:
             listener.async_search((host, SSDP_TARGET[1]))
-            _LOGGER.info(f"CustomLog || YeelightComponents || async_scan method || async_search: {listener.async_search((host, SSDP_TARGET[1]))}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || async_scan method || async_search: {listener.async_search((host, SSDP_TARGET[1]))}")
 
 
         with contextlib.suppress(asyncio.TimeoutError):
             await asyncio.wait_for(host_event.wait(), timeout=DISCOVERY_TIMEOUT)
 
         self._host_discovered_events[host].remove(host_event)
-        _LOGGER.info(f"CustomLog || YeelightComponents || YeelightScanner class || async_get_capabilities method || host_capabilities: {self._host_capabilities.get(host)}")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightScanner class || async_get_capabilities method || host_capabilities: {self._host_capabilities.get(host)}")        
         return self._host_capabilities.get(host)
 
 
     def _async_discovered_by_ssdp(self, response: CaseInsensitiveDict) -> None:
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_discovered_by_ssdp method")        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_discovered_by_ssdp method")        
         @callback
         def _async_start_flow(*_) -> None:
             asyncio.create_task(
@@ -205,25 +216,30 @@ class YeelightScanner:
 
     async def _async_process_entry(self, headers: CaseInsensitiveDict) -> None:
         """Process a discovery."""
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_process_entry method || Headers discovered via SSDP: %s", headers)        
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_process_entry method || Headers discovered via SSDP: %s", headers)        
         _LOGGER.debug("Discovered via SSDP: %s", headers)    
 
         unique_id = headers["id"]
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_process_entry method || unique_id: %s", unique_id)
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_process_entry method || unique_id: %s", unique_id)
 
         host = urlparse(headers["location"]).hostname        
         assert host
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_process_entry method || host: %s", host)
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_process_entry method || host: %s", host)
 
         current_entry = self._unique_id_capabilities.get(unique_id)
-        _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_process_entry method || current_entry: %s", current_entry)
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("CustomLog || YeelightComponents || YeelightScanner class || _async_process_entry method || current_entry: %s", current_entry)
 
         # Make sure we handle ip changes
         if not current_entry or host != urlparse(current_entry["location"]).hostname:
             _LOGGER.debug("Yeelight discovered with %s", headers)
 
             #write to homeassistant's logfile
-            _LOGGER.info(f"CustomLog || YeelightComponents || YeelightScanner class || _async_process_entry method || Smart bulb rediscovered via SSDP headers: {headers}")
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(f"CustomLog || YeelightComponents || YeelightScanner class || _async_process_entry method || Smart bulb rediscovered via SSDP headers: {headers}")
 
             self._async_discovered_by_ssdp(headers)
 
@@ -0,0 +1,220 @@
+"""Rate limit aware command scheduling for Yeelight bulbs."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+import logging
+from time import monotonic
+from typing import Any
+import weakref
+
+from yeelight.aio import AsyncBulb
+from yeelight.main import BulbException
+
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bulbs accept about 60 commands per minute, burst + 60 * rate stays below
+DEFAULT_RATE = 50 / 60
+DEFAULT_BURST = 10
+DEFAULT_MAXSIZE = 20
+# requests per minute after which music mode is started
+DEFAULT_MUSIC_THRESHOLD = 45
+MUSIC_WINDOW = 60
+
+
+class _Command:
+    """A queued bulb command."""
+
+    __slots__ = ("key", "factory", "future")
+
+    def __init__(
+        self, key: Hashable | None, factory: Callable[[], Awaitable[Any]]
+    ) -> None:
+        self.key = key
+        self.factory = factory
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class BulbCommandScheduler:
+    """Token bucket scheduler for the commands sent to a bulb.
+
+    Commands run immediately while tokens are available, otherwise they are
+    queued. A queued command with a coalescing key (e.g. brightness) is
+    replaced by a newer command with the same key, and every caller gets the
+    result of the latest one. In music mode the bulb has no rate limit, so
+    the bucket is bypassed; music mode is started automatically when the
+    request rate stays above `music_threshold` per minute, by calling
+    `start_music` with the bulb.
+
+    Run only the commands that reach the bulb through it: a skipped command
+    would still take a token, count towards the music mode threshold and
+    replace a queued command with the same key.
+
+    The bulb is only weakly referenced, so the scheduler does not keep an
+    unloaded bulb alive.
+    """
+
+    def __init__(
+        self,
+        bulb: AsyncBulb,
+        host: str,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        maxsize: int = DEFAULT_MAXSIZE,
+        music_threshold: int | None = DEFAULT_MUSIC_THRESHOLD,
+        start_music: Callable[[AsyncBulb], Awaitable[Any]] | None = None,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._bulb = weakref.ref(bulb)
+        self.host = host
+        self._start_music = start_music or AsyncBulb.async_start_music
+        self.rate = rate
+        self.burst = burst
+        self.maxsize = maxsize
+        self.music_threshold = music_threshold
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._queue: deque[_Command] = deque()
+        self._queued: dict[Hashable, _Command] = {}
+        self._requests: deque[float] = deque()
+        self._worker: asyncio.Task | None = None
+        self._music_task: asyncio.Task | None = None
+        self.executed = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of queued commands."""
+        return len(self._queue)
+
+    def metrics(self) -> dict[str, int]:
+        """Return the queue and drop counters."""
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
+
+    @property
+    def _music_mode(self) -> bool:
+        return (bulb := self._bulb()) is not None and bulb.music_mode
+
+    def _take_token(self) -> bool:
+        if self._music_mode:
+            return True
+        now = monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    async def async_run(
+        self, key: Hashable | None, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run a command now, or once the rate limit allows it."""
+        self._track_rate()
+        if not self._queue and self._take_token():
+            self.executed += 1
+            return await factory()
+
+        if key is not None and (command := self._queued.get(key)) is not None:
+            # only the latest value of a queued command is sent
+            command.factory = factory
+            self.coalesced += 1
+            return await asyncio.shield(command.future)
+
+        if len(self._queue) >= self.maxsize:
+            self.dropped += 1
+            raise HomeAssistantError(
+                f"Too many queued commands for bulb at {self.host}"
+            )
+
+        command = _Command(key, factory)
+        self._queue.append(command)
+        if key is not None:
+            self._queued[key] = command
+        self.max_depth = max(self.max_depth, len(self._queue))
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._async_drain())
+        return await asyncio.shield(command.future)
+
+    async def _async_drain(self) -> None:
+        """Send the queued commands as tokens become available."""
+        try:
+            while self._queue:
+                while not self._take_token():
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                command = self._queue.popleft()
+                if command.key is not None:
+                    del self._queued[command.key]
+                self.executed += 1
+                try:
+                    result = await command.factory()
+                except Exception as ex:  # pylint: disable=broad-except
+                    command.future.set_exception(ex)
+                else:
+                    command.future.set_result(result)
+        finally:
+            self._worker = None
+
+    def _track_rate(self) -> None:
+        """Start music mode when the request rate stays high."""
+        if self.music_threshold is None or self._music_mode:
+            return
+        now = monotonic()
+        requests = self._requests
+        requests.append(now)
+        while requests[0] < now - MUSIC_WINDOW:
+            requests.popleft()
+        if len(requests) > self.music_threshold and self._music_task is None:
+            self._music_task = asyncio.create_task(self._async_start_music())
+
+    async def _async_start_music(self) -> None:
+        _LOGGER.debug(
+            "Starting music mode for bulb at %s after %s requests per minute",
+            self.host,
+            len(self._requests),
+        )
+        try:
+            if (bulb := self._bulb()) is None:
+                return
+            await self._start_music(bulb)
+        except (AssertionError, BulbException, OSError) as ex:
+            _LOGGER.debug("Unable to start music mode, not retrying: %s", ex)
+            self.music_threshold = None
+        else:
+            self._requests.clear()
+        finally:
+            self._music_task = None
+
+
+_SCHEDULERS: weakref.WeakKeyDictionary[
+    AsyncBulb, BulbCommandScheduler
+] = weakref.WeakKeyDictionary()
+
+
+def async_get_scheduler(
+    bulb: AsyncBulb,
+    host: str,
+    start_music: Callable[[AsyncBulb], Awaitable[Any]] | None = None,
+) -> BulbCommandScheduler:
+    """Return the scheduler shared by all the entities of a bulb.
+
+    start_music must not reference the bulb, the scheduler is dropped with it.
+    """
+    if (scheduler := _SCHEDULERS.get(bulb)) is None:
+        scheduler = _SCHEDULERS[bulb] = BulbCommandScheduler(
+            bulb, host, start_music=start_music
+        )
+    return scheduler
@@ -0,0 +1,161 @@
+"""Batched checks for Yeelight state changes that were not pushed back."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from typing import Protocol
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_CHECKS = "yeelight_state_checks"
+
+DEFAULT_TICK = 0.25
+DEFAULT_CONCURRENCY = 8
+
+
+class _CheckedLight(Protocol):
+    """The part of a light entity used by the checks."""
+
+    device: object
+    is_on: bool
+
+
+class StateCheckWheel:
+    """Coarse timer wheel shared by the state checks of all lights.
+
+    A check is due `delay` seconds after it was scheduled, rounded up to the
+    next tick, so all the checks of a scene fall into the same slot and a
+    single timer serves them. When a slot expires, each device with a light
+    whose power state is still not the expected one is refreshed once, at
+    most `max_concurrency` at a time.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        delay: float,
+        tick: float = DEFAULT_TICK,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        """Initialize the wheel."""
+        self.hass = hass
+        self.delay = delay
+        self.tick = tick
+        self.max_concurrency = max_concurrency
+        self._slots: dict[int, dict[_CheckedLight, bool]] = {}
+        self._entries: dict[_CheckedLight, int] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_slot: int | None = None
+        self.scheduled = 0
+        self.checked = 0
+        self.refreshed = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of pending checks."""
+        return len(self._entries)
+
+    def metrics(self) -> dict[str, int]:
+        """Return the check counters."""
+        return {
+            "pending": self.pending,
+            "scheduled": self.scheduled,
+            "checked": self.checked,
+            "refreshed": self.refreshed,
+        }
+
+    @callback
+    def async_schedule(
+        self, light: _CheckedLight, expected_power_state: bool
+    ) -> None:
+        """Check the power state of the light after the delay.
+
+        A pending check of the light is replaced.
+        """
+        self.async_cancel(light)
+        slot = math.ceil((self.hass.loop.time() + self.delay) / self.tick)
+        self._slots.setdefault(slot, {})[light] = expected_power_state
+        self._entries[light] = slot
+        self.scheduled += 1
+        if self._timer_slot is None or slot < self._timer_slot:
+            self._arm(slot)
+
+    @callback
+    def async_cancel(self, light: _CheckedLight) -> None:
+        """Cancel the pending check of the light."""
+        if (slot := self._entries.pop(light, None)) is None:
+            return
+        checks = self._slots[slot]
+        del checks[light]
+        if not checks:
+            del self._slots[slot]
+
+    def _arm(self, slot: int) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_slot = slot
+        self._timer = self.hass.loop.call_at(slot * self.tick, self._async_expire)
+
+    @callback
+    def _async_expire(self) -> None:
+        """Run the checks of the expired slots and wait for the next one."""
+        expired = self._timer_slot
+        self._timer = self._timer_slot = None
+        due: dict[object, _CheckedLight] = {}
+        for slot in sorted(self._slots):
+            if slot > expired:
+                self._arm(slot)
+                break
+            for light, expected_power_state in self._slots.pop(slot).items():
+                del self._entries[light]
+                self.checked += 1
+                if light.is_on != expected_power_state:
+                    # lights of the same bulb share a single refresh
+                    due.setdefault(light.device, light)
+        if due:
+            self.hass.async_create_task(self._async_refresh(list(due)))
+
+    async def _async_refresh(self, devices: list) -> None:
+        """Refresh the devices, at most max_concurrency at once."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _async_update(device) -> None:
+            async with semaphore:
+                await device.async_update(True)
+
+        self.refreshed += len(devices)
+        results = await asyncio.gather(
+            *(_async_update(device) for device in devices), return_exceptions=True
+        )
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                _LOGGER.debug("Unable to refresh %s: %s", device, result)
+
+    @callback
+    def async_stop(self) -> None:
+        """Drop the pending checks."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._timer_slot = None
+        self._slots.clear()
+        self._entries.clear()
+
+
+@callback
+def async_get_state_check_wheel(
+    hass: HomeAssistant, delay: float
+) -> StateCheckWheel:
+    """Return the wheel shared by all Yeelight lights."""
+    if (wheel := hass.data.get(DATA_STATE_CHECKS)) is None:
+        wheel = hass.data[DATA_STATE_CHECKS] = StateCheckWheel(hass, delay)
+
+        @callback
+        def _async_stop(event: Event) -> None:
+            wheel.async_stop()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    return wheel
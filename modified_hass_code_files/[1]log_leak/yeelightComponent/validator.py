@@ -0,0 +1,47 @@
+"""Plausibility checks for Yeelight light states."""
+from __future__ import annotations
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LightValidator:
+    """Check that the derived light attributes match the raw bulb properties.
+
+    Only counters are kept, so the check can stay enabled on every state
+    update.
+    """
+
+    __slots__ = ("samples", "rgb_mismatch")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.samples = 0
+        self.rgb_mismatch = 0
+
+    def check_rgb(self, raw_rgb, rgb_color: tuple[int, int, int] | None) -> bool:
+        """Check rgb_color against the raw packed "rgb" property."""
+        self.samples += 1
+        if raw_rgb is None:
+            if rgb_color is None:
+                return True
+        elif rgb_color is not None:
+            raw_rgb = int(raw_rgb)
+            if (
+                rgb_color[0] == (raw_rgb >> 16) & 0xFF
+                and rgb_color[1] == (raw_rgb >> 8) & 0xFF
+                and rgb_color[2] == raw_rgb & 0xFF
+            ):
+                return True
+
+        self.rgb_mismatch += 1
+        return False
+
+    @property
+    def violations(self) -> dict[str, int]:
+        """Return the violation counters."""
+        return {"rgb_mismatch": self.rgb_mismatch}
+
+
+LIGHT_VALIDATOR = LightValidator()